@@ -7,6 +7,9 @@ centralizing all template rendering logic in one place.
 from __future__ import annotations
 
 import textwrap
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
 from functools import lru_cache
 from typing import Any
 
@@ -114,6 +117,40 @@ def _get_cached_env(
     return _new_env(autoescape, variable_start_string, variable_end_string)
 
 
+_env_pool: dict[tuple[bool, str, str], list[Environment]] = {}
+"""Environments not in use, by ``(autoescape, variable_start_string, variable_end_string)``."""
+
+
+@contextmanager
+def _pooled_env(
+    autoescape: bool,
+    variable_start_string: str = "{{",
+    variable_end_string: str = "}}",
+) -> Iterator[Environment]:
+    """Borrow an Environment, that no other render uses until it is returned.
+
+    Nested renders (e.g. needuml's ``{{ uml() }}`` callbacks) each borrow their own
+    Environment, so the pool grows to the deepest nesting, and the Environments are
+    then re-used, instead of creating (and setting up) a new one for each render.
+
+    :param autoescape: Whether to enable autoescaping.
+    :param variable_start_string: Delimiter that opens a variable expression.
+    :param variable_end_string: Delimiter that closes a variable expression.
+    """
+    pool = _env_pool.setdefault(
+        (autoescape, variable_start_string, variable_end_string), []
+    )
+    env = (
+        pool.pop()
+        if pool
+        else _new_env(autoescape, variable_start_string, variable_end_string)
+    )
+    try:
+        yield env
+    finally:
+        pool.append(env)
+
+
 def render_template_string(
     template_string: str,
     context: dict[str, Any],
@@ -128,8 +165,8 @@ def render_template_string(
     :param template_string: The Jinja template string to render.
     :param context: Dictionary containing template variables.
     :param autoescape: Whether to enable autoescaping.
-    :param new_env: If True, create a fresh Environment instead of using
-        the shared cached one.  This is required when rendering happens
+    :param new_env: If True, use an Environment not in use by any ongoing render,
+        instead of the shared cached one.  This is required when rendering happens
         *inside* a Python callback invoked by an ongoing ``render_str`` on
         the cached Environment (e.g. needuml's ``{{ uml() }}`` callbacks),
         because MiniJinja's ``Environment`` holds a non-reentrant lock
@@ -140,11 +177,10 @@ def render_template_string(
         (default ``"}}"``).
     :return: The rendered template as a string.
     """
-    env = (
-        _new_env(autoescape, variable_start_string, variable_end_string)
-        if new_env
-        else _get_cached_env(autoescape, variable_start_string, variable_end_string)
-    )
+    if new_env:
+        with _pooled_env(autoescape, variable_start_string, variable_end_string) as env:
+            return env.render_str(template_string, **context)
+    env = _get_cached_env(autoescape, variable_start_string, variable_end_string)
     return env.render_str(template_string, **context)
 
 
@@ -178,7 +214,95 @@ class CompiledTemplate:
         return self._env.render_template(self._TEMPLATE_NAME, **context)
 
 
-@lru_cache(maxsize=32)
+class TemplateRegistry:
+    """A size-bounded registry of compiled templates, evicting the least recently used.
+
+    Templates are keyed by their source and compile options,
+    so that all call sites sharing a template (e.g. ``needs_role_need_template``)
+    only compile it once.
+
+    The registry persists for the lifetime of the process (e.g. across
+    rebuilds in ``sphinx-autobuild``).  This is safe because compiled templates
+    are keyed by their source text and are stateless.
+    Its counters are reset with :meth:`reset_stats`, at the start of each build.
+    """
+
+    __slots__ = ("_templates", "capacity", "evictions", "hits", "misses")
+
+    def __init__(self, capacity: int = 256) -> None:
+        self._templates: OrderedDict[tuple[str, bool, str, str], CompiledTemplate] = (
+            OrderedDict()
+        )
+        self.capacity = capacity
+        """The maximum number of templates to keep."""
+        self.hits = 0
+        """The number of look-ups, that found a compiled template."""
+        self.misses = 0
+        """The number of look-ups, that compiled a template."""
+        self.evictions = 0
+        """The number of templates dropped, to stay within the capacity."""
+
+    def __len__(self) -> int:
+        return len(self._templates)
+
+    def get(
+        self,
+        template_string: str,
+        autoescape: bool,
+        variable_start_string: str = "{{",
+        variable_end_string: str = "}}",
+    ) -> CompiledTemplate:
+        """Get the compiled template, compiling it if it is not registered.
+
+        :raises minijinja.TemplateError: If the template is invalid,
+            in which case it is not registered.
+        """
+        key = (template_string, autoescape, variable_start_string, variable_end_string)
+        if (template := self._templates.get(key)) is not None:
+            self.hits += 1
+            self._templates.move_to_end(key)
+            return template
+        self.misses += 1
+        env = _new_env(autoescape, variable_start_string, variable_end_string)
+        env.add_template(CompiledTemplate._TEMPLATE_NAME, template_string)
+        template = CompiledTemplate(env)
+        self._templates[key] = template
+        self._evict()
+        return template
+
+    def resize(self, capacity: int) -> None:
+        """Change the capacity, evicting the least recently used templates, if it shrinks."""
+        self.capacity = capacity
+        self._evict()
+
+    def clear(self) -> None:
+        """Drop all templates and reset the counters."""
+        self._templates.clear()
+        self.reset_stats()
+
+    def reset_stats(self) -> None:
+        self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict[str, int]:
+        """The counters and size of the registry, e.g. for the debug measurement report."""
+        return {
+            "capacity": self.capacity,
+            "size": len(self._templates),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def _evict(self) -> None:
+        while len(self._templates) > max(self.capacity, 0):
+            self._templates.popitem(last=False)
+            self.evictions += 1
+
+
+template_registry = TemplateRegistry()
+"""The registry used by :func:`compile_template`."""
+
+
 def compile_template(
     template_string: str,
     *,
@@ -193,13 +317,11 @@ def compile_template(
     Use this instead of :func:`render_template_string` when the same
     template is rendered in a tight loop with varying contexts.
 
-    Results are cached by ``(template_string, autoescape)`` so that
+    Results are kept in the :data:`template_registry`,
+    keyed by the template string and compile options, so that
     multiple call sites sharing the same template (e.g.
     ``needs_config.diagram_template``) only compile once per build.
-
-    The cache persists for the lifetime of the process.  This is safe
-    because compiled templates are keyed by their source text and are
-    stateless.
+    Its capacity is set by ``needs_template_cache_size``.
 
     :param template_string: The Jinja template string to compile.
     :param autoescape: Whether to enable autoescaping.
@@ -210,6 +332,6 @@ def compile_template(
         (default ``"}}"``).
     :return: A compiled template that can be rendered with different contexts.
     """
-    env = _new_env(autoescape, variable_start_string, variable_end_string)
-    env.add_template(CompiledTemplate._TEMPLATE_NAME, template_string)
-    return CompiledTemplate(env)
+    return template_registry.get(
+        template_string, autoescape, variable_start_string, variable_end_string
+    )
@@ -7,6 +7,7 @@ from docutils import nodes
 from sphinx.application import Sphinx
 from sphinx.builders import Builder
 
+from sphinx_needs import telemetry
 from sphinx_needs.config import NeedsSphinxConfig
 from sphinx_needs.data import SphinxNeedsData
 from sphinx_needs.logging import get_logger
@@ -113,6 +114,7 @@ class NeedsBuilder(Builder):
         pass
 
 
+@telemetry.record_phase("needs_json")
 def build_needs_json(app: Sphinx, _exception: Exception) -> None:
     env = app.env
 
@@ -186,6 +188,7 @@ class NeedsIdBuilder(Builder):
         LOGGER.info("Needs_id successfully exported")
 
 
+@telemetry.record_phase("needs_id_json")
 def build_needs_id_json(app: Sphinx, _exception: Exception) -> None:
     env = app.env
 
@@ -245,6 +248,7 @@ class NeedumlsBuilder(Builder):
         return ""
 
 
+@telemetry.record_phase("needumls_pumls")
 def build_needumls_pumls(app: Sphinx, _exception: Exception) -> None:
     env = app.env
     config = NeedsSphinxConfig(env.config)
@@ -439,22 +439,34 @@ class NeedsSphinxConfig:
     # Note also that we treat `functions` and `warnings` as special-cases,
     # since these configurations can also be added to dynamically via the API
 
+    # The names of the config values are looked up in _CONFIG_NAMES,
+    # rather than derived from the attribute name on each access,
+    # since the configuration is read very often, e.g. for every need and table cell.
+
     def __init__(self, config: _SphinxConfig) -> None:
-        super().__setattr__("_config", config)
+        object.__setattr__(self, "_config", config)
 
     def __getattribute__(self, name: str) -> Any:
-        if name.startswith("__") or name in ("_config", "functions", "warnings"):
-            return super().__getattribute__(name)
+        config_name = _CONFIG_NAMES.get(name)
+        if config_name is None:
+            return object.__getattribute__(self, name)
+        return getattr(object.__getattribute__(self, "_config"), config_name)
+
+    def __getattr__(self, name: str) -> Any:
+        # config values that are not fields, e.g. added by other extensions
+        if name.startswith("__") or name == "_config":
+            raise AttributeError(name)
         if name.startswith("_"):
             name = name[1:]
-        return getattr(super().__getattribute__("_config"), f"needs_{name}")
+        return getattr(object.__getattribute__(self, "_config"), f"needs_{name}")
 
     def __setattr__(self, name: str, value: Any) -> None:
         if name.startswith("__") or name in ("_config", "functions", "warnings"):
-            return super().__setattr__(name, value)
-        if name.startswith("_"):
-            name = name[1:]
-        return setattr(super().__getattribute__("_config"), f"needs_{name}", value)
+            return object.__setattr__(self, name, value)
+        config_name = _CONFIG_NAMES.get(name)
+        if config_name is None:
+            config_name = f"needs_{name[1:] if name.startswith('_') else name}"
+        return setattr(object.__getattribute__(self, "_config"), config_name, value)
 
     @classmethod
     def add_config_values(cls, app: Sphinx) -> None:
@@ -527,6 +539,11 @@ class NeedsSphinxConfig:
         metadata={"rebuild": "env", "types": (bool,)},
     )
     """Enable schema validation for needs."""
+    schema_validation_workers: int = field(
+        default=1,
+        metadata={"rebuild": "html", "types": (int,)},
+    )
+    """The number of processes to validate the needs in, ``0`` for one per CPU."""
     schema_definitions: SchemasFileRootType = field(
         default_factory=lambda: cast(SchemasFileRootType, {}),
         metadata={"rebuild": "env", "types": (dict,)},
@@ -803,6 +820,11 @@ class NeedsSphinxConfig:
         default=None, metadata={"rebuild": "html", "types": (type(None), int, float)}
     )
     """Warn if process_filter runs for longer than this time (in seconds)."""
+    filter_workers: int = field(
+        default=1, metadata={"rebuild": "html", "types": (int,)}
+    )
+    """The number of processes to evaluate the filters of view directives in,
+    before the documents are written, ``0`` for one per CPU."""
     views_max_items: int = field(
         default=0, metadata={"rebuild": "html", "types": (int,)}
     )
@@ -1046,7 +1068,51 @@ class NeedsSphinxConfig:
         default=False, metadata={"rebuild": "html", "types": (bool,)}
     )
     """If True, log runtime information for various functions."""
+    debug_measurement_mode: str = field(
+        default="detailed", metadata={"rebuild": "html", "types": (str,)}
+    )
+    """How :ref:`needs_debug_measurement` measures functions: ``detailed`` or ``fast``."""
+    debug_sampling_interval: float = field(
+        default=0.0, metadata={"rebuild": "html", "types": (int, float)}
+    )
+    """If above 0, and :ref:`needs_debug_measurement` is enabled,
+    sample the stack of post-processing and of the write phase at this interval, in seconds."""
     debug_filters: bool = field(
         default=False, metadata={"rebuild": "html", "types": (bool,)}
     )
     """If True, log filter processing runtime information."""
+    incremental_post_process: bool = field(
+        default=False, metadata={"rebuild": "html", "types": (bool,)}
+    )
+    """If True, re-use the post-processing results of unchanged needs from the previous build."""
+    diagram_cache: bool = field(
+        default=False, metadata={"rebuild": "html", "types": (bool,)}
+    )
+    """If True, re-use the generated source of diagrams from the previous build,
+    if the needs and configuration did not change."""
+    template_cache_size: int = field(
+        default=256, metadata={"rebuild": "html", "types": (int,)}
+    )
+    """The maximum number of compiled Jinja templates to keep for re-use."""
+    telemetry: bool = field(
+        default=False, metadata={"rebuild": "html", "types": (bool,)}
+    )
+    """If True, write the time, memory and items of each build phase to ``needs_telemetry.json``."""
+    telemetry_tracemalloc: bool = field(
+        default=False, metadata={"rebuild": "html", "types": (bool,)}
+    )
+    """If True, also trace the peak of the memory allocated by Python in each build phase."""
+
+
+_CONFIG_NAMES: dict[str, str] = {}
+"""The Sphinx config value of each :class:`NeedsSphinxConfig` attribute.
+
+Both ``name`` and ``_name`` refer to ``needs_name``,
+except for the ``functions`` and ``warnings`` properties.
+"""
+for _field in fields(NeedsSphinxConfig):
+    _name = _field.name[1:] if _field.name.startswith("_") else _field.name
+    _CONFIG_NAMES["_" + _name] = f"needs_{_name}"
+    if _name not in ("functions", "warnings"):
+        _CONFIG_NAMES[_name] = f"needs_{_name}"
+del _field, _name
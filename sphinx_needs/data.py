@@ -4,7 +4,7 @@ which is stored in the Sphinx environment.
 
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Hashable, Mapping
 from enum import Enum
 from typing import (
     TYPE_CHECKING,
@@ -25,7 +25,7 @@ if TYPE_CHECKING:
     from sphinx.environment import BuildEnvironment
     from typing_extensions import NotRequired
 
-    from sphinx_needs.need_item import NeedItem
+    from sphinx_needs.need_item import NeedItem, NeedPartItem
     from sphinx_needs.needs_schema import (
         FieldFunctionArray,
         FieldLiteralValue,
@@ -628,6 +628,18 @@ class NeedsFilteredBaseType(NeedsBaseDataType):
     """If set, the filter is exported with this ID in the needs.json file."""
 
 
+class NeedsFilterSpecType(TypedDict):
+    """The filter string and options of a view directive on all needs,
+    to be evaluated before the documents are written (see ``needs_filter_workers``).
+    """
+
+    docname: str
+    status: list[str]
+    tags: list[str]
+    types: list[str]
+    filter: None | str
+
+
 class NeedsFilteredDiagramBaseType(NeedsFilteredBaseType):
     """A base type for all filtered diagram data."""
 
@@ -791,6 +803,9 @@ class NeedsTableType(NeedsFilteredBaseType):
 
     max_items: int | None
     """Maximum number of needs to show, ``None`` if the option was not given."""
+    render: NotRequired[str]
+    """``nodes`` to write the rows into the page, ``data`` to load them from a JSON file.
+    Not set if the option was not given, which is the same as ``nodes``."""
 
 
 class NeedsUmlType(NeedsBaseDataType):
@@ -915,6 +930,7 @@ class SphinxNeedsData:
         for uml_id in list(umls):
             if umls[uml_id]["docname"] == docname:
                 del umls[uml_id]
+        self.get_or_create_filter_specs().pop(docname, None)
 
     def get_needs_mutable(self) -> NeedsMutable:
         """Get all needs, mapped by ID.
@@ -947,13 +963,35 @@ class SphinxNeedsData:
             #     )
 
             post_process_needs_data(self.env.app)
+            # the needs may have changed since a view was last created,
+            # so drop it, together with anything computed from it
+            for name in ("_needs_view", "_needs_filter_cache"):
+                if hasattr(self.env, name):
+                    delattr(self.env, name)
 
         try:
             return self.env._needs_view
         except AttributeError:
-            self.env._needs_view = NeedsView._from_needs(self._env_needs)
+            self.env._needs_view = NeedsView._from_needs(
+                self._env_needs, schema=self.get_schema()
+            )
         return self.env._needs_view
 
+    def get_or_create_filter_cache(
+        self,
+    ) -> dict[Hashable, tuple[NeedItem | NeedPartItem, ...]]:
+        """Get the needs and parts found by filters on the needs view, mapped by a normalized filter key.
+
+        This is lazily created and cached in the environment,
+        and is reset whenever the needs are post-processed,
+        so that the results are always those of the current needs view.
+        """
+        try:
+            return self.env._needs_filter_cache
+        except AttributeError:
+            self.env._needs_filter_cache = {}
+        return self.env._needs_filter_cache
+
     def get_or_create_docs(self) -> dict[str, list[str]]:
         """Get mapping of need category to docnames containing the need.
 
@@ -978,6 +1016,15 @@ class SphinxNeedsData:
     def needs_is_post_processed(self, value: bool) -> None:
         self.env._needs_is_post_processed = value
 
+    @property
+    def read_docs(self) -> set[str] | None:
+        """The documents read in the current build, or ``None`` if not known."""
+        return getattr(self.env, "_needs_read_docs", None)
+
+    @read_docs.setter
+    def read_docs(self, value: set[str]) -> None:
+        self.env._needs_read_docs = value
+
     def get_or_create_services(self) -> ServiceManager:
         """Get information about services.
 
@@ -1013,6 +1060,17 @@ class SphinxNeedsData:
             self.env._needs_all_needumls = {}
         return self.env._needs_all_needumls
 
+    def get_or_create_filter_specs(self) -> dict[str, list[NeedsFilterSpecType]]:
+        """Get the filters of view directives on all needs, mapped by docname.
+
+        This is lazily created and cached in the environment.
+        """
+        try:
+            return self.env._needs_filter_specs
+        except AttributeError:
+            self.env._needs_filter_specs = {}
+        return self.env._needs_filter_specs
+
     @property
     def _needs_all_nodes(self) -> dict[str, Need]:
         try:
@@ -1106,3 +1164,4 @@ def merge_data(
     _merge("_needs_all_nodes")
     _merge("_need_all_needextend")
     _merge("_needs_all_needumls")
+    _merge("_needs_filter_specs")
@@ -8,16 +8,21 @@ from __future__ import annotations
 import inspect
 import json
 import os.path
-from collections.abc import Callable
+import sys
+import threading
+from collections import Counter
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from datetime import datetime
 from functools import wraps
 from pathlib import Path
+from time import perf_counter_ns
 from timeit import default_timer as timer  # Used for timing measurements
-from typing import Any, TypeVar
+from typing import Any, Literal, TypeVar
 
 from sphinx.application import Sphinx
 
-from sphinx_needs._jinja import render_template_string
+from sphinx_needs._jinja import render_template_string, template_registry
 
 TIME_MEASUREMENTS: dict[str, Any] = {}  # Stores the timing results
 EXECUTE_TIME_MEASUREMENTS = (
@@ -26,6 +31,19 @@ EXECUTE_TIME_MEASUREMENTS = (
 
 START_TIME = 0.0
 
+MeasurementMode = Literal["detailed", "fast"]
+
+MEASUREMENT_MODE: MeasurementMode = "detailed"
+"""How functions decorated with :func:`measure_time` are measured.
+
+``detailed`` looks up the source of a function when it is first measured,
+and stores the arguments of its slowest call.
+``fast`` only accumulates the runtimes, in a slot allocated when the function is decorated.
+"""
+
+SAMPLER: StackSampler | None = None
+"""Samples the stack of the build, during some phases of it, if activated."""
+
 T = TypeVar("T", bound=Callable[..., Any])
 
 
@@ -60,6 +78,14 @@ def measure_time(
     """
 
     def inner(func: T) -> T:
+        slot = _get_slot(
+            f"{category}_{func.__name__}",
+            func,
+            func.__name__ if name is None else name,
+            category,
+            source,
+        )
+
         @wraps(func)
         def wrapper(*args: list[object], **kwargs: dict[object, object]) -> Any:
             """
@@ -71,6 +97,12 @@ def measure_time(
             if not EXECUTE_TIME_MEASUREMENTS:
                 return func(*args, **kwargs)
 
+            if MEASUREMENT_MODE == "fast":
+                start_ns = perf_counter_ns()
+                result = func(*args, **kwargs)
+                slot.add(perf_counter_ns() - start_ns)
+                return result
+
             start = timer()
             # Execute original function
             result = func(*args, **kwargs)
@@ -80,45 +112,24 @@ def measure_time(
 
             mt_name = func.__name__ if name is None else name
 
-            mt_id = f"{category}_{func.__name__}"
-
-            if mt_id not in TIME_MEASUREMENTS:
-                TIME_MEASUREMENTS[mt_id] = {
+            _add_measurement(
+                f"{category}_{func.__name__}",
+                runtime,
+                info=lambda: {
                     "name": mt_name,
                     "category": category,
                     "source": source,
                     "doc": func.__doc__,
                     "file": inspect.getfile(func),
                     "line": inspect.getsourcelines(func)[1],
-                    "amount": 0,
-                    "overall": 0,
-                    "avg": None,
-                    "min": None,
-                    "max": None,
-                    "min_max_spread": None,
-                    "max_params": {"args": [], "kwargs": {}},
-                }
-
-            runtime_dict = TIME_MEASUREMENTS[mt_id]
-
-            runtime_dict["amount"] += 1
-            runtime_dict["overall"] += runtime
-
-            if runtime_dict["min"] is None or runtime < runtime_dict["min"]:
-                runtime_dict["min"] = runtime
-
-            if runtime_dict["max"] is None or runtime > runtime_dict["max"]:
-                runtime_dict["max"] = runtime
-                runtime_dict["max_params"] = {  # Store parameters as a shorten string
+                },
+                max_params=lambda: {  # Store parameters as a shorten string
                     "args": str([str(arg)[:80] for arg in args]),
                     "kwargs": str(
                         {key: str(value)[:80] for key, value in kwargs.items()}
                     ),
-                }
-            runtime_dict["min_max_spread"] = (
-                runtime_dict["max"] / runtime_dict["min"] * 100
+                },
             )
-            runtime_dict["avg"] = runtime_dict["overall"] / runtime_dict["amount"]
             return result
 
         return wrapper  # type: ignore[return-value]
@@ -126,6 +137,317 @@ def measure_time(
     return inner
 
 
+class _Slot:
+    """The runtimes of a function, accumulated in ``fast`` :data:`MEASUREMENT_MODE`."""
+
+    __slots__ = (
+        "amount",
+        "category",
+        "func",
+        "max_ns",
+        "min_ns",
+        "name",
+        "overall_ns",
+        "source",
+    )
+
+    def __init__(
+        self, func: Callable[..., Any], name: str, category: str | None, source: str
+    ) -> None:
+        self.func = func
+        self.name = name
+        self.category = category
+        self.source = source
+        self.amount = 0
+        self.overall_ns = 0
+        self.min_ns = 0
+        self.max_ns = 0
+
+    def add(self, runtime_ns: int) -> None:
+        if not self.amount or runtime_ns < self.min_ns:
+            self.min_ns = runtime_ns
+        if runtime_ns > self.max_ns:
+            self.max_ns = runtime_ns
+        self.amount += 1
+        self.overall_ns += runtime_ns
+
+
+_SLOTS: dict[str, _Slot] = {}
+"""The slot of each function decorated with :func:`measure_time`, by measurement id."""
+
+
+def _get_slot(
+    mt_id: str,
+    func: Callable[..., Any],
+    name: str,
+    category: str | None,
+    source: str,
+) -> _Slot:
+    """Get the slot of a measurement, allocating it on first use.
+
+    Functions sharing a measurement id share a slot,
+    as they share their entry in :data:`TIME_MEASUREMENTS`.
+    """
+    if (slot := _SLOTS.get(mt_id)) is None:
+        slot = _SLOTS[mt_id] = _Slot(func, name, category, source)
+    return slot
+
+
+def _collect_slots() -> None:
+    """Add the runtimes accumulated in the slots to :data:`TIME_MEASUREMENTS`,
+    and empty the slots for the next build.
+    """
+    for mt_id, slot in _SLOTS.items():
+        if not slot.amount:
+            continue
+        if mt_id not in TIME_MEASUREMENTS:
+            TIME_MEASUREMENTS[mt_id] = {
+                "name": slot.name,
+                "category": slot.category,
+                "source": slot.source,
+                "doc": slot.func.__doc__,
+                **_source_location(slot.func),
+                "amount": 0,
+                "overall": 0,
+                "avg": None,
+                "min": None,
+                "max": None,
+                "min_max_spread": None,
+                "max_params": {"args": [], "kwargs": {}},
+            }
+        runtime_dict = TIME_MEASUREMENTS[mt_id]
+        min_runtime = slot.min_ns / 1e9
+        max_runtime = slot.max_ns / 1e9
+        runtime_dict["amount"] += slot.amount
+        runtime_dict["overall"] += slot.overall_ns / 1e9
+        if runtime_dict["min"] is None or min_runtime < runtime_dict["min"]:
+            runtime_dict["min"] = min_runtime
+        if runtime_dict["max"] is None or max_runtime > runtime_dict["max"]:
+            runtime_dict["max"] = max_runtime
+        runtime_dict["min_max_spread"] = (
+            runtime_dict["max"] / runtime_dict["min"] * 100
+            if runtime_dict["min"]
+            else None
+        )
+        runtime_dict["avg"] = runtime_dict["overall"] / runtime_dict["amount"]
+        slot.amount = slot.overall_ns = slot.min_ns = slot.max_ns = 0
+
+
+def _source_location(func: Callable[..., Any]) -> dict[str, Any]:
+    """The file and line of a function, if its source is still available.
+
+    Slots outlive a build, so the source of a function, e.g. one defined in a ``conf.py``,
+    may be gone by the time it is reported.
+    """
+    try:
+        return {
+            "file": inspect.getfile(func),
+            "line": inspect.getsourcelines(func)[1],
+        }
+    except (OSError, TypeError):
+        return {"file": None, "line": None}
+
+
+class StackSampler:
+    """A sampling profiler, recording the stack of the main thread at a fixed interval.
+
+    Sampling runs in a background thread, while at least one phase is active,
+    and each sample is counted for the innermost active phase.
+    For every function, it counts the samples with the function on top of the stack (``self``),
+    and the samples with the function anywhere on the stack (``total``).
+    """
+
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+        """The time between samples, in seconds."""
+        self._phases: list[str] = []
+        self._lock = threading.Lock()
+        """Guards the phases, which the sampling thread reads."""
+        self._samples: Counter[str] = Counter()
+        self._self: dict[str, Counter[tuple[str, int, str]]] = {}
+        self._total: dict[str, Counter[tuple[str, int, str]]] = {}
+        self._thread: threading.Thread | None = None
+        self._stop = threading.Event()
+        self._target = threading.get_ident()
+        """The thread to sample, i.e. the one that started sampling."""
+
+    def start(self, phase: str) -> None:
+        """Start a phase, starting to sample, if no other phase is active."""
+        with self._lock:
+            self._phases.append(phase)
+        if self._thread is None:
+            self._target = threading.get_ident()
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="sphinx-needs-sampler", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self, phase: str) -> None:
+        """Stop a phase, stopping to sample, if no other phase is active."""
+        with self._lock:
+            if phase in self._phases:
+                del self._phases[
+                    len(self._phases) - 1 - self._phases[::-1].index(phase)
+                ]
+            active = bool(self._phases)
+        if not active and self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+
+    @contextmanager
+    def phase(self, phase: str) -> Iterator[None]:
+        """Sample the stack, while the context is active."""
+        self.start(phase)
+        try:
+            yield
+        finally:
+            self.stop(phase)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            with self._lock:
+                phase = self._phases[-1] if self._phases else None
+            frame = sys._current_frames().get(self._target)
+            if frame is None or phase is None:
+                continue
+            self._samples[phase] += 1
+            code = frame.f_code
+            self._self.setdefault(phase, Counter())[
+                (code.co_filename, code.co_firstlineno, code.co_name)
+            ] += 1
+            on_stack: set[tuple[str, int, str]] = set()
+            while frame is not None:
+                code = frame.f_code
+                on_stack.add((code.co_filename, code.co_firstlineno, code.co_name))
+                frame = frame.f_back
+            self._total.setdefault(phase, Counter()).update(on_stack)
+
+    def results(self, limit: int = 50) -> dict[str, Any]:
+        """The sampled functions of each phase, with the most samples on the stack first.
+
+        :param limit: The maximum number of functions to report per phase.
+        """
+        results: dict[str, Any] = {}
+        for phase, samples in self._samples.items():
+            self_counts = self._self.get(phase, Counter())
+            results[phase] = {
+                "interval": self.interval,
+                "samples": samples,
+                "functions": [
+                    {
+                        "function": function,
+                        "file": file,
+                        "line": line,
+                        "self": self_counts[(file, line, function)],
+                        "total": total,
+                    }
+                    for (file, line, function), total in self._total[phase].most_common(
+                        limit
+                    )
+                ],
+            }
+        return results
+
+
+@contextmanager
+def sample_stacks(phase: str) -> Iterator[None]:
+    """Sample the stack of the build during the context, if sampling is activated.
+
+    :param phase: The name of the phase, to report the samples under.
+    """
+    if SAMPLER is None or not EXECUTE_TIME_MEASUREMENTS:
+        yield
+        return
+    with SAMPLER.phase(phase):
+        yield
+
+
+def start_write_sampling(_app: Sphinx, _builder: Any) -> None:
+    """Sample the stack of the write phase, until the build is finished."""
+    if SAMPLER is not None and EXECUTE_TIME_MEASUREMENTS:
+        SAMPLER.start("write")
+
+
+def record_measurement(
+    category: str,
+    name: str,
+    runtime: float,
+    *,
+    source: str = "internal",
+    doc: str | None = None,
+) -> None:
+    """Record the runtime of a part of the build that is not a single function call,
+    alongside the measurements of :func:`measure_time`.
+
+    Does nothing, if measurements are not activated.
+
+    :param category: Name of a category, which helps to cluster the measurements.
+    :param name: Name of the measured part.
+    :param runtime: The measured time in seconds.
+    :param source: Should be "internal" or "user".
+    :param doc: A description of the measured part.
+    """
+    if not EXECUTE_TIME_MEASUREMENTS:
+        return
+    _add_measurement(
+        f"{category}_{name}",
+        runtime,
+        info=lambda: {
+            "name": name,
+            "category": category,
+            "source": source,
+            "doc": doc,
+            "file": None,
+            "line": None,
+        },
+        max_params=lambda: {"args": [], "kwargs": {}},
+    )
+
+
+def _add_measurement(
+    mt_id: str,
+    runtime: float,
+    *,
+    info: Callable[[], dict[str, Any]],
+    max_params: Callable[[], dict[str, Any]],
+) -> None:
+    """Add a runtime to the statistics of a measurement.
+
+    :param info: Creates the description of the measurement, when it is first recorded.
+    :param max_params: Creates the description of the parameters, when the runtime is a new maximum.
+    """
+    if mt_id not in TIME_MEASUREMENTS:
+        TIME_MEASUREMENTS[mt_id] = {
+            **info(),
+            "amount": 0,
+            "overall": 0,
+            "avg": None,
+            "min": None,
+            "max": None,
+            "min_max_spread": None,
+            "max_params": {"args": [], "kwargs": {}},
+        }
+
+    runtime_dict = TIME_MEASUREMENTS[mt_id]
+
+    runtime_dict["amount"] += 1
+    runtime_dict["overall"] += runtime
+
+    if runtime_dict["min"] is None or runtime < runtime_dict["min"]:
+        runtime_dict["min"] = runtime
+
+    if runtime_dict["max"] is None or runtime > runtime_dict["max"]:
+        runtime_dict["max"] = runtime
+        runtime_dict["max_params"] = max_params()
+    # a zero minimum is possible for coarse timers
+    runtime_dict["min_max_spread"] = (
+        runtime_dict["max"] / runtime_dict["min"] * 100 if runtime_dict["min"] else None
+    )
+    runtime_dict["avg"] = runtime_dict["overall"] / runtime_dict["amount"]
+
+
 def measure_time_func(
     func: T,
     category: str | None = None,
@@ -154,11 +476,21 @@ def _print_timing_results(app: Sphinx) -> None:
         print(f" max:     {value['max']:2f}")
         print(f" min:     {value['min']:2f} \n")
 
+    templates = template_registry.stats()
+    print("compiled templates")
+    for key, count in templates.items():
+        print(f" {key + ':':<12} {count}")
+
 
 def _store_timing_results_json(app: Sphinx, build_data: dict[str, Any]) -> None:
     json_result_path = os.path.join(str(app.outdir), "debug_measurement.json")
 
-    data = {"build": build_data, "measurements": TIME_MEASUREMENTS}
+    data = {
+        "build": build_data,
+        "measurements": TIME_MEASUREMENTS,
+        "templates": template_registry.stats(),
+        "samples": SAMPLER.results() if SAMPLER is not None else {},
+    }
 
     with open(json_result_path, "w", encoding="utf-8") as f:
         json.dump(data, f, indent=4)
@@ -173,7 +505,12 @@ def _store_timing_results_html(app: Sphinx, build_data: dict[str, Any]) -> None:
         f.write(
             render_template_string(
                 template_content,
-                {"data": TIME_MEASUREMENTS, "build_data": build_data},
+                {
+                    "data": TIME_MEASUREMENTS,
+                    "build_data": build_data,
+                    "templates": template_registry.stats(),
+                    "samples": SAMPLER.results() if SAMPLER is not None else {},
+                },
                 autoescape=True,
             )
         )
@@ -182,12 +519,16 @@ def _store_timing_results_html(app: Sphinx, build_data: dict[str, Any]) -> None:
 
 def process_timing(app: Sphinx, _exception: Exception | None) -> None:
     if EXECUTE_TIME_MEASUREMENTS:
+        if SAMPLER is not None:
+            SAMPLER.stop("write")
+        _collect_slots()
         build_data = {
             "project": app.config["project"],
             "start": START_TIME,
             "end": timer(),
             "duration": timer() - START_TIME,
             "timestamp": datetime.now().isoformat(),
+            "mode": MEASUREMENT_MODE,
         }
 
         _print_timing_results(app)
@@ -0,0 +1,291 @@
+"""Re-use the generated source of diagrams across builds.
+
+Generating the source of a :ref:`needflow` or :ref:`needuml` diagram filters the needs,
+builds the graph and renders every node and edge, each time the document is written.
+With :ref:`needs_diagram_cache` enabled, the result is stored in the doctree directory,
+keyed by the directive and by a fingerprint of the needs and configuration,
+and re-used in later builds, as long as neither changed.
+
+The fingerprint of the needs is made of a digest of the needs of each document, before post-processing,
+which is only computed again for the documents read in this build:
+post-processing gives the same result for the same needs, extends and configuration.
+Entries of diagrams that were not generated again, in a document that was written, are dropped.
+
+Diagrams are generated when a document is resolved,
+which Sphinx does in the main process, also when writing in parallel,
+so the diagrams of all documents are stored.
+
+The images themselves are not stored here:
+``sphinx.ext.graphviz`` and ``sphinxcontrib-plantuml`` already name the rendered images
+by a hash of their source, and do not render them again if they exist,
+so an unchanged source is all that is needed to skip rendering as well.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import pickle
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field, fields, replace
+from pathlib import Path
+from typing import Any
+
+from docutils import nodes
+from sphinx.application import Sphinx
+
+from sphinx_needs import __version__
+from sphinx_needs.config import NeedsSphinxConfig
+from sphinx_needs.data import NeedsMutable, SphinxNeedsData
+from sphinx_needs.logging import LoggedWarning, record_warnings
+from sphinx_needs.need_item import NeedItem
+from sphinx_needs.utils import stable_repr, value_digest
+
+CACHE_FILENAME = "needs_diagrams.pickle"
+
+_CACHE_FORMAT = 2
+"""Increase, if the format of the cache changes."""
+
+_ENGINE_CONFIG = (
+    "graphviz_dot",
+    "graphviz_dot_args",
+    "graphviz_output_format",
+    "plantuml",
+    "plantuml_output_format",
+    "plantuml_syntax_error_image",
+)
+"""The configuration of the rendering extensions, that a diagram is drawn with."""
+
+
+@dataclass(slots=True)
+class GeneratedDiagram:
+    """The result of generating a diagram."""
+
+    text: str
+    """The source of the diagram, empty if there is nothing to draw."""
+    shown_needs: int = 0
+    """The number of needs drawn."""
+    total_needs: int = 0
+    """The number of needs found, before ``max_items`` was applied."""
+    nodes: list[nodes.Element] = field(default_factory=list)
+    """Document nodes to place beside the diagram, e.g. a legend table."""
+    duration: float = 0.0
+    """The time, in seconds, it took to generate the diagram."""
+
+
+@dataclass(slots=True)
+class _CachedDiagram:
+    docname: str
+    """The document the diagram is in."""
+    diagram: GeneratedDiagram
+    warnings: tuple[LoggedWarning, ...]
+    """The warnings logged while generating the diagram, to emit again on re-use."""
+
+
+@dataclass(slots=True)
+class _DiagramCache:
+    fingerprint: bytes
+    """The fingerprint of the needs and configuration, that the diagrams were generated for."""
+    doc_digests: dict[str | None, bytes] = field(default_factory=dict)
+    """The digest of the needs of each document (None for external needs), before post-processing."""
+    diagrams: dict[bytes, _CachedDiagram] = field(default_factory=dict)
+    """The diagrams, by a digest of the directive they were generated for."""
+    used: set[bytes] = field(default_factory=set)
+    """The diagrams generated or re-used in this build."""
+    resolved: set[str] = field(default_factory=set)
+    """The documents resolved in this build."""
+    changed: bool = False
+
+    def __getstate__(self) -> dict[str, Any]:
+        # only what is needed by the next build is stored
+        return {
+            "fingerprint": self.fingerprint,
+            "doc_digests": self.doc_digests,
+            "diagrams": self.diagrams,
+        }
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.fingerprint = state["fingerprint"]
+        self.doc_digests = state["doc_digests"]
+        self.diagrams = state["diagrams"]
+        self.used = set()
+        self.resolved = set()
+        self.changed = False
+
+
+_caches: dict[str, _DiagramCache] = {}
+"""The cache of each build in progress, by its doctree directory."""
+
+
+def generate_diagram(
+    app: Sphinx,
+    engine: str,
+    docname: str,
+    key: Any,
+    generate: Callable[[], GeneratedDiagram],
+) -> GeneratedDiagram:
+    """Generate a diagram, or re-use the diagram generated for the same key by a previous build.
+
+    If :ref:`needs_diagram_cache` is disabled, the diagram is always generated.
+    Warnings logged while generating a diagram are emitted again when it is re-used.
+
+    :param engine: The name of the generator, so that different generators never share a result.
+    :param docname: The document the diagram is in.
+    :param key: Everything, other than the needs and the configuration,
+        that the diagram depends on, e.g. the attributes of the directive.
+        It is compared by its ``stable_repr``.
+    :param generate: Generates the diagram.
+    """
+    if not NeedsSphinxConfig(app.config).diagram_cache:
+        return generate()
+
+    cache = _get_cache(app)
+    # the key is represented rather than pickled,
+    # since the pickle of equal values differs, if they share objects differently,
+    # e.g. between a parsed and an unpickled doctree
+    diagram_key = value_digest((engine, docname, stable_repr(key)))
+    cache.used.add(diagram_key)
+    if (cached := cache.diagrams.get(diagram_key)) is not None:
+        for warning in cached.warnings:
+            warning.replay()
+        return _copy(cached.diagram)
+
+    with record_warnings() as warnings:
+        diagram = generate()
+    cache.diagrams[diagram_key] = _CachedDiagram(
+        docname, _copy(diagram), tuple(warnings)
+    )
+    cache.changed = True
+    return diagram
+
+
+def load_diagram_cache(app: Sphinx, needs: NeedsMutable) -> None:
+    """Load the cache of the previous build, before the needs are post-processed,
+    so that the fingerprint is made of the needs as they were read.
+    """
+    if NeedsSphinxConfig(app.config).diagram_cache:
+        _get_cache(app, needs)
+
+
+def record_resolved_doc(app: Sphinx, _doctree: nodes.document, docname: str) -> None:
+    """Record a document resolved in this build,
+    so that the diagrams it no longer contains are dropped from the cache.
+    """
+    if NeedsSphinxConfig(app.config).diagram_cache:
+        _get_cache(app).resolved.add(docname)
+
+
+def save_diagram_cache(app: Sphinx, exception: Exception | None) -> None:
+    """Store the diagrams generated in this build, for the next build.
+
+    Diagrams that were not used in this build are dropped,
+    if their document was resolved in this build, or no longer exists.
+    """
+    cache = _caches.pop(str(app.doctreedir), None)
+    if cache is None or exception is not None:
+        return
+    kept = {
+        key: cached
+        for key, cached in cache.diagrams.items()
+        if key in cache.used
+        or (cached.docname not in cache.resolved and cached.docname in app.env.all_docs)
+    }
+    if len(kept) != len(cache.diagrams):
+        cache.diagrams = kept
+        cache.changed = True
+    if not cache.changed:
+        return
+    path = Path(app.doctreedir, CACHE_FILENAME)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_suffix(".tmp")
+    with temp_path.open("wb") as f:
+        pickle.dump(cache, f, pickle.HIGHEST_PROTOCOL)
+    temp_path.replace(path)
+
+
+def _get_cache(app: Sphinx, needs: NeedsMutable | None = None) -> _DiagramCache:
+    """Get the cache of the current build, loading it on first use.
+
+    Diagrams of a previous build are only kept,
+    if the needs and configuration are the same as in this build.
+
+    :param needs: The needs before post-processing.
+        If the cache is loaded after post-processing, no diagrams of a previous build are kept.
+    """
+    if (cache := _caches.get(str(app.doctreedir))) is not None:
+        return cache
+    try:
+        with Path(app.doctreedir, CACHE_FILENAME).open("rb") as f:
+            previous = pickle.load(f)
+    except Exception:
+        previous = None
+    if not isinstance(previous, _DiagramCache) or needs is None:
+        previous = None
+    doc_digests = _doc_digests(
+        {} if needs is None else needs.values(),
+        SphinxNeedsData(app.env).read_docs,
+        {} if previous is None else previous.doc_digests,
+    )
+    fingerprint = _fingerprint(app, doc_digests)
+    if previous is not None and previous.fingerprint == fingerprint:
+        cache = previous
+    else:
+        cache = _DiagramCache(fingerprint, doc_digests, changed=True)
+    _caches[str(app.doctreedir)] = cache
+    return cache
+
+
+def _doc_digests(
+    needs: Iterable[NeedItem],
+    read_docs: set[str] | None,
+    previous: dict[str | None, bytes],
+) -> dict[str | None, bytes]:
+    """Create a digest of the needs of each document, before post-processing.
+
+    The needs of a document that was not read in this build are the same as in the previous build,
+    so its previous digest is re-used.
+
+    :param read_docs: The documents read in this build, or None if unknown.
+    :param previous: The digests of the previous build.
+    """
+    doc_needs: dict[str | None, list[NeedItem] | None] = {}
+    for need in needs:
+        docname = need["docname"]
+        if (
+            docname is None
+            or read_docs is None
+            or docname in read_docs
+            or docname not in previous
+        ):
+            doc_needs.setdefault(docname, []).append(need)  # type: ignore[union-attr]
+        else:
+            doc_needs.setdefault(docname, None)
+    return {
+        docname: previous[docname] if needs is None else value_digest(needs)
+        for docname, needs in doc_needs.items()
+    }
+
+
+def _fingerprint(app: Sphinx, doc_digests: dict[str | None, bytes]) -> bytes:
+    """Create a digest of the needs and of the configuration, that diagrams are generated from."""
+    needs_config = NeedsSphinxConfig(app.config)
+    needs_data = SphinxNeedsData(app.env)
+    hasher = hashlib.blake2b(digest_size=16)
+    hasher.update(f"{_CACHE_FORMAT}:{__version__}:{app.builder.name}".encode())
+    for item in fields(NeedsSphinxConfig):
+        value = getattr(needs_config, item.name)
+        hasher.update(f"{item.name}={stable_repr(value)}".encode())
+    hasher.update(stable_repr(needs_config.functions).encode())
+    for name in _ENGINE_CONFIG:
+        hasher.update(f"{name}={stable_repr(getattr(app.config, name, None))}".encode())
+    hasher.update(stable_repr(sorted(app.builder.tags)).encode())
+    hasher.update(value_digest(needs_data.get_schema()))
+    hasher.update(value_digest(sorted(needs_data.get_or_create_extends().items())))
+    for docname, digest in sorted(doc_digests.items(), key=lambda item: item[0] or ""):
+        hasher.update(f"{docname}=".encode())
+        hasher.update(digest)
+    return hasher.digest()
+
+
+def _copy(diagram: GeneratedDiagram) -> GeneratedDiagram:
+    """Copy a diagram, so that its nodes can be inserted into a document."""
+    return replace(diagram, nodes=[node.deepcopy() for node in diagram.nodes])
@@ -8,6 +8,8 @@ from __future__ import annotations
 import html
 import os
 import textwrap
+from collections.abc import Iterator
+from contextlib import contextmanager
 from typing import TypedDict
 from urllib.parse import urlparse
 
@@ -149,6 +151,47 @@ def add_config(config: str) -> str:
     return uml
 
 
+class DiagramWriter:
+    """Collects the source of a diagram, and joins it only once it is complete.
+
+    Building a large source by concatenating strings,
+    including the strings returned by the recursive calls for nested needs,
+    copies everything written so far over and over;
+    the writer instead collects the parts, and :meth:`getvalue` joins them once.
+    """
+
+    __slots__ = ("_indent", "_parts")
+
+    def __init__(self) -> None:
+        self._parts: list[str] = []
+        self._indent = ""
+
+    def write(self, text: str) -> None:
+        """Write text as is, without indentation."""
+        self._parts.append(text)
+
+    def line(self, text: str = "") -> None:
+        """Write a line at the current indentation; an empty line is not indented."""
+        if text:
+            self._parts.extend((self._indent, text, "\n"))
+        else:
+            self._parts.append("\n")
+
+    @contextmanager
+    def indented(self, prefix: str = "  ") -> Iterator[None]:
+        """Indent the lines written within the context by a further ``prefix``."""
+        outer = self._indent
+        self._indent += prefix
+        try:
+            yield
+        finally:
+            self._indent = outer
+
+    def getvalue(self) -> str:
+        """The source written so far."""
+        return "".join(self._parts)
+
+
 def get_filter_para(node_element: NeedsFilteredBaseType) -> nodes.paragraph:
     """Return paragraph containing the used filter description"""
     para = nodes.paragraph()
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import re
-from collections.abc import Callable, Sequence
+from collections.abc import Callable, Iterable, Mapping, Sequence
 from typing import Any, Final
 
 from docutils import nodes
@@ -10,12 +10,13 @@ from sphinx.application import Sphinx
 from sphinx.environment import BuildEnvironment
 from sphinx.util.docutils import SphinxDirective
 
+from sphinx_needs import telemetry
 from sphinx_needs.api import InvalidNeedException, add_need
 from sphinx_needs.config import NeedsSphinxConfig
 from sphinx_needs.data import NeedsMutable, SphinxNeedsData
-from sphinx_needs.debug import measure_time
+from sphinx_needs.debug import measure_time, sample_stacks
 from sphinx_needs.directives.needextend import Needextend, extend_needs_data
-from sphinx_needs.filter_common import filter_single_need
+from sphinx_needs.filter_common import filter_single_needs
 from sphinx_needs.functions.functions import (
     check_and_get_content,
     find_and_replace_node_content,
@@ -356,27 +357,41 @@ def post_process_needs_data(app: Sphinx) -> None:
     """
     needs_data = SphinxNeedsData(app.env)
     if not needs_data.needs_is_post_processed:
-        needs_config = NeedsSphinxConfig(app.config)
-        needs_schema = needs_data.get_schema()
-        needs = needs_data.get_needs_mutable()
-        app.emit("needs-before-post-processing", needs)
-        extend_needs_data(needs, needs_data.get_or_create_extends(), needs_config)
-        resolve_functions(app, needs, needs_config)
-        resolve_links(needs, needs_config, needs_schema)
-        process_constraints(needs, needs_config)
-        app.emit("needs-before-sealing", needs)
-        # run a last check to ensure all needs are of the correct type
-        # this is done as a back-compatibility check,
-        # in case users are using sphinx-needs in an unexpected way that may previously work.
-        for need in needs.values():
-            if not isinstance(need, NeedItem):
-                raise AssertionError(
-                    f"Found at least one need item that is not a NeedItem instance: {type(need)}\n"
-                    "If you are adding needs manually, consider using the add_need API."
-                )
-        needs_data.needs_is_post_processed = True
-
-
+        with sample_stacks("post_process"):
+            needs_config = NeedsSphinxConfig(app.config)
+            needs_schema = needs_data.get_schema()
+            needs = needs_data.get_needs_mutable()
+            app.emit("needs-before-post-processing", needs)
+            if needs_config.incremental_post_process:
+                from sphinx_needs.incremental import post_process_needs_incrementally
+
+                with telemetry.phase("post_process_incremental", len(needs)):
+                    post_process_needs_incrementally(app, needs)
+            else:
+                with telemetry.phase("extend", len(needs)):
+                    extend_needs_data(
+                        needs, needs_data.get_or_create_extends(), needs_config
+                    )
+                with telemetry.phase("dynamic_functions", len(needs)):
+                    resolve_functions(app, needs, needs_config)
+                with telemetry.phase("links", len(needs)):
+                    resolve_links(needs, needs_config, needs_schema)
+                with telemetry.phase("constraints", len(needs)):
+                    process_constraints(needs, needs_config)
+            app.emit("needs-before-sealing", needs)
+            # run a last check to ensure all needs are of the correct type
+            # this is done as a back-compatibility check,
+            # in case users are using sphinx-needs in an unexpected way that may previously work.
+            for need in needs.values():
+                if not isinstance(need, NeedItem):
+                    raise AssertionError(
+                        f"Found at least one need item that is not a NeedItem instance: {type(need)}\n"
+                        "If you are adding needs manually, consider using the add_need API."
+                    )
+            needs_data.needs_is_post_processed = True
+
+
+@telemetry.record_phase("resolve_need")
 def process_need_nodes(app: Sphinx, doctree: nodes.document, fromdocname: str) -> None:
     """
     Event handler to add title meta data (status, tags, links, ...) information to the Need node. Also processes
@@ -398,7 +413,9 @@ def process_need_nodes(app: Sphinx, doctree: nodes.document, fromdocname: str) -
     for extend_node in list(doctree.findall(Needextend)):
         remove_node_from_tree(extend_node)
 
-    format_need_nodes(app, doctree, fromdocname, list(doctree.findall(Need)))
+    need_nodes = list(doctree.findall(Need))
+    telemetry.count_items(len(need_nodes))
+    format_need_nodes(app, doctree, fromdocname, need_nodes)
 
 
 @profile("NEED_FORMAT")
@@ -446,58 +463,21 @@ def resolve_links(
         need.reset_backlinks()
 
     for key, need in needs.items():
-        dead_links: list[tuple[str, NeedLink]] = []
-
         for link_type, references in need.iter_links_items(as_str=False):
             for need_link in references:
                 if linked_need := needs.get(need_link.id):
-                    # Assess link condition if present
-                    if need_link.condition is not None:
-                        try:
-                            if not filter_single_need(
-                                linked_need,
-                                config,
-                                need_link.condition,
-                            ):
-                                _emit_link_warning(
-                                    need,
-                                    f"Need '{need.id}' link '{need_link.to_filter_string()}' "
-                                    f"in field '{link_type}': "
-                                    f"condition {need_link.condition!r} "
-                                    f"not satisfied by target need '{need_link.id}'",
-                                    "link_condition_failed",
-                                )
-                        except Exception as e:
-                            _emit_link_warning(
-                                need,
-                                f"Need '{need.id}' link '{need_link.to_filter_string()}' "
-                                f"in field '{link_type}': "
-                                f"invalid condition syntax {need_link.condition!r}: {e}",
-                                "link_condition_invalid",
-                            )
-
                     linked_need.add_backlink(link_type, NeedLink(id=key))
-                    if need_link.part is not None:
-                        if linked_part := linked_need.get_part(need_link.part):
-                            if link_type not in linked_part.backlinks:
-                                linked_part.backlinks[link_type] = []
-                            linked_part.backlinks[link_type].append(NeedLink(id=key))
-                        else:
-                            dead_links.append((link_type, need_link))
-                else:
-                    dead_links.append((link_type, need_link))
-
-        need["has_dead_links"] = bool(dead_links)
-        allow_dead_links = {
-            link.name: link.allow_dead_links for link in schema.iter_link_fields()
-        }
-        need["has_forbidden_dead_links"] = bool(
-            any(not allow_dead_links.get(lt, False) for lt, _ in dead_links)
-        )
-        if need["has_forbidden_dead_links"] and config.report_dead_links:
-            for link_type, need_link in dead_links:
-                message = f"Need '{need.id}' has unknown outgoing link '{need_link.to_filter_string()}' in field '{link_type}'"
-                _emit_link_warning(need, message, "link_outgoing")
+                    if need_link.part is not None and (
+                        linked_part := linked_need.get_part(need_link.part)
+                    ):
+                        if link_type not in linked_part.backlinks:
+                            linked_part.backlinks[link_type] = []
+                        linked_part.backlinks[link_type].append(NeedLink(id=key))
+
+    allow_dead_links = get_allow_dead_links(schema)
+    condition_results = evaluate_link_conditions(needs.values(), needs, config)
+    for need in needs.values():
+        check_need_links(need, needs, config, allow_dead_links, condition_results)
 
     # Sort link lists alphabetically so that outputs (needs.json, HTML) are
     # deterministic and reproducible, regardless of needs/external_needs load order.
@@ -505,6 +485,106 @@ def resolve_links(
         need.sort_links()
 
 
+def get_allow_dead_links(schema: FieldsSchema) -> dict[str, bool]:
+    """Get whether dead links are allowed, for each link type."""
+    return {link.name: link.allow_dead_links for link in schema.iter_link_fields()}
+
+
+def evaluate_link_conditions(
+    sources: Iterable[NeedItem], needs: NeedsMutable, config: NeedsSphinxConfig
+) -> dict[tuple[str, str], bool | Exception]:
+    """Evaluate the conditions of the outgoing links of the source needs.
+
+    The links are grouped by condition, so that each condition is prepared once,
+    and evaluated once per distinct target need.
+
+    :return: The result for each ``(condition, target need id)`` pair,
+        or the exception raised when evaluating it.
+    """
+    targets: dict[str, dict[str, NeedItem]] = {}
+    for need in sources:
+        for _, references in need.iter_links_items(as_str=False):
+            for need_link in references:
+                if need_link.condition is not None and (
+                    linked_need := needs.get(need_link.id)
+                ):
+                    targets.setdefault(need_link.condition, {})[need_link.id] = (
+                        linked_need
+                    )
+
+    results: dict[tuple[str, str], bool | Exception] = {}
+    for condition, condition_targets in targets.items():
+        condition_results: list[bool | Exception]
+        try:
+            condition_results = list(
+                filter_single_needs(condition_targets.values(), config, condition)
+            )
+        except Exception as e:
+            condition_results = [e] * len(condition_targets)
+        for target_id, result in zip(condition_targets, condition_results, strict=True):
+            results[(condition, target_id)] = result
+    return results
+
+
+def check_need_links(
+    need: NeedItem,
+    needs: NeedsMutable,
+    config: NeedsSphinxConfig,
+    allow_dead_links: Mapping[str, bool],
+    condition_results: Mapping[tuple[str, str], bool | Exception],
+) -> None:
+    """Assess the outgoing links of a single need,
+    setting its ``has_dead_links`` and ``has_forbidden_dead_links`` fields,
+    and emitting warnings for failing link conditions and forbidden dead links.
+
+    :param condition_results: The results of the link conditions of the need,
+        from :func:`evaluate_link_conditions`.
+        Since link conditions may refer to them,
+        the back-links of all needs should already be resolved when evaluating these.
+    """
+    dead_links: list[tuple[str, NeedLink]] = []
+
+    for link_type, references in need.iter_links_items(as_str=False):
+        for need_link in references:
+            if linked_need := needs.get(need_link.id):
+                # Assess link condition if present
+                if need_link.condition is not None:
+                    result = condition_results[(need_link.condition, need_link.id)]
+                    if isinstance(result, Exception):
+                        _emit_link_warning(
+                            need,
+                            f"Need '{need.id}' link '{need_link.to_filter_string()}' "
+                            f"in field '{link_type}': "
+                            f"invalid condition syntax {need_link.condition!r}: {result}",
+                            "link_condition_invalid",
+                        )
+                    elif not result:
+                        _emit_link_warning(
+                            need,
+                            f"Need '{need.id}' link '{need_link.to_filter_string()}' "
+                            f"in field '{link_type}': "
+                            f"condition {need_link.condition!r} "
+                            f"not satisfied by target need '{need_link.id}'",
+                            "link_condition_failed",
+                        )
+
+                if need_link.part is not None and not linked_need.get_part(
+                    need_link.part
+                ):
+                    dead_links.append((link_type, need_link))
+            else:
+                dead_links.append((link_type, need_link))
+
+    need["has_dead_links"] = bool(dead_links)
+    need["has_forbidden_dead_links"] = bool(
+        any(not allow_dead_links.get(lt, False) for lt, _ in dead_links)
+    )
+    if need["has_forbidden_dead_links"] and config.report_dead_links:
+        for link_type, need_link in dead_links:
+            message = f"Need '{need.id}' has unknown outgoing link '{need_link.to_filter_string()}' in field '{link_type}'"
+            _emit_link_warning(need, message, "link_outgoing")
+
+
 def _emit_link_warning(need: NeedItem, message: str, subtype: WarningSubTypes) -> None:
     """Emit a warning for a link issue, using the appropriate location."""
     if need["is_external"]:
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Container, Sequence
 from typing import Final
 
 from docutils import nodes
@@ -203,8 +203,20 @@ def extend_needs_data(
     all_needs: NeedsMutable,
     extends: dict[str, NeedsExtendType],
     needs_config: NeedsSphinxConfig,
+    *,
+    only: Container[str] | None = None,
 ) -> None:
-    """Use data gathered from needextend directives to modify fields of existing needs."""
+    """Use data gathered from needextend directives to modify fields of existing needs.
+
+    :param only: If given, only the needs with these ids are modified,
+        and the filters are only evaluated against these needs
+        (a filter on a single id still reports ids that do not exist in ``all_needs``).
+    """
+    filter_needs = (
+        all_needs
+        if only is None
+        else NeedsMutable({id: need for id, need in all_needs.items() if id in only})
+    )
 
     # Sort by (docname, lineno) to ensure deterministic ordering,
     # regardless of parallel build worker completion order.
@@ -224,10 +236,12 @@ def extend_needs_data(
                 else:
                     log_warning(logger, error, "needextend", location=location)
                 continue
+            if only is not None and need_filter not in only:
+                continue
         else:
             try:
                 found_needs = filter_needs_mutable(
-                    all_needs,
+                    filter_needs,
                     needs_config,
                     need_filter,
                     location=location,
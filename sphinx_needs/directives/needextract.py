@@ -17,7 +17,7 @@ from sphinx_needs.directives.utils import (
     no_needs_found_paragraph,
     used_filter_paragraph,
 )
-from sphinx_needs.filter_common import FilterBase, process_filters
+from sphinx_needs.filter_common import FilterBase, add_filter_spec, process_filters
 from sphinx_needs.functions.functions import find_and_replace_node_content
 from sphinx_needs.layout import build_need_repr
 from sphinx_needs.logging import log_warning
@@ -67,6 +67,7 @@ class NeedextractDirective(FilterBase):
             "filter_arg": filter_arg,
             **self.collect_filter_attributes(),
         }
+        add_filter_spec(env, attributes)
         node = Needextract("", **attributes)
         self.set_source_info(node)
 
@@ -16,7 +16,7 @@ from sphinx_needs.data import (
     SphinxNeedsData,
 )
 from sphinx_needs.debug import measure_time
-from sphinx_needs.filter_common import FilterBase
+from sphinx_needs.filter_common import FilterBase, add_filter_spec
 from sphinx_needs.logging import get_logger, log_warning
 from sphinx_needs.utils import (
     add_doc,
@@ -238,6 +238,10 @@ class NeedflowDirective(FilterBase):
             **self.collect_filter_attributes(),
         }
 
+        if not attributes["root_id"]:
+            # a flow from a root need filters only the needs found from the root
+            add_filter_spec(self.env, attributes)
+
         # TODO currently the engines handle captions differently
         # I think plantuml should use the same "standard" approach as graphviz
 
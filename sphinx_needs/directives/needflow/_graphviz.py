@@ -2,8 +2,9 @@ from __future__ import annotations
 
 import html
 import textwrap
-from collections.abc import Callable
-from functools import cache
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from functools import cache, partial
 from typing import Literal
 from urllib.parse import urlparse
 
@@ -19,11 +20,14 @@ from sphinx.util.logging import getLogger
 from sphinx_needs.config import NeedsSphinxConfig
 from sphinx_needs.data import SphinxNeedsData
 from sphinx_needs.debug import measure_time
+from sphinx_needs.diagram_cache import GeneratedDiagram, generate_diagram
+from sphinx_needs.diagrams_common import DiagramWriter
 from sphinx_needs.directives.needflow._directive import NeedflowGraphiz
 from sphinx_needs.directives.utils import no_needs_found_paragraph, report_max_items
 from sphinx_needs.errors import NoUri
 from sphinx_needs.logging import log_warning
 from sphinx_needs.need_item import NeedItem, NeedPartItem
+from sphinx_needs.needs_schema import LinkSchema
 from sphinx_needs.utils import remove_node_from_tree
 
 from ._model import (
@@ -83,83 +87,42 @@ def process_needflow_graphviz(
             location=node,
         )
 
-        graph = build_graph(
+        diagram = generate_diagram(
             app,
-            attributes,
-            allowed_link_types,
-            location=node,
-            variant_location=node,
+            "needflow_graphviz",
+            fromdocname,
+            dict(attributes),
+            partial(
+                _generate_graphviz,
+                app,
+                node,
+                fromdocname,
+                allowed_link_types,
+                needs_config,
+            ),
         )
 
         # this check used to run before the `max_items` cap, which the model now applies;
         # the verdict is the same either way, because `apply_max_items` either returns the
         # needs unchanged or truncates them to a limit of at least one, so it can never
         # turn a non-empty result into an empty one
-        if not graph.needs:
+        if not diagram.text:
             node.replace_self(
                 no_needs_found_paragraph(attributes.get("filter_warning"))
             )
             continue
 
-        if len(graph.needs) < graph.total_needs:
+        if diagram.shown_needs < diagram.total_needs:
             para = report_max_items(
-                len(graph.needs),
-                graph.total_needs,
+                diagram.shown_needs,
+                diagram.total_needs,
                 origin="needflow",
                 location=node,
             )
             # add the paragraph to after the surrounding figure
             node.parent.parent.insert(node.parent.parent.index(node.parent) + 1, para)
 
-        content = "digraph needflow {\ncompound=true;\n"
-
-        # global settings
-        for key, value in attributes["graphviz_style"].get("root", {}).items():
-            content += f"{key}={_quote(str(value))};\n"
-        for etype in ("graph", "node", "edge"):
-            if etype in attributes["graphviz_style"]:
-                content += f"{etype} [\n"
-                for key, value in attributes["graphviz_style"][etype].items():
-                    content += f"  {key}={_quote(str(value))};\n"
-                content += "]\n"
-
-        # the config blob is a preamble of defaults, so the direction is written after
-        # all of it and wins -- including after the `graph [...]` block, since a graph
-        # attribute statement overrides an earlier one and that is where the shipped
-        # `lefttoright`/`toptobottom` configs put their `rankdir`.
-        # Nothing is written for a diagram already drawn the way it asks to be.
-        if (
-            rankdir := graphviz_rankdir(graph.direction, graph.config_direction)
-        ) is not None:
-            content += f"rankdir={_quote(rankdir)};\n"
-
-        # calculate node definitions
-        content += "\n// node definitions\n"
-        cluster_ids: dict[str, str | None] = {}
-        """A mapping of node id_complete to the cluster id if the node is a subgraph, else None."""
-        for root in graph.roots:
-            content += _render_node(
-                root,
-                node,
-                lambda n: _get_link_to_need(app, fromdocname, n),
-                cluster_ids,
-            )
-
-        # calculate edge definitions
-        content += "\n// edge definitions\n"
-        for edge in graph.edges:
-            content += _render_edge(edge, graph.link_labels, cluster_ids)
-
-        # note this lists only the need types that were actually drawn, whereas the
-        # plantuml engine lists every configured type, so the same bare `:show_legend:`
-        # gives the two engines different legends; it is kept as is
-        if graph.legend is not None and graph.legend.internal:
-            content += _create_legend(
-                [drawn.need for drawn in graph.nodes.values()], needs_config
-            )
-
-        content += "}"
-
+        content = diagram.text
         node["resolved_content"] = content
 
         if attributes["debug"]:
@@ -170,15 +133,98 @@ def process_needflow_graphviz(
             # add the debug code to after the surrounding figure
             node.parent.parent.insert(node.parent.parent.index(node.parent) + 1, code)
 
-        # ...and beside it otherwise, as a document table identical on every engine;
-        # inserted last so that it ends up directly below the figure it describes
-        if graph.legend is not None and not graph.legend.internal:
-            for legend in create_legend_nodes(
-                graph.legend.parts, graph.drawn_types, graph.drawn_link_types
-            ):
-                node.parent.parent.insert(
-                    node.parent.parent.index(node.parent) + 1, legend
-                )
+        # a legend not drawn inside the diagram, as a document table identical on every
+        # engine; inserted last so that it ends up directly below the figure it describes
+        for legend in diagram.nodes:
+            node.parent.parent.insert(node.parent.parent.index(node.parent) + 1, legend)
+
+
+def _generate_graphviz(
+    app: Sphinx,
+    node: NeedflowGraphiz,
+    fromdocname: str,
+    allowed_link_types: list[LinkSchema],
+    needs_config: NeedsSphinxConfig,
+) -> GeneratedDiagram:
+    """Filter the needs of a needflow and generate its graphviz source.
+
+    :return: The diagram, without source if no needs were found,
+        and with the legend tables to place beside it, if the legend is not drawn inside.
+    """
+    attributes = node.attributes
+    graph = build_graph(
+        app,
+        attributes,
+        allowed_link_types,
+        location=node,
+        variant_location=node,
+    )
+    if not graph.needs:
+        return GeneratedDiagram("", total_needs=graph.total_needs)
+
+    writer = _DotWriter()
+    writer.line("digraph needflow {")
+    writer.line("compound=true;")
+
+    # global settings
+    for key, value in attributes["graphviz_style"].get("root", {}).items():
+        writer.line(f"{key}={_quote(str(value))};")
+    for etype in ("graph", "node", "edge"):
+        if etype in attributes["graphviz_style"]:
+            writer.line(f"{etype} [")
+            with writer.indented():
+                for key, value in attributes["graphviz_style"][etype].items():
+                    writer.line(f"{key}={_quote(str(value))};")
+            writer.line("]")
+
+    # the config blob is a preamble of defaults, so the direction is written after
+    # all of it and wins -- including after the `graph [...]` block, since a graph
+    # attribute statement overrides an earlier one and that is where the shipped
+    # `lefttoright`/`toptobottom` configs put their `rankdir`.
+    # Nothing is written for a diagram already drawn the way it asks to be.
+    if (
+        rankdir := graphviz_rankdir(graph.direction, graph.config_direction)
+    ) is not None:
+        writer.line(f"rankdir={_quote(rankdir)};")
+
+    # calculate node definitions
+    writer.line()
+    writer.line("// node definitions")
+    cluster_ids: dict[str, str | None] = {}
+    """A mapping of node id_complete to the cluster id if the node is a subgraph, else None."""
+    for root in graph.roots:
+        _render_node(
+            writer,
+            root,
+            node,
+            lambda n: _get_link_to_need(app, fromdocname, n),
+            cluster_ids,
+        )
+
+    # calculate edge definitions
+    writer.line()
+    writer.line("// edge definitions")
+    for edge in graph.edges:
+        _render_edge(writer, edge, graph.link_labels, cluster_ids)
+
+    # note this lists only the need types that were actually drawn, whereas the
+    # plantuml engine lists every configured type, so the same bare `:show_legend:`
+    # gives the two engines different legends; it is kept as is
+    if graph.legend is not None and graph.legend.internal:
+        writer.write(
+            _create_legend([drawn.need for drawn in graph.nodes.values()], needs_config)
+        )
+
+    writer.write("}")
+
+    legend_nodes: list[nodes.Element] = []
+    if graph.legend is not None and not graph.legend.internal:
+        legend_nodes = create_legend_nodes(
+            graph.legend.parts, graph.drawn_types, graph.drawn_link_types
+        )
+    return GeneratedDiagram(
+        writer.getvalue(), len(graph.needs), graph.total_needs, legend_nodes
+    )
 
 
 def _get_link_to_need(
@@ -211,15 +257,47 @@ def _quote(text: str) -> str:
     return '"' + text.replace('"', '\\"') + '"'
 
 
+class _DotWriter(DiagramWriter):
+    """Writes the statements of a graphviz diagram."""
+
+    __slots__ = ()
+
+    def node(self, id: str, params: Iterable[tuple[str, str]]) -> None:
+        """Write a node statement."""
+        param_str = ", ".join(f"{key}={value}" for key, value in params)
+        self.line(f"{_quote(id)} [{param_str}];")
+
+    def edge(
+        self, source_id: str, target_id: str, params: Iterable[tuple[str, str]]
+    ) -> None:
+        """Write an edge statement."""
+        param_str = ", ".join(f"{key}={value}" for key, value in params)
+        self.line(f"{_quote(source_id)} -> {_quote(target_id)} [{param_str}];")
+
+    @contextmanager
+    def cluster(self, id: str, params: Iterable[tuple[str, str]]) -> Iterator[None]:
+        """Write a cluster subgraph, whose content is written within the context."""
+        self.line(f"subgraph {_quote(id)} {{")
+        with self.indented():
+            for key, value in params:
+                self.line(f"{key}={value};")
+            self.line()
+            yield
+        self.line()
+        self.line("};")
+
+
 def _render_node(
+    writer: _DotWriter,
     drawn: GraphNode,
     node: NeedflowGraphiz,
     calc_link: Callable[[NeedItem | NeedPartItem], str | None],
     cluster_ids: dict[str, str | None],
     subgraph: bool = True,
-) -> str:
+) -> None:
     """Render a node in the graphviz format.
 
+    :param writer: The writer of the diagram, to write the node to.
     :param drawn: The node to render, carrying its resolved presentation.
     :param node: The needflow node, for the graphviz style of the whole diagram.
     :param calc_link: How to compute the link target of a need.
@@ -229,7 +307,8 @@ def _render_node(
     if subgraph and (drawn.parts or drawn.children):
         # graphviz cannot nest nodes,
         # so we have to create a subgraph to represent a need with parts/children
-        return _render_subgraph(drawn, node, calc_link, cluster_ids)
+        _render_subgraph(writer, drawn, node, calc_link, cluster_ids)
+        return
 
     need = drawn.need
     presentation = drawn.presentation
@@ -273,22 +352,22 @@ def _render_node(
     elif presentation.border_color:
         params.append(("color", _quote("#" + presentation.border_color)))
 
-    id = _quote(need["id_complete"])
-    param_str = ", ".join(f"{key}={value}" for key, value in params)
-    return f"{id} [{param_str}];\n"
+    writer.node(need["id_complete"], params)
 
 
 def _render_subgraph(
+    writer: _DotWriter,
     drawn: GraphNode,
     node: NeedflowGraphiz,
     calc_link: Callable[[NeedItem | NeedPartItem], str | None],
     cluster_ids: dict[str, str | None],
-) -> str:
+) -> None:
     """Render a need with parts or child needs, as a graphviz subgraph.
 
     .. note:: The shape of a need drawn as a subgraph is emitted as configured, without
        the translation (and the warning) that a plain node gets; it is kept as is.
 
+    :param writer: The writer of the diagram, to write the subgraph to.
     :param drawn: The node to render, carrying the nodes nested inside it.
     :param node: The needflow node, for the graphviz style of the whole diagram.
     :param calc_link: How to compute the link target of a need.
@@ -323,32 +402,25 @@ def _render_subgraph(
     elif presentation.border_color:
         params.append(("color", _quote("#" + presentation.border_color)))
 
-    # we need to create an invisible node to allow links to the subgraph
-    id = _quote(need["id_complete"])
-    ghost_node = f'{id} [style=invis, width=0, height=0, label=""];'
-
-    cluster_id = _quote("cluster_" + need["id_complete"])
-    param_str = "\n".join(f"  {key}={value};" for key, value in params)
-
     cluster_ids[need["id_complete"]] = "cluster_" + need["id_complete"]
 
-    # note the comments are written according to the need itself, not to what is drawn,
-    # so a need whose parts were all filtered out still gets the parts comment
-    children = ""
-    if need["is_need"] and need["parts"]:
-        children += "  // parts:\n"
-        for part in drawn.parts:
-            children += textwrap.indent(
-                _render_node(part, node, calc_link, cluster_ids, False), "  "
-            )
-    if need["parent_needs_back"]:
-        children += "  // child needs:\n"
-        for child in drawn.children:
-            children += textwrap.indent(
-                _render_node(child, node, calc_link, cluster_ids), "  "
-            )
+    with writer.cluster("cluster_" + need["id_complete"], params):
+        # we need to create an invisible node to allow links to the subgraph
+        writer.node(
+            need["id_complete"],
+            [("style", "invis"), ("width", "0"), ("height", "0"), ("label", '""')],
+        )
 
-    return f"subgraph {cluster_id} {{\n{param_str}\n\n  {ghost_node}\n{children}\n}};\n"
+        # note the comments are written according to the need itself, not to what is drawn,
+        # so a need whose parts were all filtered out still gets the parts comment
+        if need["is_need"] and need["parts"]:
+            writer.line("// parts:")
+            for part in drawn.parts:
+                _render_node(writer, part, node, calc_link, cluster_ids, False)
+        if need["parent_needs_back"]:
+            writer.line("// child needs:")
+            for child in drawn.children:
+                _render_node(writer, child, node, calc_link, cluster_ids)
 
 
 def _label(
@@ -389,19 +461,21 @@ def _label(
 
 
 def _render_edge(
+    writer: _DotWriter,
     edge: GraphEdge,
     link_labels: LinkLabels,
     cluster_ids: dict[str, str | None],
-) -> str:
+) -> None:
     """Render an edge in the graphviz format.
 
+    :param writer: The writer of the diagram, to write the edge to.
     :param edge: The edge to render.
     :param link_labels: What to label the edge with, if anything.
     :param cluster_ids: The cluster ids collected by :func:`_render_node`.
     """
     if not (edge.source_drawn and edge.target_drawn):
         # if the start or end node is not rendered, we should not create a link
-        return ""
+        return
 
     params: list[tuple[str, str]] = []
 
@@ -417,18 +491,15 @@ def _render_edge(
         )
     )
 
-    start_id = _quote(edge.source_id)
     if (ltail := cluster_ids[edge.source_id]) is not None:
         # the need has been created as a subgraph and so we also need to create a logical link to the cluster
         params.append(("ltail", _quote(ltail)))
 
-    end_id = _quote(edge.target_id)
     if (lhead := cluster_ids[edge.target_id]) is not None:
         # the end need has been created as a subgraph and so we also need to create a logical link to the cluster
         params.append(("lhead", _quote(lhead)))
 
-    param_str = ", ".join(f"{key}={value}" for key, value in params)
-    return f"{start_id} -> {end_id} [{param_str}];\n"
+    writer.edge(edge.source_id, edge.target_id, params)
 
 
 @cache
@@ -18,7 +18,6 @@ implementations rather than designed semantics.  They are preserved deliberately
 this module exists to make the two engines share one implementation, not to change what
 either of them draws -- and are called out at the point where they happen:
 
-- :func:`filter_by_tree` walks depth first, so ``root_depth`` depends on traversal order.
 - ``parent_needs`` is dropped from the allowed link types *before* the root walk, so
   ``root_id`` never follows the need hierarchy.
 - The root walk runs before the filter, not after it.
@@ -73,41 +72,12 @@ def filter_by_tree(
     """Filter all needs by the given ``root_id``,
     and all needs that are connected to the root need by the given ``link_types``, in the given ``direction``.
 
-    .. note:: The frontier is a dict popped from the end, i.e. the walk is depth first,
-       and the first visit of a need wins.  A need reachable at two different depths can
-       therefore be recorded at the deeper one and have its subtree pruned by ``depth``.
-       This makes ``root_depth`` dependent on traversal order; it is kept as is.
+    The walk is breadth first, so a need is reached at its shortest distance from the root,
+    and it uses the link index shared by all views of the needs,
+    so that the same walk is only computed once per build.
+    The needs keep the order of ``needs_view``, whatever the order they are reached in.
     """
-    if root_id not in needs_view:
-        return needs_view.filter_ids([])
-    roots = {root_id: (0, needs_view[root_id])}
-    link_prefixes = (
-        ("_back",)
-        if direction == "incoming"
-        else ("",)
-        if direction == "outgoing"
-        else ("", "_back")
-    )
-    links_to_process = [link + d for link in link_names for d in link_prefixes]
-
-    need_ids: list[str] = []
-    while roots:
-        root_id, (root_depth, root) = roots.popitem()
-        if root_id in need_ids:
-            continue
-        if depth is not None and root_depth > depth:
-            continue
-        need_ids.append(root_id)
-        for link_type_name in links_to_process:
-            roots.update(
-                {
-                    i: (root_depth + 1, needs_view[i])
-                    for i in root.get(link_type_name, [])
-                    if i in needs_view
-                }
-            )
-
-    return needs_view.filter_ids(need_ids)
+    return needs_view.filter_reachable(root_id, link_names, direction, depth)
 
 
 def resolve_color(value: None | str | int | float | bool) -> str | None:
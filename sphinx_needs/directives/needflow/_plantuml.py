@@ -1,15 +1,19 @@
 from __future__ import annotations
 
 from collections.abc import Iterable, Mapping
+from functools import partial
 
 from docutils import nodes
 from sphinx.application import Sphinx
 
-from sphinx_needs._jinja import render_template_string
+from sphinx_needs._jinja import compile_template
 from sphinx_needs.config import NeedsSphinxConfig
 from sphinx_needs.data import NeedsFlowType, SphinxNeedsData
 from sphinx_needs.debug import measure_time
+from sphinx_needs.diagram_cache import GeneratedDiagram, generate_diagram
 from sphinx_needs.diagrams_common import (
+    DiagramWriter,
+    add_config,
     calculate_link,
     create_legend,
     set_plantuml_paths,
@@ -17,6 +21,7 @@ from sphinx_needs.diagrams_common import (
 from sphinx_needs.directives.needflow._directive import NeedflowPlantuml
 from sphinx_needs.directives.utils import no_needs_found_paragraph, report_max_items
 from sphinx_needs.logging import get_logger, log_warning
+from sphinx_needs.needs_schema import LinkSchema
 from sphinx_needs.utils import remove_node_from_tree
 
 from ._model import (
@@ -106,11 +111,9 @@ def get_need_node_rep_for_plantuml(
     need_info = graph_node.need
     presentation = graph_node.presentation
 
-    node_text = render_template_string(
-        needs_config.diagram_template,
-        {**need_info.filter_context(), **needs_config.render_context},
-        autoescape=False,
-    )
+    node_text = compile_template(
+        needs_config.diagram_template, autoescape=False
+    ).render({**need_info.filter_context(), **needs_config.render_context})
 
     node_link = calculate_link(app, need_info, fromdocname)
 
@@ -138,11 +141,12 @@ def get_need_node_rep_for_plantuml(
 
 
 def walk_curr_need_tree(
+    writer: DiagramWriter,
     app: Sphinx,
     fromdocname: str,
     graph_node: GraphNode,
     entity_names: Mapping[str, str],
-) -> str:
+) -> None:
     """Emit the need parts and child needs of a need, as a nested plantuml block.
 
     .. note:: Whether a block is opened, and whether each comment is written, is decided
@@ -150,69 +154,67 @@ def walk_curr_need_tree(
        children were all filtered out therefore still gets an (empty) block; it is kept
        as is.
 
+    :param writer: The writer of the diagram, to emit the block to.
     :param graph_node: The node whose nested nodes are to be emitted.
     :param entity_names: The id to entity name mapping of :func:`make_entity_names`.
     """
     need = graph_node.need
-    curr_need_tree = ""
 
     if not need["parts"] and not need["parent_needs_back"]:
-        return curr_need_tree
+        return
 
     # We do have embedded needs or need parts, so we will add a open "{"
-    curr_need_tree += "{\n"
+    writer.write("{\n")
 
     if need["is_need"] and need["parts"]:
         # add comment for easy debugging
-        curr_need_tree += "'parts:\n"
+        writer.write("'parts:\n")
         for part_node in graph_node.parts:
-            curr_need_tree += (
+            writer.write(
                 get_need_node_rep_for_plantuml(
                     app, fromdocname, part_node, entity_names
                 )
-                + "\n"
             )
+            writer.write("\n")
 
     # check if curr need has children
     if need["parent_needs_back"]:
         # add comment for easy debugging
-        curr_need_tree += "'child needs:\n"
+        writer.write("'child needs:\n")
         # walk through all child needs one by one
         for child_node in graph_node.children:
-            curr_need_tree += get_need_node_rep_for_plantuml(
-                app, fromdocname, child_node, entity_names
-            )
-            curr_need_tree += walk_curr_need_tree(
-                app, fromdocname, child_node, entity_names
+            writer.write(
+                get_need_node_rep_for_plantuml(
+                    app, fromdocname, child_node, entity_names
+                )
             )
+            walk_curr_need_tree(writer, app, fromdocname, child_node, entity_names)
             # add newline for next element
-            curr_need_tree += "\n"
+            writer.write("\n")
 
     # We processed embedded needs or need parts, so we will close with "}"
-    curr_need_tree += "}"
-
-    return curr_need_tree
+    writer.write("}")
 
 
 def cal_needs_node(
+    writer: DiagramWriter,
     app: Sphinx,
     fromdocname: str,
     graph: NeedflowGraph,
     entity_names: Mapping[str, str],
-) -> str:
+) -> None:
     """Emit the plantuml node definitions of a whole diagram.
 
+    :param writer: The writer of the diagram, to emit the definitions to.
     :param graph: The graph to emit.
     :param entity_names: The id to entity name mapping of :func:`make_entity_names`.
     """
-    curr_need_tree = ""
     for root in graph.roots:
-        curr_need_tree += (
+        writer.write(
             get_need_node_rep_for_plantuml(app, fromdocname, root, entity_names)
-            + walk_curr_need_tree(app, fromdocname, root, entity_names)
-            + "\n"
         )
-    return curr_need_tree
+        walk_curr_need_tree(writer, app, fromdocname, root, entity_names)
+        writer.write("\n")
 
 
 @measure_time("needflow_plantuml")
@@ -259,16 +261,22 @@ def process_needflow_plantuml(
 
         content: list[nodes.Element] = []
 
-        graph = build_graph(
+        diagram = generate_diagram(
             app,
-            current_needflow,
-            allowed_link_types,
-            location=node,
-            variant_location=(current_needflow["docname"], current_needflow["lineno"]),
+            "needflow_plantuml",
+            fromdocname,
+            dict(current_needflow),
+            partial(
+                _generate_plantuml,
+                app,
+                node,
+                fromdocname,
+                allowed_link_types,
+                needs_config,
+            ),
         )
-        found_needs = graph.needs
 
-        if found_needs:
+        if diagram.text:
             plantuml_block_text = ".. plantuml::\n\n   @startuml   @enduml"
             puml_node = plantuml(plantuml_block_text)
             # TODO if an alt is not set then sphinxcontrib.plantuml uses the plantuml source code as alt text.
@@ -280,48 +288,7 @@ def process_needflow_plantuml(
             puml_node.line = current_needflow["lineno"]
             puml_node.source = env.doc2path(current_needflow["docname"])
 
-            puml_node["uml"] = "@startuml\n"
-
-            # Adding config
-            config = current_needflow["config"]
-            if config and len(config) >= 3:
-                # Remove all empty lines
-                config = "\n".join(
-                    [line.strip() for line in config.split("\n") if line.strip()]
-                )
-                puml_node["uml"] += "\n' Config\n\n"
-                puml_node["uml"] += config
-                puml_node["uml"] += "\n\n"
-
-            # the config blob is a preamble of defaults, so the direction is written
-            # after it and wins; nothing is written for a diagram already drawn that way
-            if (
-                direction := plantuml_direction(
-                    graph.direction, graph.config_direction, location=node
-                )
-            ) is not None:
-                puml_node["uml"] += f"\n' Direction\n\n{direction}\n"
-
-            # the entity names must be assigned for the whole diagram at once,
-            # so that ids sanitising to the same name stay distinct nodes
-            entity_names = make_entity_names(
-                need["id_complete"] for need in found_needs
-            )
-
-            puml_node["uml"] += "\n' Nodes definition \n\n"
-            puml_node["uml"] += cal_needs_node(app, fromdocname, graph, entity_names)
-
-            puml_node["uml"] += "\n' Connection definition \n\n"
-            puml_node["uml"] += render_connections(graph, entity_names)
-
-            # Create a legend, inside the diagram where that is what was asked for
-            # note this lists every configured need type, whereas the graphviz engine
-            # lists only the types it actually drew, so the same bare `:show_legend:`
-            # gives the two engines different legends; it is kept as is
-            if graph.legend is not None and graph.legend.internal:
-                puml_node["uml"] += create_legend(needs_config.types)
-
-            puml_node["uml"] += "\n@enduml"
+            puml_node["uml"] = diagram.text
             set_plantuml_paths(puml_node, env, current_needflow["docname"])
 
             scale = int(current_needflow["scale"])
@@ -368,23 +335,18 @@ def process_needflow_plantuml(
             puml_node.line = current_needflow["lineno"]
 
             content.append(puml_node)
-            # ...and beside it otherwise, as a document table identical on every engine
-            if graph.legend is not None and not graph.legend.internal:
-                content.extend(
-                    create_legend_nodes(
-                        graph.legend.parts, graph.drawn_types, graph.drawn_link_types
-                    )
-                )
+            # a legend not drawn inside the diagram, as a document table identical on every engine
+            content.extend(diagram.nodes)
         else:  # no needs found
             content.append(
                 no_needs_found_paragraph(current_needflow.get("filter_warning"))
             )
 
-        if len(found_needs) < graph.total_needs:
+        if diagram.shown_needs < diagram.total_needs:
             content.append(
                 report_max_items(
-                    len(found_needs),
-                    graph.total_needs,
+                    diagram.shown_needs,
+                    diagram.total_needs,
                     origin="needflow",
                     location=node,
                 )
@@ -396,7 +358,7 @@ def process_needflow_plantuml(
 
         # We have to restrustructer the needflow
         # If this block should be organized differently
-        if current_needflow["debug"] and found_needs:
+        if current_needflow["debug"] and diagram.text:
             # We can only access puml_node if found_needs is set.
             # Otherwise it was not been set, or we get outdated data
             if isinstance(puml_node, nodes.figure):
@@ -416,17 +378,87 @@ def process_needflow_plantuml(
         node.replace_self(content)
 
 
-def render_connections(graph: NeedflowGraph, entity_names: Mapping[str, str]) -> str:
+def _generate_plantuml(
+    app: Sphinx,
+    node: NeedflowPlantuml,
+    fromdocname: str,
+    allowed_link_types: list[LinkSchema],
+    needs_config: NeedsSphinxConfig,
+) -> GeneratedDiagram:
+    """Filter the needs of a needflow and generate its PlantUML source.
+
+    :return: The diagram, without source if no needs were found,
+        and with the legend tables to place beside it, if the legend is not drawn inside.
+    """
+    current_needflow: NeedsFlowType = node.attributes
+    graph = build_graph(
+        app,
+        current_needflow,
+        allowed_link_types,
+        location=node,
+        variant_location=(current_needflow["docname"], current_needflow["lineno"]),
+    )
+    found_needs = graph.needs
+    if not found_needs:
+        return GeneratedDiagram("", total_needs=graph.total_needs)
+
+    writer = DiagramWriter()
+    writer.line("@startuml")
+
+    # Adding config
+    writer.write(add_config(current_needflow["config"]))
+
+    # the config blob is a preamble of defaults, so the direction is written
+    # after it and wins; nothing is written for a diagram already drawn that way
+    if (
+        direction := plantuml_direction(
+            graph.direction, graph.config_direction, location=node
+        )
+    ) is not None:
+        writer.write(f"\n' Direction\n\n{direction}\n")
+
+    # the entity names must be assigned for the whole diagram at once,
+    # so that ids sanitising to the same name stay distinct nodes
+    entity_names = make_entity_names(need["id_complete"] for need in found_needs)
+
+    writer.write("\n' Nodes definition \n\n")
+    cal_needs_node(writer, app, fromdocname, graph, entity_names)
+
+    writer.write("\n' Connection definition \n\n")
+    render_connections(writer, graph, entity_names)
+
+    # Create a legend, inside the diagram where that is what was asked for
+    # note this lists every configured need type, whereas the graphviz engine
+    # lists only the types it actually drew, so the same bare `:show_legend:`
+    # gives the two engines different legends; it is kept as is
+    if graph.legend is not None and graph.legend.internal:
+        writer.write(create_legend(needs_config.types))
+
+    writer.write("\n@enduml")
+
+    legend_nodes: list[nodes.Element] = []
+    if graph.legend is not None and not graph.legend.internal:
+        legend_nodes = create_legend_nodes(
+            graph.legend.parts, graph.drawn_types, graph.drawn_link_types
+        )
+    return GeneratedDiagram(
+        writer.getvalue(), len(found_needs), graph.total_needs, legend_nodes
+    )
+
+
+def render_connections(
+    writer: DiagramWriter, graph: NeedflowGraph, entity_names: Mapping[str, str]
+) -> None:
     """Emit the plantuml connections between the needs.
 
     .. note:: An edge is emitted even when one of its ends is not drawn as a node -- a
        need part whose need was filtered out, say -- in which case plantuml creates a
        bare node for it; it is kept as is.
 
+    :param writer: The writer of the diagram, to emit the connections to.
     :param graph: The graph to emit the connections of.
     :param entity_names: The id to entity name mapping of :func:`make_entity_names`.
     """
-    puml_connections = ""
     for edge in graph.edges:
         if (label := edge.label(graph.link_labels)) is not None:
             comment = f": {label}\\n"
@@ -444,5 +476,4 @@ def render_connections(graph: NeedflowGraph, entity_names: Mapping[str, str]) ->
             + edge.link_type.display.style_end
         )
         # TODO also use link_type.display.color?
-        puml_connections += f"{source} {arrow} {target}{comment}\n"
-    return puml_connections
+        writer.write(f"{source} {arrow} {target}{comment}\n")
@@ -12,6 +12,7 @@ from sphinx_needs.config import NeedsSphinxConfig
 from sphinx_needs.data import NeedsGanttType, SphinxNeedsData
 from sphinx_needs.diagrams_common import (
     DiagramBase,
+    DiagramWriter,
     add_config,
     create_legend,
     get_debug_container,
@@ -23,7 +24,12 @@ from sphinx_needs.directives.utils import (
     SphinxNeedsLinkTypeException,
     no_needs_found_paragraph,
 )
-from sphinx_needs.filter_common import FilterBase, filter_single_need, process_filters
+from sphinx_needs.filter_common import (
+    FilterBase,
+    add_filter_spec,
+    filter_single_need,
+    process_filters,
+)
 from sphinx_needs.logging import get_logger, log_warning
 from sphinx_needs.utils import add_doc, remove_node_from_tree
 
@@ -138,6 +144,7 @@ class NeedganttDirective(FilterBase, DiagramBase):
             **self.collect_diagram_attributes(),
         }
 
+        add_filter_spec(env, attributes)
         gantt_node = Needgantt("", **attributes)
         self.set_source_info(gantt_node)
 
@@ -201,11 +208,12 @@ def process_needgantt(
         puml_node.line = current_needgantt["lineno"]
         puml_node.source = env.doc2path(current_needgantt["docname"])
 
-        puml_node["uml"] = "@startgantt\n"
+        writer = DiagramWriter()
+        writer.line("@startgantt")
 
         # Adding config
         config = current_needgantt["config"]
-        puml_node["uml"] += add_config(config)
+        writer.write(add_config(config))
 
         found_needs = process_filters(
             app,
@@ -217,7 +225,7 @@ def process_needgantt(
 
         # Scale/timeline handling
         if current_needgantt["timeline"]:
-            puml_node["uml"] += "printscale {}\n".format(current_needgantt["timeline"])
+            writer.line("printscale {}".format(current_needgantt["timeline"]))
 
         # Project start date handling
         start_date_string = current_needgantt["start_date"]
@@ -234,14 +242,12 @@ def process_needgantt(
                 )
 
             # PlantUML also understands the ISO date, so it is passed through as given
-            puml_node["uml"] += "Project starts {}\n".format(
-                start_date.strftime("%Y-%m-%d")
-            )
+            writer.line("Project starts {}".format(start_date.strftime("%Y-%m-%d")))
 
         # Element handling
-        puml_node["uml"] += "\n' Elements definition \n\n"
-        el_completion_string = ""
-        el_color_string = ""
+        writer.write("\n' Elements definition \n\n")
+        el_completion = DiagramWriter()
+        el_color = DiagramWriter()
         for need in found_needs:
             complete = None
 
@@ -290,34 +296,32 @@ def process_needgantt(
             # "[...]" reference to the id; a reference to the title would not raise,
             # it would silently declare a second, zero length task of that name
             if complete:
-                el_completion_string += "[{}] is {}% completed\n".format(
-                    need["id"], complete
-                )
+                el_completion.line("[{}] is {}% completed".format(need["id"], complete))
 
             if need["type_color"]:
-                el_color_string += "[{}] is colored in {}\n".format(
-                    need["id"], need["type_color"]
+                el_color.line(
+                    "[{}] is colored in {}".format(need["id"], need["type_color"])
                 )
 
-            puml_node["uml"] += gantt_element
+            writer.write(gantt_element)
 
-        puml_node["uml"] += "\n' Element links definition \n\n"
-        puml_node["uml"] += (
-            "\n' Deactivated, as currently supported by plantuml beta only"
-        )
+        writer.write("\n' Element links definition \n\n")
+        writer.write("\n' Deactivated, as currently supported by plantuml beta only")
 
-        puml_node["uml"] += "\n' Element completion definition \n\n"
-        puml_node["uml"] += el_completion_string + "\n"
+        writer.write("\n' Element completion definition \n\n")
+        writer.write(el_completion.getvalue())
+        writer.line()
 
-        puml_node["uml"] += "\n' Element color definition \n\n"
+        writer.write("\n' Element color definition \n\n")
         if current_needgantt["no_color"]:
-            puml_node["uml"] += "' Color support deactivated via flag"
+            writer.write("' Color support deactivated via flag")
         else:
-            puml_node["uml"] += el_color_string + "\n"
+            writer.write(el_color.getvalue())
+            writer.line()
 
         # Constrain handling
-        puml_node["uml"] += "\n' Constraints definition \n\n"
-        puml_node["uml"] += "\n' Constraints definition \n\n"
+        writer.write("\n' Constraints definition \n\n")
+        writer.write("\n' Constraints definition \n\n")
         for need in found_needs:
             if current_needgantt["milestone_filter"]:
                 is_milestone = filter_single_need(
@@ -352,13 +356,14 @@ def process_needgantt(
                         gantt_constraint = "[{}] {} at [{}]'s {}\n".format(
                             need["id"], keyword, start_need["id"], start_end_sync
                         )
-                        puml_node["uml"] += gantt_constraint
+                        writer.write(gantt_constraint)
 
         # Create a legend
         if current_needgantt["show_legend"]:
-            puml_node["uml"] += create_legend(needs_config.types)
+            writer.write(create_legend(needs_config.types))
 
-        puml_node["uml"] += "\n@endgantt"
+        writer.write("\n@endgantt")
+        puml_node["uml"] = writer.getvalue()
         set_plantuml_paths(puml_node, env, current_needgantt["docname"])
 
         scale = int(current_needgantt["scale"])
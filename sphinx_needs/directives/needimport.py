@@ -1,9 +1,15 @@
 from __future__ import annotations
 
+import hashlib
 import json
+import mmap
 import os
+import pickle
 import re
-from collections.abc import Sequence
+from collections.abc import Iterable, Iterator, Sequence
+from copy import deepcopy
+from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Any
 from urllib.parse import urlparse
 
@@ -11,6 +17,8 @@ import requests
 from docutils import nodes
 from docutils.parsers.rst import directives
 from requests_file import FileAdapter
+from sphinx.application import Sphinx
+from sphinx.environment import BuildEnvironment
 from sphinx.util.docutils import SphinxDirective
 
 from sphinx_needs.api import InvalidNeedException, add_need
@@ -20,7 +28,12 @@ from sphinx_needs.debug import measure_time
 from sphinx_needs.filter_common import filter_import_item
 from sphinx_needs.logging import log_warning
 from sphinx_needs.need_item import NeedItemSourceImport
-from sphinx_needs.needsfile import SphinxNeedsFileException, check_needs_data
+from sphinx_needs.needsfile import (
+    NeedsFileReader,
+    SphinxNeedsFileException,
+    check_needs_data,
+    format_schema_error,
+)
 from sphinx_needs.utils import (
     add_doc,
     coerce_to_boolean,
@@ -76,17 +89,7 @@ class NeedimportDirective(SphinxDirective):
         if url.scheme and url.netloc:
             # download needs.json
             logger.info(f"Downloading needs.json from url {need_import_path}")
-            s = requests.Session()
-            s.mount("file://", FileAdapter())
-            try:
-                response = s.get(need_import_path)
-                needs_import_list = (
-                    response.json()
-                )  # The downloaded file MUST be json. Everything else we do not handle!
-            except Exception as e:
-                raise NeedimportException(
-                    f"Getting {need_import_path} didn't work. Reason: {e}."
-                )
+            source = _load_import_url(need_import_path)
         else:
             logger.info(f"Importing needs from {need_import_path}")
 
@@ -110,25 +113,19 @@ class NeedimportDirective(SphinxDirective):
                 warning += paragraph
                 return [warning]
 
+            # the file is parsed and validated once per build,
+            # and then shared by all needimport directives that import from it
             try:
-                with open(correct_need_import_path) as needs_file:
-                    needs_import_list = json.load(needs_file)
+                source = _load_import_file(
+                    correct_need_import_path, Path(self.env.doctreedir, "needimport")
+                )
             except (OSError, json.JSONDecodeError) as e:
                 # TODO: Add exception handling
                 raise SphinxNeedsFileException(correct_need_import_path) from e
 
             self.env.note_dependency(correct_need_import_path)
 
-            errors = check_needs_data(needs_import_list)
-            if errors.schema:
-                logger.info(
-                    f"Schema validation errors detected in file {correct_need_import_path}:"
-                )
-                for error in errors.schema:
-                    logger.info(
-                        f"  {error.message} -> {'.'.join(str(p) for p in error.instance_path)}"
-                    )
-
+        needs_import_list = source.data
         if version is None:
             try:
                 version = needs_import_list["current_version"]
@@ -145,14 +142,11 @@ class NeedimportDirective(SphinxDirective):
 
         data = needs_import_list["versions"][version]
 
+        id_list: list[str] | None = None
         if ids := self.options.get("ids"):
             id_list = [i.strip() for i in ids.split(",") if i.strip()]
-            data["needs"] = {
-                key: data["needs"][key] for key in id_list if key in data["needs"]
-            }
 
-        # note this is not exactly NeedsInfoType, because the export removes/adds some keys
-        needs_list: dict[str, dict[str, Any]] = data["needs"]
+        defaults: dict[str, Any] = {}
         if schema := data.get("needs_schema"):
             # Set defaults from schema
             defaults = {
@@ -160,33 +154,34 @@ class NeedimportDirective(SphinxDirective):
                 for name, value in schema["properties"].items()
                 if "default" in value
             }
-            needs_list = {
-                key: {**defaults, **value} for key, value in needs_list.items()
-            }
 
-        # Filter imported needs
-        needs_list_filtered = {}
-        for key, need in needs_list.items():
-            if filter_string is None:
-                needs_list_filtered[key] = need
-            else:
-                filter_context = need.copy()
-
-                if "description" in need and not need.get("content"):
-                    # legacy versions of sphinx-needs changed "description" to "content" when outputting to json
-                    filter_context["content"] = need["description"]
-                try:
-                    if filter_import_item(filter_context, needs_config, filter_string):
-                        needs_list_filtered[key] = need
-                except Exception as e:
-                    log_warning(
-                        logger,
-                        f"needimport: Filter {filter_string} not valid. Error: {e}. {self.docname}{self.lineno}",
-                        "needimport",
-                        location=(self.env.docname, self.lineno),
-                    )
-
-        needs_list = needs_list_filtered
+        # Select and filter imported needs, one at a time
+        # note this is not exactly NeedsInfoType, because the export removes/adds some keys
+        needs_list: dict[str, dict[str, Any]] = {}
+        try:
+            for key, raw_need in source.iter_needs(version, id_list):
+                need = {**defaults, **raw_need} if defaults else raw_need
+                if filter_string is not None and not self._filter_import_need(
+                    need, needs_config, filter_string
+                ):
+                    continue
+                # the parsed needs are shared with other directives, so are copied before modification
+                needs_list[key] = deepcopy(need)
+        except (OSError, json.JSONDecodeError) as e:
+            raise SphinxNeedsFileException(correct_need_import_path) from e
+
+        # only report validation errors of the needs that are imported
+        if errors := [
+            message
+            for error_version, need_id, message in source.errors
+            if error_version is None
+            or (error_version == version and need_id in needs_list)
+        ]:
+            logger.info(
+                f"Schema validation errors detected in file {correct_need_import_path}:"
+            )
+            for message in errors:
+                logger.info(f"  {message}")
 
         # tags update
         if tags := [
@@ -293,6 +288,26 @@ class NeedimportDirective(SphinxDirective):
 
         return need_nodes
 
+    def _filter_import_need(
+        self, need: dict[str, Any], needs_config: NeedsSphinxConfig, filter_string: str
+    ) -> bool:
+        """Check if an imported need passes the filter, warning if the filter is invalid."""
+        filter_context = need.copy()
+
+        if "description" in need and not need.get("content"):
+            # legacy versions of sphinx-needs changed "description" to "content" when outputting to json
+            filter_context["content"] = need["description"]
+        try:
+            return filter_import_item(filter_context, needs_config, filter_string)
+        except Exception as e:
+            log_warning(
+                logger,
+                f"needimport: Filter {filter_string} not valid. Error: {e}. {self.docname}{self.lineno}",
+                "needimport",
+                location=(self.env.docname, self.lineno),
+            )
+            return False
+
     @property
     def docname(self) -> str:
         return self.env.docname
@@ -308,3 +323,226 @@ class CorruptedNeedsFile(BaseException):
 
 class NeedimportException(BaseException):
     pass
+
+
+_DECODED_LIMIT = 64 << 20
+"""Up to this size (in bytes of JSON), the needs of an imported version are kept decoded in memory."""
+
+
+@dataclass(slots=True)
+class _ImportedVersion:
+    """The needs of one version of an import source."""
+
+    index: dict[str, tuple[int, int]]
+    """Mapping of need id to the ``(offset, length)`` of its JSON in the needs file."""
+    size: int
+    """The total size of the needs in the needs file."""
+    decoded: dict[str, Any] | None = None
+    """The decoded needs, if they are kept in memory."""
+
+
+@dataclass(slots=True)
+class _ImportSource:
+    """A needs.json file or URL, parsed and validated once per build.
+
+    For files, the needs of all versions are written, one after another,
+    as JSON to a separate needs file, that is memory mapped to read single needs.
+    Together with a pickled index, this is cached in the doctree directory,
+    so that parallel read workers do not have to parse the file again.
+    """
+
+    data: dict[str, Any]
+    """The top-level data, with the ``needs`` of each version replaced by their number
+    (unless it was downloaded)."""
+    needs_path: str | None
+    versions: dict[str, _ImportedVersion]
+    errors: list[tuple[str | None, str | None, str]] = field(default_factory=list)
+    """Schema validation messages, as ``(version, need id, message)``.
+    Version and id are ``None`` for errors outside of a need."""
+    validators: dict[str, str] = field(default_factory=dict)
+    """The HTTP headers for a conditional request, if downloaded."""
+
+    def iter_needs(
+        self, version: str, ids: Sequence[str] | None = None
+    ) -> Iterator[tuple[str, Any]]:
+        """Yield the ``(id, need)`` pairs of a version,
+        in the order of the file, or in the order of ``ids``.
+
+        The needs may be shared between calls, and so must not be modified.
+        """
+        imported = self.versions.get(version)
+        if imported is None:
+            return
+        if imported.decoded is None and imported.size <= _DECODED_LIMIT:
+            imported.decoded = dict(self._read(imported, imported.index))
+        if imported.decoded is not None:
+            if ids is None:
+                yield from imported.decoded.items()
+            else:
+                yield from (
+                    (id, imported.decoded[id])
+                    for id in dict.fromkeys(ids)
+                    if id in imported.decoded
+                )
+            return
+        yield from self._read(
+            imported,
+            imported.index
+            if ids is None
+            else [id for id in dict.fromkeys(ids) if id in imported.index],
+        )
+
+    def _read(
+        self, imported: _ImportedVersion, ids: Iterable[str]
+    ) -> Iterator[tuple[str, Any]]:
+        """Decode needs from the needs file."""
+        if not imported.index or self.needs_path is None:
+            return
+        with (
+            open(self.needs_path, "rb") as f,
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer,
+        ):
+            for id in ids:
+                offset, length = imported.index[id]
+                yield id, json.loads(buffer[offset : offset + length])
+
+
+_import_sources: dict[tuple[str, ...], _ImportSource] = {}
+"""The import sources of the current build, by path and modification, or URL."""
+
+
+def clear_import_sources(_app: Sphinx, _env: BuildEnvironment) -> None:
+    """Release the import sources, once all documents have been read."""
+    _import_sources.clear()
+
+
+def _load_import_file(path: str, cache_dir: Path) -> _ImportSource:
+    """Load an import source from a needs.json file.
+
+    The file is only parsed, if it has not already been parsed in this build,
+    by this or another process, since it was last modified.
+
+    :raises OSError: If the file cannot be read.
+    :raises json.JSONDecodeError: If the file is not valid JSON.
+    """
+    stat = os.stat(path)
+    path = os.path.abspath(path)
+    key = (path, str(stat.st_mtime_ns), str(stat.st_size))
+    if (source := _import_sources.get(key)) is not None:
+        return source
+
+    path_digest = hashlib.blake2b(path.encode(), digest_size=16).hexdigest()
+    key_digest = hashlib.blake2b(repr(key).encode(), digest_size=8).hexdigest()
+    index_path = cache_dir / f"{path_digest}.{key_digest}.index"
+    needs_path = index_path.with_suffix(".needs")
+
+    try:
+        with index_path.open("rb") as f:
+            source = pickle.load(f)
+    except Exception:
+        source = None
+    if not isinstance(source, _ImportSource) or not needs_path.exists():
+        source = _parse_import_file(path, index_path, needs_path)
+
+    _import_sources[key] = source
+    return source
+
+
+def _parse_import_file(path: str, index_path: Path, needs_path: Path) -> _ImportSource:
+    """Parse and validate a needs.json file, and write it to the cache directory."""
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    # other processes may write the same files concurrently,
+    # so each writes to its own temporary file, and replaces the target once complete
+    temp_suffix = f".{os.getpid()}.tmp"
+    temp_needs_path = needs_path.with_name(needs_path.name + temp_suffix)
+
+    versions: dict[str, _ImportedVersion] = {}
+    errors: list[tuple[str | None, str | None, str]] = []
+
+    with temp_needs_path.open("wb") as needs_file:
+
+        def _add_need(version: str, need_id: str, need: Any) -> None:
+            encoded = json.dumps(need).encode("utf8")
+            imported = versions.setdefault(version, _ImportedVersion({}, 0))
+            imported.index[need_id] = (needs_file.tell(), len(encoded))
+            imported.size += len(encoded)
+            needs_file.write(encoded)
+            # validate each need on its own, so that they do not need to be held in memory
+            for error in check_needs_data(
+                {"versions": {version: {"needs": {need_id: need}}}}
+            ).schema:
+                if len(error.instance_path) >= 4:
+                    errors.append((version, need_id, format_schema_error(error)))
+
+        try:
+            header, summaries = NeedsFileReader(path).read_summary(_add_need)
+        except BaseException:
+            needs_file.close()
+            temp_needs_path.unlink(missing_ok=True)
+            raise
+
+    data = {**header, "versions": summaries}
+    # the needs are replaced by their number in the summary, which is still valid for the schema
+    errors[:0] = (
+        (None, None, format_schema_error(error))
+        for error in check_needs_data(data).schema
+    )
+    source = _ImportSource(
+        data=data, needs_path=str(needs_path), versions=versions, errors=errors
+    )
+
+    temp_needs_path.replace(needs_path)
+    temp_index_path = index_path.with_name(index_path.name + temp_suffix)
+    with temp_index_path.open("wb") as f:
+        pickle.dump(source, f, pickle.HIGHEST_PROTOCOL)
+    temp_index_path.replace(index_path)
+
+    # remove the files of previous modifications
+    for other in index_path.parent.glob(f"{index_path.name.split('.')[0]}.*"):
+        if other not in (index_path, needs_path) and not other.name.endswith(".tmp"):
+            other.unlink(missing_ok=True)
+
+    return source
+
+
+def _load_import_url(url: str) -> _ImportSource:
+    """Load an import source from a URL.
+
+    The source is downloaded once per build,
+    and only downloaded again if the server reports that it has changed since.
+    """
+    cached = _import_sources.get((url,))
+    if cached is not None and not cached.validators:
+        return cached
+
+    s = requests.Session()
+    s.mount("file://", FileAdapter())
+    try:
+        response = s.get(url, headers=cached.validators if cached else None)
+        if cached is not None and response.status_code == 304:
+            return cached
+        data = (
+            response.json()
+        )  # The downloaded file MUST be json. Everything else we do not handle!
+    except Exception as e:
+        raise NeedimportException(f"Getting {url} didn't work. Reason: {e}.")
+
+    validators = {}
+    if etag := response.headers.get("ETag"):
+        validators["If-None-Match"] = etag
+    if last_modified := response.headers.get("Last-Modified"):
+        validators["If-Modified-Since"] = last_modified
+
+    versions = {}
+    if isinstance(data, dict) and isinstance(data.get("versions"), dict):
+        versions = {
+            version: _ImportedVersion({}, 0, decoded=version_data["needs"])
+            for version, version_data in data["versions"].items()
+            if isinstance(version_data, dict)
+            and isinstance(version_data.get("needs"), dict)
+        }
+    source = _ImportSource(
+        data=data, needs_path=None, versions=versions, validators=validators
+    )
+    _import_sources[(url,)] = source
+    return source
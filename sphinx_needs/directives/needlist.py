@@ -13,7 +13,12 @@ from sphinx_needs.directives.utils import (
     report_max_items,
     used_filter_paragraph,
 )
-from sphinx_needs.filter_common import FilterBase, apply_max_items, process_filters
+from sphinx_needs.filter_common import (
+    FilterBase,
+    add_filter_spec,
+    apply_max_items,
+    process_filters,
+)
 from sphinx_needs.utils import (
     add_doc,
     check_and_calc_base_url_rel_path,
@@ -60,6 +65,7 @@ class NeedlistDirective(FilterBase):
             "max_items": self.options.get("max_items"),
             **self.collect_filter_attributes(),
         }
+        add_filter_spec(env, attributes)
         list_node = Needlist("", **attributes)
         self.set_source_info(list_node)
 
@@ -13,6 +13,7 @@ from sphinx_needs.config import NeedsSphinxConfig
 from sphinx_needs.data import NeedsSequenceType, SphinxNeedsData
 from sphinx_needs.diagrams_common import (
     DiagramBase,
+    DiagramWriter,
     add_config,
     create_legend,
     get_debug_container,
@@ -149,11 +150,12 @@ def process_needsequence(
         puml_node.line = current_needsequence["lineno"]
         puml_node.source = env.doc2path(current_needsequence["docname"])
 
-        puml_node["uml"] = "@startuml\n"
+        writer = DiagramWriter()
+        writer.line("@startuml")
 
         # Adding config
         config = current_needsequence["config"]
-        puml_node["uml"] += add_config(config)
+        writer.write(add_config(config))
 
         start_needs_id = [
             x.strip() for x in re.split(";|,", current_needsequence["start"])
@@ -166,11 +168,11 @@ def process_needsequence(
                 f":{current_needsequence['lineno']}"
             )
 
-        puml_node["uml"] += "\n' Nodes definition \n\n"
+        writer.write("\n' Nodes definition \n\n")
 
         # Add  start participants
-        p_string = ""
-        c_string = ""
+        participants = DiagramWriter()
+        connections = DiagramWriter()
         # the cap counts messages (arrows), and is shared by all start needs,
         # since it applies to the diagram as a whole
         counter = _MessageCounter(
@@ -189,30 +191,33 @@ def process_needsequence(
                 )
 
             # Add children of participants
-            _msg_receiver_needs, p_string_new, c_string_new = get_message_needs(
+            get_message_needs(
                 app,
                 need,
                 current_needsequence["link_types"],
                 all_needs_dict,
                 filter=current_needsequence["filter"],
                 counter=counter,
+                participants=participants,
+                connections=connections,
                 origin_docname=current_needsequence["docname"],
             )
-            p_string += p_string_new
-            c_string += c_string_new
 
-        p_string += counter.declarations_to_restore()
+        participants.write(counter.declarations_to_restore())
+        p_string = participants.getvalue()
+        c_string = connections.getvalue()
 
-        puml_node["uml"] += p_string
+        writer.write(p_string)
 
-        puml_node["uml"] += "\n' Connection definition \n\n"
-        puml_node["uml"] += c_string
+        writer.write("\n' Connection definition \n\n")
+        writer.write(c_string)
 
         # Create a legend
         if current_needsequence["show_legend"]:
-            puml_node["uml"] += create_legend(needs_types)
+            writer.write(create_legend(needs_types))
 
-        puml_node["uml"] += "\n@enduml"
+        writer.write("\n@enduml")
+        puml_node["uml"] = writer.getvalue()
         set_plantuml_paths(puml_node, env, current_needsequence["docname"])
 
         scale = int(current_needsequence["scale"])
@@ -344,10 +349,14 @@ def get_message_needs(
     filter: str | None = None,
     *,
     counter: _MessageCounter,
+    participants: DiagramWriter,
+    connections: DiagramWriter,
     origin_docname: str | None = None,
-) -> tuple[dict[str, dict[str, Any]], str, str]:
+) -> dict[str, dict[str, Any]]:
     """Walk the messages sent by ``sender``, drawing each receiver that passes ``filter``.
 
+    :param participants: The writer of the participant declarations.
+    :param connections: The writer of the messages between the participants.
     :param origin_docname: The document the needsequence is written in, so that a
         ``filter`` may test the receiver against it with ``c.this_doc()``.
     """
@@ -358,8 +367,6 @@ def get_message_needs(
         msg_needs += [all_needs_dict[x] for x in sender[link_type]]  # type: ignore[misc]
 
     messages: dict[str, dict[str, Any]] = {}
-    p_string = ""
-    c_string = ""
     for msg_need in msg_needs:
         messages[msg_need["id"]] = {
             "id": msg_need["id"],
@@ -371,7 +378,7 @@ def get_message_needs(
                 sender["title"], sender["id"]
             )
             if counter.has_room:
-                p_string += declaration
+                participants.write(declaration)
             else:
                 # a participant is only declared whilst the cap has room, so that
                 # truncation can never add a participant that sends no message; it is
@@ -399,12 +406,14 @@ def get_message_needs(
                 }
 
                 if counter.add_message(sender["id"], rec_id):
-                    c_string += "{} -> {}: {}\n".format(
-                        sender["id"], rec_data["id"], msg_need["title"]
+                    connections.write(
+                        "{} -> {}: {}\n".format(
+                            sender["id"], rec_data["id"], msg_need["title"]
+                        )
                     )
 
                 if rec_id not in tracked_receivers:
-                    rec_messages, p_string_new, c_string_new = get_message_needs(
+                    rec_messages = get_message_needs(
                         app,
                         all_needs_dict[rec_id],
                         link_types,
@@ -412,16 +421,16 @@ def get_message_needs(
                         tracked_receivers,
                         filter=filter,
                         counter=counter,
+                        participants=participants,
+                        connections=connections,
                         origin_docname=origin_docname,
                     )
-                    p_string += p_string_new
-                    c_string += c_string_new
 
                     rec_data["messages"] = rec_messages
 
                 messages[msg_need["id"]]["receivers"][rec_id] = rec_data
 
-    return messages, p_string, c_string
+    return messages
 
 
 class NeedSequenceException(BaseException):
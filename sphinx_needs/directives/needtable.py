@@ -1,12 +1,19 @@
 from __future__ import annotations
 
+import hashlib
+import json
 import re
 from collections.abc import Callable, Sequence
+from pathlib import Path
 from typing import Any
 
 from docutils import nodes
 from docutils.parsers.rst import directives
+from docutils.utils import new_document
 from sphinx.application import Sphinx
+from sphinx.builders import Builder
+from sphinx.builders.html import StandaloneHTMLBuilder
+from sphinx.writers.html5 import HTML5Translator
 
 from sphinx_needs.config import NeedsSphinxConfig
 from sphinx_needs.data import NeedsTableType, SphinxNeedsData
@@ -18,13 +25,25 @@ from sphinx_needs.directives.utils import (
     report_max_items,
     used_filter_paragraph,
 )
+from sphinx_needs.environment import _STATIC_DIR_NAME
 from sphinx_needs.exceptions import NeedsInvalidException
-from sphinx_needs.filter_common import FilterBase, apply_max_items, process_filters
+from sphinx_needs.filter_common import (
+    FilterBase,
+    add_filter_spec,
+    apply_max_items,
+    process_filters,
+)
 from sphinx_needs.functions.functions import check_and_get_content
 from sphinx_needs.logging import get_logger, log_warning
 from sphinx_needs.need_item import NeedItem, NeedPartItem
 from sphinx_needs.needs_schema import LinkSchema
-from sphinx_needs.utils import add_doc, profile, remove_node_from_tree, row_col_maker
+from sphinx_needs.utils import (
+    NeedtableRenderContext,
+    add_doc,
+    profile,
+    remove_node_from_tree,
+    render_cell,
+)
 
 LOGGER = get_logger(__name__)
 
@@ -53,6 +72,7 @@ class NeedtableDirective(FilterBase):
         "sort": directives.unchanged_required,
         "class": directives.unchanged_required,
         "max_items": directives.nonnegative_int,
+        "render": lambda c: directives.choice(c, ("nodes", "data")),
         # ubCode compatibility: accepted and ignored by Sphinx-Needs.
         "cypher": directives.unchanged,
     }
@@ -126,8 +146,12 @@ class NeedtableDirective(FilterBase):
             "show_filters": "show_filters" in self.options,
             "show_parts": self.options.get("show_parts", False) is None,
             "max_items": self.options.get("max_items"),
-            **self.collect_filter_attributes(),
+            # render is only set below, if given
+            **self.collect_filter_attributes(),  # type: ignore[typeddict-item]
         }
+        if "render" in self.options:
+            attributes["render"] = self.options["render"]
+        add_filter_spec(env, attributes)
         node = Needtable("", **attributes)
         self.set_source_info(node)
 
@@ -136,6 +160,97 @@ class NeedtableDirective(FilterBase):
         return [targetnode, node]
 
 
+class _NeedtableData:
+    """Writes the rows of ``:render: data`` tables to JSON files.
+
+    The cells are rendered to HTML with the builder's translator.
+    The file of a table is named by a digest of its document and id,
+    and the table gets a ``NEEDS_DATA_<name>`` class, from which ``datatables_loader.js`` takes the name.
+    """
+
+    def __init__(self, builder: StandaloneHTMLBuilder) -> None:
+        self._outdir = self.directory(builder)
+        document = new_document("<needtable>", builder.docsettings)
+        self._translator: HTML5Translator = builder.create_translator(  # type: ignore[assignment]
+            document, builder
+        )
+
+    @classmethod
+    def create(cls, builder: Builder) -> _NeedtableData | None:
+        """The writer for the builder, or ``None`` if its pages can not fetch the rows."""
+        if not isinstance(builder, StandaloneHTMLBuilder) or builder.embedded:
+            return None
+        if getattr(builder, "docsettings", None) is None:
+            # not in the write phase
+            return None
+        return cls(builder)
+
+    @staticmethod
+    def directory(builder: Builder) -> Path:
+        """The directory the JSON files are written to."""
+        return Path(builder.outdir) / _STATIC_DIR_NAME / "sphinx-needs" / "needtables"
+
+    @staticmethod
+    def doc_prefix(docname: str) -> str:
+        """The start of the names of the JSON files of a document."""
+        return hashlib.blake2b(docname.encode(), digest_size=8).hexdigest() + "_"
+
+    @classmethod
+    def name(cls, docname: str, table_id: str) -> str:
+        """The name of the JSON file of a table, without the extension."""
+        return (
+            cls.doc_prefix(docname)
+            + hashlib.blake2b(table_id.encode(), digest_size=8).hexdigest()
+        )
+
+    def _render(self, entry: nodes.Element) -> str:
+        body: list[str] = []
+        self._translator.body = body
+        for child in entry.children:
+            child.walkabout(self._translator)
+        return "".join(body)
+
+    def write(self, name: str, tbody: nodes.tbody) -> None:
+        """Write the rows of the table body to the JSON file of the table."""
+        rows = [
+            {
+                "classes": " ".join(c for c in row["classes"] if c),
+                "cells": [
+                    self._render(entry)
+                    for entry in row.children
+                    if isinstance(entry, nodes.entry)
+                ],
+            }
+            for row in tbody.children
+            if isinstance(row, nodes.row)
+        ]
+        self._outdir.mkdir(parents=True, exist_ok=True)
+        with open(self._outdir / f"{name}.json", "w", encoding="utf-8") as f:
+            json.dump({"rows": rows}, f, ensure_ascii=False, separators=(",", ":"))
+
+
+def remove_needtable_data(app: Sphinx, _doctree: nodes.document, docname: str) -> None:
+    """Remove the JSON files of the tables of a document, before it is written again.
+
+    The tables it still contains are written again by :func:`process_needtables`.
+    """
+    directory = _NeedtableData.directory(app.builder)
+    if directory.is_dir():
+        for path in directory.glob(_NeedtableData.doc_prefix(docname) + "*.json"):
+            path.unlink()
+
+
+def prune_needtable_data(app: Sphinx, exception: Exception | None) -> None:
+    """Remove the JSON files of tables in documents that no longer exist."""
+    directory = _NeedtableData.directory(app.builder)
+    if exception is not None or not directory.is_dir():
+        return
+    prefixes = {_NeedtableData.doc_prefix(docname) for docname in app.env.all_docs}
+    for path in directory.glob("*.json"):
+        if path.name.split("_", 1)[0] + "_" not in prefixes:
+            path.unlink()
+
+
 @measure_time("needtable")
 @profile("NEEDTABLE")
 def process_needtables(
@@ -167,6 +282,10 @@ def process_needtables(
             link_type_list["INCOMING"] = link
 
     all_needs = needs_data.get_needs_view()
+    # the same for every cell of every table in the document
+    context = NeedtableRenderContext.create(app, fromdocname, all_needs)
+    # created for the first table, whose rows are written to a JSON file
+    data_writer: _NeedtableData | None = None
 
     # for node in doctree.findall(Needtable):
     for node in found_nodes:
@@ -286,18 +405,19 @@ def process_needtables(
 
             for option, _title in current_needtable["columns"]:
                 if option == "ID":
-                    row += row_col_maker(
-                        app,
-                        fromdocname,
-                        all_needs,
+                    row += render_cell(
+                        context,
                         temp_need,
                         "id",
                         make_ref=True,
                         prefix=prefix,
                     )
                 elif option == "TITLE":
-                    row += row_col_maker(
-                        app, fromdocname, all_needs, temp_need, "title", prefix=prefix
+                    row += render_cell(
+                        context,
+                        temp_need,
+                        "title",
+                        prefix=prefix,
                     )
                 elif option in link_type_list:
                     link = link_type_list[option]
@@ -306,26 +426,24 @@ def process_needtables(
                         link.name.upper() + "_BACK",
                         link.display.incoming.upper(),
                     ]:
-                        row += row_col_maker(
-                            app,
-                            fromdocname,
-                            all_needs,
+                        row += render_cell(
+                            context,
                             temp_need,
                             link.name + "_back",
                             ref_lookup=True,
                         )
                     else:
-                        row += row_col_maker(
-                            app,
-                            fromdocname,
-                            all_needs,
+                        row += render_cell(
+                            context,
                             temp_need,
                             link.name,
                             ref_lookup=True,
                         )
                 else:
-                    row += row_col_maker(
-                        app, fromdocname, all_needs, temp_need, option.lower()
+                    row += render_cell(
+                        context,
+                        temp_need,
+                        option.lower(),
                     )
             tbody += row
 
@@ -340,20 +458,16 @@ def process_needtables(
 
                     for option, _title in current_needtable["columns"]:
                         if option == "ID":
-                            row += row_col_maker(
-                                app,
-                                fromdocname,
-                                all_needs,
+                            row += render_cell(
+                                context,
                                 temp_part,
                                 "id_complete",
                                 make_ref=True,
                                 prefix=needs_config.part_prefix,
                             )
                         elif option == "TITLE":
-                            row += row_col_maker(
-                                app,
-                                fromdocname,
-                                all_needs,
+                            row += render_cell(
+                                context,
                                 temp_part,
                                 "content",
                                 prefix=needs_config.part_prefix,
@@ -365,21 +479,36 @@ def process_needtables(
                             link_.name.upper() + "_BACK",
                             link_.display.incoming.upper(),
                         ]:
-                            row += row_col_maker(
-                                app,
-                                fromdocname,
-                                all_needs,
+                            row += render_cell(
+                                context,
                                 temp_part,
                                 link_.name + "_back",
                                 ref_lookup=True,
                             )
                         else:
-                            row += row_col_maker(
-                                app, fromdocname, all_needs, temp_part, option.lower()
+                            row += render_cell(
+                                context,
+                                temp_part,
+                                option.lower(),
                             )
 
                     tbody += row
 
+        if (
+            current_needtable.get("render", "nodes") == "data"
+            and style == "DATATABLES"
+            and len(filtered_needs) > 0
+        ):
+            if data_writer is None:
+                data_writer = _NeedtableData.create(app.builder)
+            if data_writer is not None:
+                # only the header is written into the page,
+                # the browser loads the rows when it draws them
+                name = _NeedtableData.name(fromdocname, table_node["ids"][0])
+                data_writer.write(name, tbody)
+                tbody.clear()
+                table_node["classes"] += ["NEEDS_DATA", f"NEEDS_DATA_{name}"]
+
         content: nodes.Element
         if len(filtered_needs) == 0:
             content = no_needs_found_paragraph(current_needtable.get("filter_warning"))
@@ -2,7 +2,10 @@ from __future__ import annotations
 
 import html
 import time
-from collections.abc import Sequence
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import partial
 from pathlib import PurePosixPath
 from typing import TYPE_CHECKING, Any, TypedDict
 
@@ -11,19 +14,21 @@ from docutils.parsers.rst import directives
 from sphinx.application import Sphinx
 from sphinx.util.docutils import SphinxDirective
 
-from sphinx_needs._jinja import render_template_string
+from sphinx_needs._jinja import compile_template, render_template_string
 from sphinx_needs.config import NeedsSphinxConfig
-from sphinx_needs.data import SphinxNeedsData
+from sphinx_needs.data import NeedsUmlType, SphinxNeedsData
 from sphinx_needs.debug import measure_time
+from sphinx_needs.diagram_cache import GeneratedDiagram, generate_diagram
 from sphinx_needs.diagrams_common import calculate_link, set_plantuml_paths
 from sphinx_needs.directives.needflow._plantuml import make_entity_name
 from sphinx_needs.filter_common import filter_needs_view
-from sphinx_needs.logging import log_warning
+from sphinx_needs.logging import LoggedWarning, log_warning, record_warnings
 from sphinx_needs.need_item import NeedItem, NeedPartItem
 from sphinx_needs.roles.need_ref import value_to_string
 from sphinx_needs.utils import add_doc, logger, split_need_id
 
 if TYPE_CHECKING:
+    from sphinx.environment import BuildEnvironment
     from sphinxcontrib.plantuml import plantuml
 
 
@@ -35,6 +40,63 @@ class ProcessedDataType(TypedDict):
 
 ProcessedNeedsType = dict[str, list[ProcessedDataType]]
 
+_ProcessedKey = tuple[str, str, "None | str", str]
+"""A hashable ``(need id, art, key, repr of arguments)`` of a processed call."""
+
+
+@dataclass(slots=True)
+class _Expansion:
+    """The expansion of a ``uml()`` or ``flow()`` call,
+    re-used by later calls with the same arguments, in this or other diagrams.
+
+    Whether a nested call expands, or is skipped as already processed,
+    depends on the calls processed before it, so an expansion records
+    which calls it found processed or unprocessed,
+    and it is only re-used where the same calls are (un)processed.
+    """
+
+    uml: str = ""
+    checks: dict[_ProcessedKey, tuple[str, ProcessedDataType, bool]] = field(
+        default_factory=dict
+    )
+    """The calls the expansion looked up, before processing them itself,
+    and whether they were processed."""
+    added: list[tuple[str, ProcessedDataType]] = field(default_factory=list)
+    """The calls the expansion marked as processed, in order."""
+    added_keys: set[_ProcessedKey] = field(default_factory=set)
+    warnings: list[LoggedWarning] = field(default_factory=list)
+    """The warnings logged by the expansion, to emit again on re-use."""
+
+    def depends_on(
+        self, need_id: str, data: ProcessedDataType, processed: bool
+    ) -> None:
+        entry = _processed_key(need_id, data)
+        if entry not in self.added_keys and entry not in self.checks:
+            self.checks[entry] = (need_id, data, processed)
+
+    def add(self, need_id: str, data: ProcessedDataType) -> None:
+        self.added.append((need_id, data))
+        self.added_keys.add(_processed_key(need_id, data))
+
+
+_expansions: dict[tuple[str, str, None | str, str, None | str], _Expansion] = {}
+"""The expansions of this build,
+by ``(art, need id, key, repr of arguments, fromdocname)``."""
+
+
+def clear_uml_expansions(_app: Sphinx, _env: BuildEnvironment) -> None:
+    """Forget the expansions of a previous build, whose needs may have changed."""
+    _expansions.clear()
+
+
+def _processed_key(need_id: str, data: ProcessedDataType) -> _ProcessedKey:
+    return (
+        need_id,
+        data["art"],
+        data["key"],
+        repr(sorted(data["arguments"].items())),
+    )
+
 
 class Needuml(nodes.General, nodes.Element):
     pass
@@ -150,14 +212,8 @@ class NeedarchDirective(NeedumlDirective):
         return NeedumlDirective.run(self)
 
 
-def transform_uml_to_plantuml_node(
-    app: Sphinx,
-    uml_content: str,
-    parent_need_id: None | str,
-    key: None | str,
-    kwargs: dict[str, Any],
-    config: str,
-) -> plantuml:
+def create_plantuml_node(app: Sphinx) -> plantuml | nodes.error:
+    """Create an empty plantuml node, or an error node if PlantUML is not available."""
     try:
         if "sphinxcontrib.plantuml" not in app.extensions:
             raise ImportError
@@ -170,18 +226,26 @@ def transform_uml_to_plantuml_node(
         error_node.append(para)
         return error_node
 
-    # Create basic uml node
     plantuml_block_text = ".. plantuml::\n\n   @startuml\n   @enduml"
-    puml_node = plantuml(plantuml_block_text)
+    return plantuml(plantuml_block_text)
 
-    # Add needuml specific content
-    puml_node["uml"] = "@startuml\n"
+
+def render_needuml(
+    app: Sphinx,
+    uml_content: str,
+    parent_need_id: None | str,
+    key: None | str,
+    kwargs: dict[str, Any],
+    config: str,
+) -> str:
+    """Render the PlantUML source of a needuml or needarch diagram."""
+    uml = "@startuml\n"
 
     # Adding config
     if config:
-        puml_node["uml"] += "\n' Config\n\n"
-        puml_node["uml"] += config
-        puml_node["uml"] += "\n\n"
+        uml += "\n' Config\n\n"
+        uml += config
+        uml += "\n\n"
 
     # jinja2uml to translate jinja statements to uml text
     (uml_content_return, _) = jinja2uml(
@@ -194,9 +258,9 @@ def transform_uml_to_plantuml_node(
         kwargs=kwargs,
     )
 
-    puml_node["uml"] += f"\n{uml_content_return}"
-    puml_node["uml"] += "\n@enduml\n"
-    return puml_node
+    uml += f"\n{uml_content_return}"
+    uml += "\n@enduml\n"
+    return uml
 
 
 def get_debug_node_from_puml_node(puml_node: plantuml) -> nodes.container:
@@ -318,6 +382,8 @@ class JinjaFunctions:
             )
         self.processed_need_ids = processed_need_ids
         self.needs_config = NeedsSphinxConfig(app.config)
+        self._expanding: list[_Expansion] = []
+        """The expansions in progress, outermost first, recording what they depend on."""
 
     def set_parent_need_id(self, parent_need_id: None | str) -> None:
         """Update the parent need ID for a new recursion level."""
@@ -341,10 +407,15 @@ class JinjaFunctions:
         self, need_id: str, art: str, key: None | str, kwargs: dict[str, Any]
     ) -> None:
         data = self.need_to_processed_data(art=art, key=key, kwargs=kwargs)
+        self._mark_processed(need_id, data)
+
+    def _mark_processed(self, need_id: str, data: ProcessedDataType) -> None:
         if need_id not in self.processed_need_ids:
             self.processed_need_ids[need_id] = []
         if data not in self.processed_need_ids[need_id]:
             self.processed_need_ids[need_id].append(data)
+        for expansion in self._expanding:
+            expansion.add(need_id, data)
 
     def append_needs_to_processed_needs(
         self, processed_needs_data: ProcessedNeedsType
@@ -355,15 +426,71 @@ class JinjaFunctions:
             for d in v:
                 if d not in self.processed_need_ids[k]:
                     self.processed_need_ids[k].append(d)
+                    for expansion in self._expanding:
+                        expansion.add(k, d)
 
     def data_in_processed_data(
         self, need_id: str, art: str, key: str, kwargs: dict[str, Any]
     ) -> bool:
         data = self.need_to_processed_data(art=art, key=key, kwargs=kwargs)
+        return self._is_processed(need_id, data)
+
+    def _was_processed(self, need_id: str, data: ProcessedDataType) -> bool:
         return (need_id in self.processed_need_ids) and (
             data in self.processed_need_ids[need_id]
         )
 
+    def _is_processed(self, need_id: str, data: ProcessedDataType) -> bool:
+        """Look up whether a call is processed, as a dependency of the expansions in progress."""
+        processed = self._was_processed(need_id, data)
+        for expansion in self._expanding:
+            expansion.depends_on(need_id, data, processed)
+        return processed
+
+    def _expand(
+        self, art: str, need_id: str, key: None | str, kwargs: dict[str, Any]
+    ) -> tuple[tuple[str, str, None | str, str, None | str], _Expansion | None]:
+        """Find an earlier expansion of the call, that can be re-used here.
+
+        An expansion can be re-used, if every call it looked up
+        is (un)processed now, as it was for the expansion.
+        Re-using it marks the calls, that the expansion processed, as processed.
+
+        :return: The key of the expansion, and the expansion, if it can be re-used.
+        """
+        memo_key = (
+            art,
+            need_id,
+            key,
+            repr(sorted(kwargs.items())),
+            self.fromdocname,
+        )
+        expansion = _expansions.get(memo_key)
+        if expansion is None or any(
+            self._was_processed(check_need_id, data) != processed
+            for check_need_id, data, processed in expansion.checks.values()
+        ):
+            return memo_key, None
+        for check_need_id, data, _ in expansion.checks.values():
+            self._is_processed(check_need_id, data)
+        for added_need_id, data in expansion.added:
+            self._mark_processed(added_need_id, data)
+        for warning in expansion.warnings:
+            warning.replay()
+        return memo_key, expansion
+
+    @contextmanager
+    def _expanding_call(self) -> Iterator[_Expansion]:
+        """Record what an expansion depends on and processes, while it is in progress."""
+        expansion = _Expansion()
+        self._expanding.append(expansion)
+        try:
+            with record_warnings() as warnings:
+                yield expansion
+            expansion.warnings = warnings
+        finally:
+            self._expanding.pop()
+
     def get_processed_need_ids(self) -> ProcessedNeedsType:
         return self.processed_need_ids
 
@@ -393,23 +520,31 @@ class JinjaFunctions:
             else:
                 return self.flow(need_id)
 
+        # Re-use an earlier expansion of the same call, e.g. from another diagram.
+        memo_key, expansion = self._expand("uml", need_id, key, kwargs)
+        if expansion is not None:
+            return expansion.uml
+
         # We need to re-render the fetched content, as it may contain also Jinja statements.
         # Reuse this JinjaFunctions instance to avoid repeated object creation.
         # Save and restore parent_need_id since jinja2uml will mutate it.
         saved_parent_need_id = self.parent_need_id
         try:
-            (uml, processed_need_ids_return) = jinja2uml(
-                app=self.app,
-                fromdocname=self.fromdocname,
-                uml_content=uml_content,
-                parent_need_id=need_id,
-                key=key,
-                processed_need_ids=self.processed_need_ids,
-                kwargs=kwargs,
-                jinja_utils=self,
-            )
+            with self._expanding_call() as expansion:
+                (uml, processed_need_ids_return) = jinja2uml(
+                    app=self.app,
+                    fromdocname=self.fromdocname,
+                    uml_content=uml_content,
+                    parent_need_id=need_id,
+                    key=key,
+                    processed_need_ids=self.processed_need_ids,
+                    kwargs=kwargs,
+                    jinja_utils=self,
+                )
         finally:
             self.parent_need_id = saved_parent_need_id
+        expansion.uml = uml
+        _expansions[memo_key] = expansion
 
         # Append processed needs to current proccessing
         self.append_needs_to_processed_needs(processed_need_ids_return)
@@ -430,21 +565,24 @@ class JinjaFunctions:
             need_id=need_id, art="flow", key="", kwargs={}
         )
 
+        memo_key, expansion = self._expand("flow", need_id, "", {})
+        if expansion is not None:
+            return expansion.uml
+
+        with self._expanding_call() as expansion:
+            expansion.uml = self._render_flow(need_id)
+        _expansions[memo_key] = expansion
+        return expansion.uml
+
+    def _render_flow(self, need_id: str) -> str:
         need_info = self.needs[need_id]
         link = calculate_link(self.app, need_info, self.fromdocname)
 
-        node_text = render_template_string(
-            self.needs_config.diagram_template,
-            {**need_info.filter_context(), **self.needs_config.render_context},
-            autoescape=False,
-            # new_env=True because flow() is called from within a template callback
-            # (e.g. {{ flow("ID") }}) while the outer jinja2uml render holds a lock
-            # on its Environment.  Although jinja2uml uses new_env=True (so the
-            # *outer* lock is on a throwaway env, not the cached one), using new_env
-            # here as well is a defensive measure: if a user's diagram_template ever
-            # contained callback-invoking expressions, the cached env would deadlock.
-            new_env=True,
-        )
+        # The compiled template has an Environment of its own,
+        # which is not locked by the outer jinja2uml render.
+        node_text = compile_template(
+            self.needs_config.diagram_template, autoescape=False
+        ).render({**need_info.filter_context(), **self.needs_config.render_context})
 
         color_suffix = (
             f" #{need_info['type_color'].replace('#', '')}"
@@ -598,21 +736,28 @@ def process_needuml(
                 [line.strip() for line in config.split("\n") if line.strip()]
             )
 
-        start = time.perf_counter()
-        puml_node = transform_uml_to_plantuml_node(
-            app=app,
-            uml_content=current_needuml["content"],
-            parent_need_id=parent_need_id,
-            key=current_needuml["key"],
-            kwargs=current_needuml["extra"],
-            config=config,
-        )
-        if "uml" not in puml_node:
-            # An error node was returned
+        puml_node = create_plantuml_node(app)
+        if isinstance(puml_node, nodes.error):
             node.replace_self(puml_node)
             continue
 
-        duration = time.perf_counter() - start
+        diagram = generate_diagram(
+            app,
+            "needuml",
+            fromdocname,
+            (
+                {
+                    key: value
+                    for key, value in current_needuml.items()
+                    # set by processing the diagram
+                    if key not in ("content_calculated", "process_time")
+                },
+                parent_need_id,
+            ),
+            partial(_generate_needuml, app, current_needuml, parent_need_id, config),
+        )
+        puml_node["uml"] = diagram.text
+        duration = diagram.duration
 
         if (
             needs_config.uml_process_max_time is not None
@@ -660,6 +805,25 @@ def process_needuml(
         node.replace_self(content)
 
 
+def _generate_needuml(
+    app: Sphinx,
+    current_needuml: NeedsUmlType,
+    parent_need_id: None | str,
+    config: str,
+) -> GeneratedDiagram:
+    """Render the PlantUML source of a needuml or needarch directive, measuring how long it took."""
+    start = time.perf_counter()
+    uml = render_needuml(
+        app,
+        uml_content=current_needuml["content"],
+        parent_need_id=parent_need_id,
+        key=current_needuml["key"],
+        kwargs=current_needuml["extra"],
+        config=config,
+    )
+    return GeneratedDiagram(uml, duration=time.perf_counter() - start)
+
+
 class NeedumlException(BaseException):
     """Errors during Needuml handling."""
 
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 import os
 
 import requests
@@ -8,17 +7,20 @@ from requests_file import FileAdapter
 from sphinx.application import Sphinx
 from sphinx.environment import BuildEnvironment
 
+from sphinx_needs import telemetry
 from sphinx_needs._jinja import compile_template
 from sphinx_needs.api import InvalidNeedException, add_external_need, del_need
 from sphinx_needs.config import NeedsSphinxConfig
 from sphinx_needs.data import NeedsCoreFields, SphinxNeedsData
 from sphinx_needs.logging import get_logger, log_warning
 from sphinx_needs.need_item import NeedItemSourceExternal
+from sphinx_needs.needsfile import NeedsFileReader
 from sphinx_needs.utils import clean_log, import_prefix_link_edit
 
 log = get_logger(__name__)
 
 
+@telemetry.record_phase("external_needs")
 def load_external_needs(
     app: Sphinx, env: BuildEnvironment, _docnames: list[str]
 ) -> None:
@@ -50,6 +52,7 @@ def load_external_needs(
                 "json_path or json_url must be configured to use external_needs."
             )
 
+        reader: NeedsFileReader | None = None
         if source.get("json_url", False):
             log.info(
                 clean_log(f"Loading external needs from url {source['json_url']}.")
@@ -81,8 +84,10 @@ def load_external_needs(
                     f"Given json_path {json_path} does not exist."
                 )
 
-            with open(json_path) as json_file:
-                needs_json = json.load(json_file)
+            # read the needs of the selected version only, rather than the whole file
+            reader = NeedsFileReader(json_path)
+            header, versions = reader.read_summary()
+            needs_json = {**header, "versions": versions}
 
         version = source.get("version", needs_json.get("current_version"))
         if not version:
@@ -93,6 +98,8 @@ def load_external_needs(
         try:
             data = needs_json["versions"][version]
             needs = data["needs"]
+            if reader is not None:
+                needs = dict(reader.iter_needs(version))
         except KeyError:
             if not needs_json.get("versions"):
                 # The versions dict is empty, so no needs were ever added.
@@ -195,6 +202,7 @@ def load_external_needs(
                     allow_type_coercion=source.get("allow_type_coercion", True),
                     **need_params,
                 )
+                telemetry.count_items(1)
             except InvalidNeedException as err:
                 location = source.get("json_url", "") or source.get("json_path", "")
                 log_warning(
@@ -7,26 +7,39 @@ from __future__ import annotations
 
 import ast
 import json
+import multiprocessing
+import os
 import re
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Hashable, Iterable
+from dataclasses import dataclass
 from pathlib import Path
 from timeit import default_timer as timer
 from types import CodeType
-from typing import Any, TypedDict, overload
+from typing import Any, TypedDict, TypeVar
 
 from docutils import nodes
 from docutils.parsers.rst import directives
 from sphinx.application import Sphinx
+from sphinx.builders import Builder
+from sphinx.environment import BuildEnvironment
 from sphinx.util.docutils import SphinxDirective
+from sphinx.util.logging import suppress_logging
+from sphinx.util.parallel import parallel_available
 
+from sphinx_needs import telemetry
 from sphinx_needs.config import NeedsSphinxConfig
-from sphinx_needs.data import NeedsFilteredBaseType, NeedsMutable
+from sphinx_needs.data import (
+    NeedsFilteredBaseType,
+    NeedsFilterSpecType,
+    NeedsMutable,
+    SphinxNeedsData,
+)
 from sphinx_needs.debug import measure_time, measure_time_func
 from sphinx_needs.exceptions import NeedsInvalidFilter
 from sphinx_needs.logging import log_warning
 from sphinx_needs.need_item import NeedItem, NeedPartItem
 from sphinx_needs.needs_schema import AllowedTypes
-from sphinx_needs.ubquery import try_build_simple_predicate
+from sphinx_needs.ubquery import try_build_batch_predicate, try_build_simple_predicate
 from sphinx_needs.utils import check_and_get_external_filter_func
 from sphinx_needs.utils import logger as log
 from sphinx_needs.views import NeedsAndPartsListView, NeedsView
@@ -129,6 +142,9 @@ def process_filters(
     # filter string to record (will be joined by 'and')
     full_filter: list[str] = []
 
+    # results can only be shared between directives, if they filter the same needs
+    use_cache = needs_view is SphinxNeedsData(app.env).get_needs_view()
+
     # check if include external needs
     if not include_external:
         full_filter.append("is_external == False")
@@ -153,34 +169,34 @@ def process_filters(
     found_needs: list[NeedItem | NeedPartItem] = []
 
     if (not filter_code or filter_code.isspace()) and not ff_result:
-        # TODO these may not be correct for parts
-        filtered_needs = needs_view
-        if filter_data["status"]:
-            full_filter.append(f"status in {filter_data['status']!r}")
-            filtered_needs = filtered_needs.filter_statuses(filter_data["status"])
-        if filter_data["tags"]:
-            full_filter.append(
-                " or ".join(f"{tag!r} in tags" for tag in filter_data["tags"])
-            )
-            filtered_needs = filtered_needs.filter_has_tag(filter_data["tags"])
-        if filter_data["types"]:
-            full_filter.append(
-                f"type in {filter_data['types']!r} or type_name in {filter_data['types']!r}"
-            )
-            filtered_needs = filtered_needs.filter_types(
-                filter_data["types"], or_type_names=True
-            )
+        filtered_needs = _apply_filter_options(needs_view, filter_data, full_filter)
         if filter_data["filter"]:
             full_filter.append(filter_data["filter"])
 
         # Get need by filter string
-        found_needs = filter_needs_parts(
-            filtered_needs.to_list_with_parts(),
-            needs_config,
-            filter_data["filter"],
-            location=location,
-            origin_docname=filter_data["docname"],
-        )
+        if use_cache:
+            cache = SphinxNeedsData(app.env).get_or_create_filter_cache()
+            cache_key = _filter_cache_key(filter_data, include_external)
+            if (cached := cache.get(cache_key)) is not None:
+                found_needs = _filter_cache_hit(cached)
+            else:
+                found_needs = _filter_cache_miss(
+                    cache,
+                    cache_key,
+                    filtered_needs.to_list_with_parts(),
+                    needs_config,
+                    filter_data["filter"],
+                    location=location,
+                    origin_docname=filter_data["docname"],
+                )
+        else:
+            found_needs = filter_needs_parts(
+                filtered_needs.to_list_with_parts(),
+                needs_config,
+                filter_data["filter"],
+                location=location,
+                origin_docname=filter_data["docname"],
+            )
     else:
         # The filter results may be dirty, as it may continue manipulated needs.
         found_dirty_needs: list[NeedItem | NeedPartItem] = []
@@ -275,6 +291,223 @@ def process_filters(
     return found_needs
 
 
+def _apply_filter_options(
+    needs_view: NeedsView,
+    filter_data: NeedsFilteredBaseType | NeedsFilterSpecType,
+    full_filter: list[str],
+) -> NeedsView:
+    """Filter the needs by the ``status``, ``tags`` and ``types`` options.
+
+    :param full_filter: The equivalent filter strings are appended to this list.
+    """
+    # TODO these may not be correct for parts
+    filtered_needs = needs_view
+    if filter_data["status"]:
+        full_filter.append(f"status in {filter_data['status']!r}")
+        filtered_needs = filtered_needs.filter_statuses(filter_data["status"])
+    if filter_data["tags"]:
+        full_filter.append(
+            " or ".join(f"{tag!r} in tags" for tag in filter_data["tags"])
+        )
+        filtered_needs = filtered_needs.filter_has_tag(filter_data["tags"])
+    if filter_data["types"]:
+        full_filter.append(
+            f"type in {filter_data['types']!r} or type_name in {filter_data['types']!r}"
+        )
+        filtered_needs = filtered_needs.filter_types(
+            filter_data["types"], or_type_names=True
+        )
+    return filtered_needs
+
+
+def _filter_cache_key(
+    filter_data: NeedsFilteredBaseType | NeedsFilterSpecType, include_external: bool
+) -> Hashable:
+    """Create a key for the filter options, which is equal for equivalent filters.
+
+    The filter string is normalized to its syntax tree,
+    so that it is independent of whitespace and redundant parentheses,
+    and the document is only part of the key, if the filter string uses it (via ``c``).
+    """
+    filter_string = filter_data["filter"] or ""
+    docname: str | None = None
+    try:
+        tree = ast.parse(filter_string.strip(), mode="eval")
+    except SyntaxError:
+        normalized = filter_string
+        docname = filter_data["docname"]
+    else:
+        normalized = ast.dump(tree)
+        if any(
+            isinstance(node, ast.Name) and node.id == "c" for node in ast.walk(tree)
+        ):
+            docname = filter_data["docname"]
+    return (
+        include_external,
+        # the needs are found in the order the options list them
+        tuple(filter_data["status"]),
+        tuple(filter_data["tags"]),
+        tuple(filter_data["types"]),
+        normalized,
+        docname,
+    )
+
+
+@measure_time("filter_cache")
+def _filter_cache_hit(
+    cached: tuple[NeedItem | NeedPartItem, ...],
+) -> list[NeedItem | NeedPartItem]:
+    """Re-use the needs found by a previous, equivalent, filter."""
+    return list(cached)
+
+
+@measure_time("filter_cache")
+def _filter_cache_miss(
+    cache: dict[Hashable, tuple[NeedItem | NeedPartItem, ...]],
+    cache_key: Hashable,
+    needs: NeedsAndPartsListView,
+    config: NeedsSphinxConfig,
+    filter_string: str | None,
+    *,
+    location: nodes.Node,
+    origin_docname: str | None,
+) -> list[NeedItem | NeedPartItem]:
+    """Filter the needs and store the result in the cache.
+
+    Results of filters that reported errors are not stored,
+    so that the warnings are emitted for every directive using the filter.
+    """
+    errors: list[str] = []
+    found = filter_needs_parts(
+        needs,
+        config,
+        filter_string,
+        location=location,
+        origin_docname=origin_docname,
+        errors=errors,
+    )
+    if not errors:
+        cache[cache_key] = tuple(found)
+    return found
+
+
+def add_filter_spec(env: BuildEnvironment, filter_data: NeedsFilteredBaseType) -> None:
+    """Record the filter of a view directive on all needs,
+    so that it can be evaluated before the documents are written.
+
+    Only filters that :func:`process_filters` can share between directives are recorded,
+    i.e. those without filter code or functions, that do filter the needs.
+    """
+    if filter_data["filter_code"] or filter_data["filter_func"]:
+        return
+    if not (
+        filter_data["filter"]
+        or filter_data["status"]
+        or filter_data["tags"]
+        or filter_data["types"]
+    ):
+        return
+    SphinxNeedsData(env).get_or_create_filter_specs().setdefault(
+        filter_data["docname"], []
+    ).append(
+        {
+            "docname": filter_data["docname"],
+            "status": filter_data["status"],
+            "tags": filter_data["tags"],
+            "types": filter_data["types"],
+            "filter": filter_data["filter"],
+        }
+    )
+
+
+def prepare_filters(app: Sphinx, _builder: Builder) -> None:
+    """Evaluate the recorded filters of the documents read in this build in worker processes,
+    before the documents are written.
+
+    The results are stored in the filter cache, that :func:`process_filters` uses,
+    so that the directives only look up their needs while the documents are written.
+    This only happens with more than one ``needs_filter_workers``,
+    and if there are enough filters to give each worker several,
+    as forking the workers takes longer than evaluating a few filters.
+    Filters of other documents, that are written as well, are evaluated by their directives.
+    """
+    global _worker_filters
+    needs_config = NeedsSphinxConfig(app.config)
+    if needs_config.filter_workers == 1 or not parallel_available:
+        return
+    needs_data = SphinxNeedsData(app.env)
+    needs_view = needs_data.get_needs_view()
+    cache = needs_data.get_or_create_filter_cache()
+
+    all_specs = needs_data.get_or_create_filter_specs()
+    read_docs = needs_data.read_docs
+    # equivalent filters are only evaluated once, and not again, if already cached
+    specs: dict[Hashable, NeedsFilterSpecType] = {}
+    for docname, doc_specs in all_specs.items():
+        if read_docs is not None and docname not in read_docs:
+            continue
+        for spec in doc_specs:
+            key = _filter_cache_key(spec, True)
+            if key not in cache:
+                specs.setdefault(key, spec)
+    # each worker gets at least two filters
+    workers = min(needs_config.filter_workers or os.cpu_count() or 1, len(specs) // 2)
+    if workers < 2:
+        return
+
+    with telemetry.phase("prepare_filters", len(specs)):
+        _worker_filters = _PreparedFilters(
+            needs_config, needs_view, list(specs.values())
+        )
+        try:
+            with multiprocessing.get_context("fork").Pool(workers) as pool:
+                results = pool.map(_evaluate_filter, range(len(specs)))
+        finally:
+            _worker_filters = None
+
+        items = {_item_key(item): item for item in needs_view.to_list_with_parts()}
+        for key, found in zip(specs, results, strict=True):
+            # filters that reported errors are evaluated again by their directives,
+            # so that the warnings are emitted there
+            if found is not None:
+                cache[key] = tuple(items[item_key] for item_key in found)
+
+
+@dataclass(frozen=True, slots=True)
+class _PreparedFilters:
+    """The filters to evaluate, shared with worker processes."""
+
+    config: NeedsSphinxConfig
+    needs: NeedsView
+    specs: list[NeedsFilterSpecType]
+
+
+_worker_filters: _PreparedFilters | None = None
+"""The filters of the parent process, inherited by forked worker processes."""
+
+
+def _evaluate_filter(index: int) -> list[tuple[str, str | None]] | None:
+    """Evaluate a filter in a worker process.
+
+    :return: The keys of the needs and parts found, or ``None`` if the filter reported errors.
+    """
+    assert _worker_filters is not None, "worker did not inherit the filters"
+    spec = _worker_filters.specs[index]
+    errors: list[str] = []
+    # warnings are emitted by the directive, when it evaluates the filter again
+    with suppress_logging():
+        found = filter_needs_parts(
+            _apply_filter_options(_worker_filters.needs, spec, []).to_list_with_parts(),
+            _worker_filters.config,
+            spec["filter"],
+            origin_docname=spec["docname"],
+            errors=errors,
+        )
+    if errors:
+        return None
+    return [_item_key(item) for item in found]
+
+
 def resolve_max_items(max_items: int | None, config: NeedsSphinxConfig) -> int:
     """Resolve the effective item limit of a view directive.
 
@@ -330,36 +563,24 @@ def filter_needs_mutable(
     )
 
 
-@overload
-def _analyze_and_apply_expr(
-    needs: NeedsView, expr: ast.expr
-) -> tuple[NeedsView, bool]: ...
-
+_ViewT = TypeVar("_ViewT", NeedsView, NeedsAndPartsListView)
 
-@overload
-def _analyze_and_apply_expr(
-    needs: NeedsAndPartsListView, expr: ast.expr
-) -> tuple[NeedsAndPartsListView, bool]: ...
 
+def _apply_index_expr(needs: _ViewT, expr: ast.expr) -> _ViewT | None:
+    """Analyze the expr for a known filter pattern,
+    and apply it to the given needs, using the indexes of the needs.
 
-def _analyze_and_apply_expr(
-    needs: NeedsView | NeedsAndPartsListView, expr: ast.expr
-) -> tuple[NeedsView | NeedsAndPartsListView, bool]:
-    """Analyze the expr for known filter patterns,
-    and apply them to the given needs.
-
-    :returns: the needs (potentially filtered),
-        and a boolean denoting if it still requires python eval filtering
+    :returns: the filtered needs, or None if the expr is not a known pattern
     """
     if isinstance(expr, ast.Constant):
         if isinstance(expr.value, str | bool):
             # "value" / True / False
-            return needs if expr.value else needs.filter_ids([]), False
+            return needs if expr.value else needs.filter_ids([])
 
     elif isinstance(expr, ast.Name):
         # x
         if expr.id == "is_external":
-            return needs.filter_is_external(True), False
+            return needs.filter_is_external(True)
 
     elif isinstance(expr, ast.Compare):
         # <expr1> <comp> <expr2>
@@ -382,20 +603,23 @@ def _analyze_and_apply_expr(
                 field = expr.comparators[0].id
                 value = expr.left.value
             else:
-                return needs, True
+                return None
 
             if field == "id":
                 # id == value
-                return needs.filter_ids([value]), False  # type: ignore[list-item]
+                return needs.filter_ids([value])  # type: ignore[list-item]
             elif field == "type":
                 # type == value
-                return needs.filter_types([value]), False  # type: ignore[list-item]
+                return needs.filter_types([value])  # type: ignore[list-item]
             elif field == "status":
                 # status == value
-                return needs.filter_statuses([value]), False  # type: ignore[list-item]
+                return needs.filter_statuses([value])  # type: ignore[list-item]
             elif field == "is_external":
                 # is_external == value
-                return needs.filter_is_external(value), False  # type: ignore[arg-type]
+                return needs.filter_is_external(value)  # type: ignore[arg-type]
+            elif needs.indexed_field_type(field) == "scalar":
+                # extra_field == value
+                return needs.filter_field(field, [value])
 
         elif len(expr.ops) == 1 and isinstance(expr.ops[0], ast.In):
             # <expr1> in <expr2>
@@ -414,13 +638,23 @@ def _analyze_and_apply_expr(
                 ]
                 if expr.left.id == "id":
                     # id in ["a", "b", ...]
-                    return needs.filter_ids(values), False
+                    return needs.filter_ids(values)
                 if expr.left.id == "status":
                     # status in ["a", "b", ...]
-                    return needs.filter_statuses(values), False
+                    return needs.filter_statuses(values)
                 elif expr.left.id == "type":
                     # type in ["a", "b", ...]
-                    return needs.filter_types(values), False
+                    return needs.filter_types(values)
+                elif needs.indexed_field_type(expr.left.id) == "scalar":
+                    # extra_field in ["a", 1, ...]
+                    return needs.filter_field(
+                        expr.left.id,
+                        [
+                            elt.value
+                            for elt in expr.comparators[0].elts
+                            if isinstance(elt, ast.Constant)
+                        ],
+                    )
             elif (
                 isinstance(expr.left, ast.Constant)
                 and len(expr.comparators) == 1
@@ -429,17 +663,95 @@ def _analyze_and_apply_expr(
                 and isinstance(expr.left.value, str)
             ):
                 # "value" in tags
-                return needs.filter_has_tag([expr.left.value]), False
+                return needs.filter_has_tag([expr.left.value])
+            elif (
+                isinstance(expr.left, ast.Constant)
+                and len(expr.comparators) == 1
+                and isinstance(expr.comparators[0], ast.Name)
+                and needs.indexed_field_type(expr.comparators[0].id) == "array"
+            ):
+                # "value" in array_field / "value" in link_field
+                return needs.filter_field(expr.comparators[0].id, [expr.left.value])
+
+    return None
+
 
-    elif isinstance((and_op := expr), ast.BoolOp) and isinstance(and_op.op, ast.And):
-        # x and y and ...
-        requires_eval = False
-        for operand in and_op.values:
-            needs, _requires_eval = _analyze_and_apply_expr(needs, operand)
-            requires_eval |= _requires_eval
-        return needs, requires_eval
+def _analyze_and_apply_expr(needs: _ViewT, expr: ast.expr) -> tuple[_ViewT, _ViewT]:
+    """Plan the expr as lookups of known filter patterns,
+    combined by set algebra for ``and``, ``or`` and ``not``,
+    and apply this plan to the given needs.
 
-    return needs, True
+    Sub-expressions that are not known patterns are left for python eval filtering.
+
+    :returns: an upper and a lower bound of the needs matching the expr;
+        every matching need is in ``upper``, and every need in ``lower`` matches.
+        If ``lower is upper``, the result is exact,
+        otherwise the needs in ``upper`` but not in ``lower`` still require python eval filtering.
+    """
+    if (filtered := _apply_index_expr(needs, expr)) is not None:
+        return filtered, filtered
+
+    if (
+        isinstance(expr, ast.Compare)
+        and len(expr.ops) == 1
+        and isinstance(expr.ops[0], ast.NotEq | ast.NotIn)
+    ):
+        # x != y / x not in y, are planned as not (x == y) / not (x in y)
+        return _analyze_and_apply_expr(
+            needs,
+            ast.UnaryOp(
+                op=ast.Not(),
+                operand=ast.Compare(
+                    left=expr.left,
+                    ops=[ast.Eq() if isinstance(expr.ops[0], ast.NotEq) else ast.In()],
+                    comparators=expr.comparators,
+                ),
+            ),
+        )
+
+    if isinstance(expr, ast.UnaryOp) and isinstance(expr.op, ast.Not):
+        # not x
+        upper, lower = _analyze_and_apply_expr(needs, expr.operand)
+        if lower is upper:
+            filtered = needs.difference(upper)
+            return filtered, filtered
+        return needs.difference(lower), needs.difference(upper)
+
+    if isinstance(expr, ast.BoolOp) and isinstance(expr.op, ast.And):
+        # x and y and ..., each operand further narrows the needs
+        upper = needs
+        lowers: list[_ViewT] = []
+        exact = True
+        for operand in expr.values:
+            upper, lower = _analyze_and_apply_expr(upper, operand)
+            exact &= lower is upper
+            lowers.append(lower)
+        if exact:
+            return upper, upper
+        lower = lowers[0]
+        for other in lowers[1:]:
+            lower = lower.intersection(other)
+        return upper, lower
+
+    if isinstance(expr, ast.BoolOp) and isinstance(expr.op, ast.Or):
+        # x or y or ...
+        bounds = [_analyze_and_apply_expr(needs, operand) for operand in expr.values]
+        upper, lower = bounds[0]
+        exact = lower is upper
+        for other_upper, other_lower in bounds[1:]:
+            exact &= other_lower is other_upper
+            upper = upper.union(other_upper)
+            lower = lower.union(other_lower)
+        return (upper, upper) if exact else (upper, lower)
+
+    return needs, needs.filter_ids([])
+
+
+def _item_key(item: NeedItem | NeedPartItem) -> tuple[str, str | None]:
+    """Get the (need, part) id of a need or need part."""
+    if isinstance(item, NeedPartItem):
+        return item["id_parent"], item.part_id
+    return item["id"], None
 
 
 def filter_needs_view(
@@ -456,15 +768,17 @@ def filter_needs_view(
     if not filter_string:
         return list(needs.values())
 
+    lower: NeedsView | None = None
     try:
         body = ast.parse(filter_string).body
     except Exception:
         pass  # warning already emitted in filter_needs
     else:
         if len(body) == 1 and isinstance((expr := body[0]), ast.Expr):
-            needs, requires_eval = _analyze_and_apply_expr(needs, expr.value)
-            if not requires_eval:
-                return list(needs.values())
+            upper, lower = _analyze_and_apply_expr(needs, expr.value)
+            if lower is upper:
+                return list(upper.values())
+            needs = upper
 
     if strict_eval:
         # this is mainly used for testing purposes, to check if expression analysis is working
@@ -472,15 +786,66 @@ def filter_needs_view(
             f"Strict eval mode, but no simple filter found: {filter_string!r}"
         )
 
-    return filter_needs(
-        needs.values(),
+    remaining = needs.difference(lower) if lower else needs
+    found_view = _filter_columns(
+        remaining,
         config,
         filter_string,
-        current_need,
         location=location,
         append_warning=append_warning,
-        origin_docname=origin_docname,
     )
+    if found_view is not None:
+        found = list(found_view.values())
+    else:
+        found = filter_needs(
+            remaining.values(),
+            config,
+            filter_string,
+            current_need,
+            location=location,
+            append_warning=append_warning,
+            origin_docname=origin_docname,
+        )
+    if not lower:
+        return found
+    # combine the needs already known to match with those found by eval, in view order
+    keys = {*lower, *(n["id"] for n in found)}
+    return [need for id, need in needs.items() if id in keys]
+
+
+def plan_filter_needs_view(
+    needs: NeedsView, filter_string: str
+) -> tuple[NeedsView | None, NeedsView] | None:
+    """Split a filter on a view, as in :func:`filter_needs_view`,
+    into the needs known to match from the indexes,
+    and the remaining needs, for which the filter string must be evaluated with ``eval()``.
+
+    This allows the ``eval()`` of several filters to be combined,
+    e.g. to create the filter context of each need only once.
+
+    :returns: ``(matched, remaining)``, where ``matched`` may be None if no need is known to match,
+        or None if :func:`filter_needs_view` does not need ``eval()`` for this filter
+        (i.e. it is answered by the indexes or a compiled predicate, or it is not valid).
+    """
+    if (
+        not filter_string
+        or try_build_batch_predicate(filter_string) is not None
+        or try_build_simple_predicate(filter_string) is not None
+    ):
+        return None
+    try:
+        compile(filter_string, "<string>", "eval")
+        body = ast.parse(filter_string).body
+    except Exception:
+        return None
+
+    lower: NeedsView | None = None
+    if len(body) == 1 and isinstance((expr := body[0]), ast.Expr):
+        upper, lower = _analyze_and_apply_expr(needs, expr.value)
+        if lower is upper:
+            return None
+        needs = upper
+    return (lower or None), (needs.difference(lower) if lower else needs)
 
 
 def filter_needs_parts(
@@ -493,19 +858,22 @@ def filter_needs_parts(
     append_warning: str = "",
     strict_eval: bool = False,
     origin_docname: str | None = None,
+    errors: list[str] | None = None,
 ) -> list[NeedItem | NeedPartItem]:
     if not filter_string:
         return list(needs)
 
+    lower: NeedsAndPartsListView | None = None
     try:
         body = ast.parse(filter_string).body
     except Exception:
         pass  # warning already emitted in filter_needs
     else:
         if len(body) == 1 and isinstance((expr := body[0]), ast.Expr):
-            needs, requires_eval = _analyze_and_apply_expr(needs, expr.value)
-            if not requires_eval:
-                return list(needs)
+            upper, lower = _analyze_and_apply_expr(needs, expr.value)
+            if lower is upper:
+                return list(upper)
+            needs = upper
 
     if strict_eval:
         # this is mainly used for testing purposes, to check if expression analysis is working
@@ -513,15 +881,80 @@ def filter_needs_parts(
             f"Strict eval mode, but no simple filter found: {filter_string!r}"
         )
 
-    return filter_needs_and_parts(
-        needs,
+    remaining = needs.difference(lower) if lower else needs
+    found_view = _filter_columns(
+        remaining,
         config,
         filter_string,
-        current_need,
         location=location,
         append_warning=append_warning,
-        origin_docname=origin_docname,
+        errors=errors,
     )
+    if found_view is not None:
+        found = list(found_view)
+    else:
+        found = filter_needs_and_parts(
+            remaining,
+            config,
+            filter_string,
+            current_need,
+            location=location,
+            append_warning=append_warning,
+            origin_docname=origin_docname,
+            errors=errors,
+        )
+    if not lower:
+        return found
+    # combine the needs already known to match with those found by eval, in view order
+    keys = {*map(_item_key, lower), *map(_item_key, found)}
+    return [item for item in needs if _item_key(item) in keys]
+
+
+def _filter_fallback(config: NeedsSphinxConfig) -> dict[str, Any] | None:
+    """Get the names that the fast path predicates resolve before need fields, if any."""
+    var_proxy = config.variant_data_proxy
+    if not config.filter_data and var_proxy is None:
+        return None
+    fallback = dict(config.filter_data) if config.filter_data else {}
+    if var_proxy is not None:
+        fallback["var"] = var_proxy
+    return fallback
+
+
+@measure_time("filtering")
+def _filter_columns(
+    needs: _ViewT,
+    config: NeedsSphinxConfig,
+    filter_string: str,
+    *,
+    location: tuple[str, int | None] | nodes.Node | None = None,
+    append_warning: str = "",
+    errors: list[str] | None = None,
+) -> _ViewT | None:
+    """Filter the needs by evaluating the filter on a columnar snapshot of their values.
+
+    Each operation of the filter is evaluated once per distinct value of a field,
+    rather than once per need.
+
+    :return: The view of found needs, or None if the filter is not supported.
+    """
+    batch_pred = try_build_batch_predicate(filter_string)
+    if batch_pred is None:
+        return None
+    fallback = _filter_fallback(config)
+    found, failed = needs.filter_columns(
+        lambda columns, rows: batch_pred(columns, rows, fallback)
+    )
+    if failed:
+        # report only the error of the first failing need, as for the other paths
+        e = next(iter(failed.values()))
+        if append_warning:
+            append_warning = f" {append_warning}"
+        message = f"Filter {filter_string!r} not valid. Error: {e}.{append_warning}"
+        log_warning(log, message, "filter", location=location)
+        if errors is not None:
+            errors.append(message)
+    return found
 
 
 @measure_time("filtering")
@@ -556,6 +989,7 @@ def filter_needs_and_parts(
     location: tuple[str, int | None] | nodes.Node | None = None,
     append_warning: str = "",
     origin_docname: str | None = None,
+    errors: list[str] | None = None,
 ) -> list[NeedItem | NeedPartItem]:
     """
     Filters given needs based on a given filter string.
@@ -567,6 +1001,7 @@ def filter_needs_and_parts(
     :param current_need: current need, which uses the filter.
     :param location: source location for error reporting (docname, line number)
     :param append_warning: additional text to append to any failed filter warning
+    :param errors: if given, the message of any reported filter warning is appended to it
 
     :return: list of found needs
     """
@@ -575,14 +1010,9 @@ def filter_needs_and_parts(
 
     # === Fast path: try compiled predicate to avoid eval() entirely ===
     simple_pred = try_build_simple_predicate(filter_string)
-    var_proxy = config.variant_data_proxy
 
     if simple_pred is not None:
-        fallback: dict[str, Any] | None = None
-        if config.filter_data or var_proxy is not None:
-            fallback = dict(config.filter_data) if config.filter_data else {}
-            if var_proxy is not None:
-                fallback["var"] = var_proxy
+        fallback = _filter_fallback(config)
         found_needs: list[NeedItem | NeedPartItem] = []
         error_reported = False
         for filter_need in needs:
@@ -600,12 +1030,10 @@ def filter_needs_and_parts(
                 if not error_reported:
                     if append_warning:
                         append_warning = f" {append_warning}"
-                    log_warning(
-                        log,
-                        f"Filter {filter_string!r} not valid. Error: {e}.{append_warning}",
-                        "filter",
-                        location=location,
-                    )
+                    message = f"Filter {filter_string!r} not valid. Error: {e}.{append_warning}"
+                    log_warning(log, message, "filter", location=location)
+                    if errors is not None:
+                        errors.append(message)
                     error_reported = True
         return found_needs
 
@@ -631,12 +1059,9 @@ def filter_needs_and_parts(
             if not error_reported:  # Let's report a filter-problem only once
                 if append_warning:
                     append_warning = f" {append_warning}"
-                log_warning(
-                    log,
-                    f"{e}{append_warning}",
-                    "filter",
-                    location=location,
-                )
+                log_warning(log, f"{e}{append_warning}", "filter", location=location)
+                if errors is not None:
+                    errors.append(f"{e}{append_warning}")
                 error_reported = True
 
     return found_needs_slow
@@ -761,6 +1186,38 @@ def filter_single_need(
             raise NeedsInvalidFilter(f"Filter {filter_string!r} not valid. Error: {e}.")
 
     # === Slow path: fall back to eval() ===
+    filter_context = filter_eval_context(
+        need,
+        config,
+        needs=needs,
+        current_need=current_need,
+        origin_docname=origin_docname,
+    )
+
+    try:
+        # Set filter_context as globals and not only locals in eval()!
+        # Otherwise, the vars not be accessed in list comprehensions.
+        result = eval(filter_compiled or filter_string, filter_context)
+        if not isinstance(result, bool):
+            raise NeedsInvalidFilter(
+                f"Filter did not evaluate to a boolean, instead {type(result)}: {result}"
+            )
+    except Exception as e:
+        raise NeedsInvalidFilter(f"Filter {filter_string!r} not valid. Error: {e}.")
+    return result
+
+
+def filter_eval_context(
+    need: NeedItem | NeedPartItem,
+    config: NeedsSphinxConfig,
+    *,
+    needs: Iterable[NeedItem | NeedPartItem] | None = None,
+    current_need: NeedItem | NeedPartItem | None = None,
+    origin_docname: str | None = None,
+) -> dict[str, Any]:
+    """Create the globals for evaluating a filter string on a need with ``eval()``,
+    as used by :func:`filter_single_need`.
+    """
     filter_context: dict[str, Any] = need.filter_context()
     if needs:
         filter_context["needs"] = needs
@@ -771,24 +1228,68 @@ def filter_single_need(
 
     # Get needs external filter data and merge to filter_context
     filter_context.update(config.filter_data)
-    if var_proxy is not None:
+    if (var_proxy := config.variant_data_proxy) is not None:
         filter_context["var"] = var_proxy
 
     filter_context["search"] = need_search
 
     filter_context["c"] = NeedCheckContext(need, origin_docname)
+    return filter_context
+
+
+def filter_single_needs(
+    needs: Iterable[NeedItem | NeedPartItem],
+    config: NeedsSphinxConfig,
+    filter_string: str,
+) -> list[bool | NeedsInvalidFilter]:
+    """Checks if each of the needs passes a filter_string,
+    like :func:`filter_single_need`, but preparing the filter only once.
+
+    :param needs: the needs to check
+    :param config: NeedsSphinxConfig object
+    :param filter_string: string, which is used as input for eval()
+
+    :return: for each need, whether it passes the filter_string,
+        or the exception that :func:`filter_single_need` would raise for it
+    """
+    results: list[bool | NeedsInvalidFilter] = []
+    if (simple_pred := try_build_simple_predicate(filter_string)) is not None:
+        fallback = _filter_fallback(config)
+        for need in needs:
+            try:
+                result = simple_pred(need, fallback)
+            except Exception as e:
+                results.append(
+                    NeedsInvalidFilter(
+                        f"Filter {filter_string!r} not valid. Error: {e}."
+                    )
+                )
+                continue
+            if not isinstance(result, bool):
+                results.append(
+                    NeedsInvalidFilter(
+                        f"Filter did not evaluate to a boolean, instead {type(result)}: {result}"
+                    )
+                )
+                continue
+            results.append(result)
+        return results
 
     try:
-        # Set filter_context as globals and not only locals in eval()!
-        # Otherwise, the vars not be accessed in list comprehensions.
-        result = eval(filter_compiled or filter_string, filter_context)
-        if not isinstance(result, bool):
-            raise NeedsInvalidFilter(
-                f"Filter did not evaluate to a boolean, instead {type(result)}: {result}"
-            )
+        filter_compiled = compile(filter_string, "<string>", "eval")
     except Exception as e:
-        raise NeedsInvalidFilter(f"Filter {filter_string!r} not valid. Error: {e}.")
-    return result
+        error = NeedsInvalidFilter(f"Filter {filter_string!r} not valid. Error: {e}.")
+        return [error for _ in needs]
+    for need in needs:
+        try:
+            results.append(
+                filter_single_need(
+                    need, config, filter_string, filter_compiled=filter_compiled
+                )
+            )
+        except NeedsInvalidFilter as e:
+            results.append(e)
+    return results
 
 
 class NeedCheckContext:
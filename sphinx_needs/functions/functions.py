@@ -24,6 +24,7 @@ from sphinx_needs.debug import measure_time_func
 from sphinx_needs.exceptions import FunctionParsingException
 from sphinx_needs.logging import get_logger, log_warning
 from sphinx_needs.need_item import NeedItem, NeedLink, NeedPartItem
+from sphinx_needs.needs_schema import FieldsSchema
 from sphinx_needs.nodes import Need
 from sphinx_needs.roles.need_func import NeedFunc
 from sphinx_needs.variant_data import (
@@ -292,113 +293,125 @@ def resolve_functions(
 ) -> None:
     """Resolve all dynamic/variant functions in all needs."""
     needs_schema = SphinxNeedsData(app.env).get_schema()
-    var_proxy = needs_config.variant_data_proxy
     for need in needs.values():
-        if not need.has_dynamic_fields:
-            continue
-        for field in list(need._dynamic_fields):
-            try:
-                if (field_schema := needs_schema.get_any_field(field)) is None:
-                    raise RuntimeError("does not exist in schema")
-                resolved: list[Any] = []
-                for item in need._dynamic_fields[field].value:
-                    if isinstance(item, DynamicFunctionParsed):
-                        func_return = _execute_dynamic_func(app, need, needs, item)
-                        if not (
-                            field_schema.type_check(func_return)
-                            or (
-                                field_schema.type == "array"
-                                and field_schema.type_check_item(func_return)
-                            )
-                        ):
-                            raise ValueError(
-                                f"dynamic function value {type(func_return)} is not of type {field_schema.type!r}"
-                                + (
-                                    ""
-                                    if field_schema.type != "array"
-                                    else f" or item type {field_schema.item_type!r}"
-                                )
-                            )
-                        if isinstance(func_return, list | tuple):
-                            resolved.extend(func_return)
-                        else:
-                            resolved.append(func_return)
-                    elif isinstance(item, VariantFunctionParsed):
-                        var_context: dict[str, Any] = {
-                            **need,
-                            **needs_config.filter_data,
-                            "build_tags": set(app.builder.tags),
-                        }
-                        if var_proxy is not None:
-                            var_context["var"] = var_proxy
-                        if (
-                            var_return := _get_variant(
-                                item, needs_config.variants, var_context
+        resolve_need_functions(app, need, needs, needs_config, needs_schema)
+
+
+def resolve_need_functions(
+    app: Sphinx,
+    need: NeedItem,
+    needs: NeedsMutable,
+    needs_config: NeedsSphinxConfig,
+    needs_schema: FieldsSchema,
+) -> None:
+    """Resolve all dynamic/variant functions in a single need.
+
+    :param needs: All needs, which are passed to the dynamic functions.
+    """
+    if not need.has_dynamic_fields:
+        return
+    var_proxy = needs_config.variant_data_proxy
+    for field in list(need._dynamic_fields):
+        try:
+            if (field_schema := needs_schema.get_any_field(field)) is None:
+                raise RuntimeError("does not exist in schema")
+            resolved: list[Any] = []
+            for item in need._dynamic_fields[field].value:
+                if isinstance(item, DynamicFunctionParsed):
+                    func_return = _execute_dynamic_func(app, need, needs, item)
+                    if not (
+                        field_schema.type_check(func_return)
+                        or (
+                            field_schema.type == "array"
+                            and field_schema.type_check_item(func_return)
+                        )
+                    ):
+                        raise ValueError(
+                            f"dynamic function value {type(func_return)} is not of type {field_schema.type!r}"
+                            + (
+                                ""
+                                if field_schema.type != "array"
+                                else f" or item type {field_schema.item_type!r}"
                             )
-                        ) is not None:
-                            if not (
-                                field_schema.type_check(var_return)
-                                or (
-                                    field_schema.type == "array"
-                                    and field_schema.type_check_item(var_return)
-                                )
-                            ):
-                                raise ValueError(
-                                    f"variant value {type(var_return)} is not of type {field_schema.type!r}"
-                                    + (
-                                        ""
-                                        if field_schema.type != "array"
-                                        else f" or item type {field_schema.item_type!r}"
-                                    )
-                                )
-                            if isinstance(var_return, list | tuple):
-                                resolved.extend(var_return)
-                            else:
-                                resolved.append(var_return)
-                    elif isinstance(item, VariantDataParsed):
-                        vd_return = _get_variant_data(item, needs_config.variant_data)
+                        )
+                    if isinstance(func_return, list | tuple):
+                        resolved.extend(func_return)
+                    else:
+                        resolved.append(func_return)
+                elif isinstance(item, VariantFunctionParsed):
+                    var_context: dict[str, Any] = {
+                        **need,
+                        **needs_config.filter_data,
+                        "build_tags": set(app.builder.tags),
+                    }
+                    if var_proxy is not None:
+                        var_context["var"] = var_proxy
+                    if (
+                        var_return := _get_variant(
+                            item, needs_config.variants, var_context
+                        )
+                    ) is not None:
                         if not (
-                            field_schema.type_check(vd_return)
+                            field_schema.type_check(var_return)
                             or (
                                 field_schema.type == "array"
-                                and field_schema.type_check_item(vd_return)
+                                and field_schema.type_check_item(var_return)
                             )
                         ):
                             raise ValueError(
-                                f"variant data value {type(vd_return)} is not of type {field_schema.type!r}"
+                                f"variant value {type(var_return)} is not of type {field_schema.type!r}"
                                 + (
                                     ""
                                     if field_schema.type != "array"
                                     else f" or item type {field_schema.item_type!r}"
                                 )
                             )
-                        if isinstance(vd_return, list | tuple):
-                            resolved.extend(vd_return)
+                        if isinstance(var_return, list | tuple):
+                            resolved.extend(var_return)
                         else:
-                            resolved.append(vd_return)
-                    else:
-                        resolved.append(item)
-
-                if field_schema.type == "string":
-                    need[field] = " ".join(str(el) for el in resolved)
-                elif field_schema.type in {"integer", "number", "boolean"}:
-                    # TODO(mh) unboxing the list for non-joinable types
-                    if len(resolved) > 1:
+                            resolved.append(var_return)
+                elif isinstance(item, VariantDataParsed):
+                    vd_return = _get_variant_data(item, needs_config.variant_data)
+                    if not (
+                        field_schema.type_check(vd_return)
+                        or (
+                            field_schema.type == "array"
+                            and field_schema.type_check_item(vd_return)
+                        )
+                    ):
                         raise ValueError(
-                            f"Field {field!r} of type {field_schema.type!r} cannot have multiple values"
+                            f"variant data value {type(vd_return)} is not of type {field_schema.type!r}"
+                            + (
+                                ""
+                                if field_schema.type != "array"
+                                else f" or item type {field_schema.item_type!r}"
+                            )
                         )
-                    need[field] = resolved[0]
+                    if isinstance(vd_return, list | tuple):
+                        resolved.extend(vd_return)
+                    else:
+                        resolved.append(vd_return)
                 else:
-                    need[field] = resolved
-            except Exception as err:
-                log_warning(
-                    logger,
-                    f"Error while resolving dynamic values for field {field!r}, of need {need['id']!r}: {err}",
-                    "dynamic_function",
-                    location=(need["docname"], need["lineno"])
-                    if need["docname"]
-                    else None,
-                )
+                    resolved.append(item)
+
+            if field_schema.type == "string":
+                need[field] = " ".join(str(el) for el in resolved)
+            elif field_schema.type in {"integer", "number", "boolean"}:
+                # TODO(mh) unboxing the list for non-joinable types
+                if len(resolved) > 1:
+                    raise ValueError(
+                        f"Field {field!r} of type {field_schema.type!r} cannot have multiple values"
+                    )
+                need[field] = resolved[0]
+            else:
+                need[field] = resolved
+        except Exception as err:
+            log_warning(
+                logger,
+                f"Error while resolving dynamic values for field {field!r}, of need {need['id']!r}: {err}",
+                "dynamic_function",
+                location=(need["docname"], need["lineno"]) if need["docname"] else None,
+            )
 
 
 def _get_variant(
@@ -0,0 +1,560 @@
+"""Incremental post-processing of needs data, across builds.
+
+When :ref:`needs_incremental_post_process` is enabled,
+the result of post-processing each need is stored in a cache file in the doctree directory,
+together with what the result depends on.
+On the next build, only needs whose data changed,
+or that read a changed need from a dynamic function, are processed again,
+and the others are restored from the cache (re-emitting their warnings).
+
+As in a full build, where the needs are resolved in order,
+a dynamic function sees the needs before its own need after their dynamic functions were resolved,
+and the needs after it before they were resolved.
+So the state of each need before resolving its dynamic functions is stored as well,
+and a need is also processed again if one of the needs it reads moved to the other side of it.
+
+The link graph of the previous build is also stored,
+so that back links, dead links and link conditions are only resolved again
+for needs whose outgoing or incoming links (or linked needs) changed,
+and constraints are only re-evaluated for restored needs if their links were resolved again.
+The cache is not used at all, if the configuration, the schema,
+or any ``needextend`` directive changed since it was written.
+"""
+
+from __future__ import annotations
+
+import ast
+import hashlib
+import pickle
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass, field, fields
+from pathlib import Path
+from typing import cast
+
+from sphinx.application import Sphinx
+
+from sphinx_needs import __version__
+from sphinx_needs.config import NeedsSphinxConfig
+from sphinx_needs.data import NeedsExtendType, NeedsMutable, SphinxNeedsData
+from sphinx_needs.directives.need import (
+    check_need_links,
+    evaluate_link_conditions,
+    get_allow_dead_links,
+)
+from sphinx_needs.directives.needextend import extend_needs_data
+from sphinx_needs.functions.functions import resolve_need_functions
+from sphinx_needs.logging import LoggedWarning, get_logger, record_warnings
+from sphinx_needs.need_constraints import (
+    compile_constraints,
+    evaluate_constraint_checks,
+    process_need_constraints,
+)
+from sphinx_needs.need_item import NeedConstraintResults, NeedItem, NeedLink
+from sphinx_needs.needs_schema import FieldsSchema
+from sphinx_needs.utils import stable_repr, value_digest
+
+LOGGER = get_logger(__name__)
+
+CACHE_FILENAME = "needs_post_process.pickle"
+"""Name of the cache file, in the doctree directory."""
+
+_CACHE_FORMAT = 3
+"""Increment when the format of the cache changes."""
+
+
+@dataclass(slots=True)
+class _NeedState:
+    """The post-processing state of a single need, stored in the cache."""
+
+    source_digest: bytes
+    """Digest of the need data before post-processing."""
+    resolved: bytes
+    """The pickled need, after ``needextend`` modifications and dynamic functions were applied."""
+    depends_on: frozenset[str] | None
+    """Ids of the needs read by the dynamic functions of the need, or None if all needs were read."""
+    function_warnings: tuple[LoggedWarning, ...]
+    """Warnings emitted when resolving the dynamic functions of the need."""
+    unresolved: bytes | None = None
+    """The pickled need, after ``needextend`` modifications but before dynamic functions were applied,
+    or None if the need has no dynamic functions."""
+    preceding: frozenset[str] = frozenset()
+    """Ids of the needs in ``depends_on`` that came before the need, when it was resolved."""
+    backlinks: dict[str, list[NeedLink]] = field(default_factory=dict)
+    """The resolved back links of the need."""
+    part_backlinks: dict[str, dict[str, list[NeedLink]]] = field(default_factory=dict)
+    """The resolved back links of each part of the need."""
+    has_dead_links: bool = False
+    """Whether the need has outgoing links to needs (or parts) that do not exist."""
+    has_forbidden_dead_links: bool = False
+    """Whether any of these dead links is not allowed."""
+    link_warnings: tuple[LoggedWarning, ...] = ()
+    """Warnings emitted when checking the outgoing links of the need."""
+    constraint_results: NeedConstraintResults | None = None
+    """The results of the constraints of the need."""
+    style: str | None = None
+    """The style of the need, after evaluating its constraints."""
+    constraint_warnings: tuple[LoggedWarning, ...] = ()
+    """Warnings emitted when evaluating the constraints of the need."""
+
+
+@dataclass(slots=True)
+class _PostProcessCache:
+    """The contents of the cache file."""
+
+    fingerprint: bytes
+    """Digest of everything that post-processing depends on, other than the needs."""
+    extends_warned: bool
+    """Whether any warnings were emitted when applying ``needextend`` directives."""
+    needs: dict[str, _NeedState]
+    """The state of each need."""
+    order: bytes
+    """Digest of the order of the need ids."""
+    links: _LinkGraph
+    """The link graph of all needs."""
+
+
+_Edge = tuple[str, str, str | None]
+"""A link in the graph, as ``(link type, need id, part id)``."""
+
+
+@dataclass(slots=True)
+class _LinkGraph:
+    """The links between needs, as adjacency lists in both directions."""
+
+    outgoing: dict[str, tuple[_Edge, ...]] = field(default_factory=dict)
+    """The outgoing links of each need, by source need id, to target need ids."""
+    incoming: dict[str, set[_Edge]] = field(default_factory=dict)
+    """The incoming links of each target need id (which may not exist), from source need ids."""
+
+    def update(self, id: str, edges: tuple[_Edge, ...]) -> set[str] | None:
+        """Set the outgoing links of a need, or remove the need if ``edges`` is empty.
+
+        :returns: The ids of the previous and new targets, or None if the links did not change.
+        """
+        previous = self.outgoing.pop(id, ())
+        if edges:
+            self.outgoing[id] = edges
+        if previous == edges:
+            return None
+        for link_type, target, part in previous:
+            incoming = self.incoming[target]
+            incoming.discard((link_type, id, part))
+            if not incoming:
+                del self.incoming[target]
+        for link_type, target, part in edges:
+            self.incoming.setdefault(target, set()).add((link_type, id, part))
+        return {target for _, target, _ in previous} | {
+            target for _, target, _ in edges
+        }
+
+    def sources(self, target: str) -> Iterator[str]:
+        """Yield the ids of the needs linking to a target need id."""
+        for _, source, _ in self.incoming.get(target, ()):
+            yield source
+
+
+class _UnresolvedNeeds(Mapping[str, NeedItem]):
+    """The restored needs that were not yet reached when resolving dynamic functions in order,
+    in their state before their own dynamic functions were resolved.
+
+    The needs are unpickled the first time they are looked up.
+    """
+
+    __slots__ = ("_loaded", "_states", "pending")
+
+    def __init__(self, states: Mapping[str, _NeedState], ids: Iterable[str]) -> None:
+        self._states = states
+        self._loaded: dict[str, NeedItem] = {}
+        self.pending = {id for id in ids if states[id].unresolved is not None}
+        """Ids of the needs that were not yet reached."""
+
+    def reached(self, id: str) -> None:
+        """Mark a need as reached, after which its resolved state is used."""
+        self.pending.discard(id)
+        self._loaded.pop(id, None)
+
+    def __getitem__(self, key: str) -> NeedItem:
+        if key not in self.pending:
+            raise KeyError(key)
+        if (need := self._loaded.get(key)) is None:
+            need = self._loaded[key] = pickle.loads(
+                cast(bytes, self._states[key].unresolved)
+            )
+        return need
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.pending)
+
+    def __len__(self) -> int:
+        return len(self.pending)
+
+
+class _DependencyRecorder(Mapping[str, NeedItem]):
+    """A read-only mapping of all needs, which records the needs that are read from it.
+
+    :param unresolved: Needs to return instead of the ones in ``needs``.
+    """
+
+    __slots__ = ("_needs", "_unresolved", "read", "read_all")
+
+    def __init__(
+        self,
+        needs: Mapping[str, NeedItem],
+        unresolved: Mapping[str, NeedItem] | None = None,
+    ) -> None:
+        self._needs = needs
+        self._unresolved = unresolved or {}
+        self.read: set[str] = set()
+        """Ids of needs that were looked up (including ones that do not exist)."""
+        self.read_all = False
+        """Whether the needs were iterated over."""
+
+    def __getitem__(self, key: str) -> NeedItem:
+        self.read.add(key)
+        if (need := self._unresolved.get(key)) is not None:
+            return need
+        return self._needs[key]
+
+    def __contains__(self, key: object) -> bool:
+        if isinstance(key, str):
+            self.read.add(key)
+        return key in self._needs
+
+    def __iter__(self) -> Iterator[str]:
+        self.read_all = True
+        return iter(self._needs)
+
+    def __len__(self) -> int:
+        self.read_all = True
+        return len(self._needs)
+
+
+def post_process_needs_incrementally(app: Sphinx, needs: NeedsMutable) -> None:
+    """Post-process the needs in place, re-using the results of the previous build where possible.
+
+    The result is the same as applying ``needextend`` directives, resolving dynamic functions,
+    resolving links and evaluating constraints for all needs,
+    provided that dynamic functions only depend on the needs they read and the configuration.
+    """
+    needs_data = SphinxNeedsData(app.env)
+    needs_config = NeedsSphinxConfig(app.config)
+    schema = needs_data.get_schema()
+    extends = needs_data.get_or_create_extends()
+    cache_path = Path(app.doctreedir, CACHE_FILENAME)
+
+    source_digests = {id: value_digest(need) for id, need in needs.items()}
+    order = value_digest(tuple(needs))
+    fingerprint = _fingerprint(app, needs_config, schema, extends)
+
+    previous = _load_cache(cache_path)
+    states: dict[str, _NeedState]
+    if (
+        previous is None
+        or previous.fingerprint != fingerprint
+        or previous.extends_warned
+    ):
+        states = {}
+        graph = _LinkGraph()
+        dirty: set[str] = set(needs)
+    else:
+        states = previous.needs
+        graph = previous.links
+        dirty = _dirty_needs(
+            states, source_digests, order_changed=previous.order != order
+        )
+    LOGGER.verbose(f"Post-processing {len(dirty & needs.keys())} of {len(needs)} needs")
+
+    # restore the needs that do not need to be processed again
+    for id in needs:
+        if id not in dirty:
+            needs[id] = pickle.loads(states[id].resolved)
+
+    with record_warnings() as extend_warnings:
+        extend_needs_data(
+            needs,
+            extends,
+            needs_config,
+            only=None if dirty.issuperset(needs) else dirty,
+        )
+
+    # dynamic functions are resolved in order, so needs that were restored,
+    # but come after the need being resolved, are read in their unresolved state
+    positions = {id: position for position, id in enumerate(needs)}
+    unresolved = _UnresolvedNeeds(states, (id for id in needs if id not in dirty))
+    new_states: dict[str, _NeedState] = {}
+    for id, need in needs.items():
+        if id not in dirty:
+            unresolved.reached(id)
+            new_states[id] = state = states[id]
+            for warning in state.function_warnings:
+                warning.replay()
+            continue
+        recorder = _DependencyRecorder(needs, unresolved)
+        unresolved_state = (
+            pickle.dumps(need, pickle.HIGHEST_PROTOCOL)
+            if need.has_dynamic_fields
+            else None
+        )
+        with record_warnings() as function_warnings:
+            resolve_need_functions(
+                app, need, cast(NeedsMutable, recorder), needs_config, schema
+            )
+        need.sort_links()
+        position = positions[id]
+        new_states[id] = _NeedState(
+            source_digest=source_digests[id],
+            resolved=pickle.dumps(need, pickle.HIGHEST_PROTOCOL),
+            depends_on=None if recorder.read_all else frozenset(recorder.read),
+            function_warnings=tuple(function_warnings),
+            unresolved=unresolved_state,
+            preceding=frozenset(
+                read
+                for read in recorder.read
+                if positions.get(read, position) < position
+            ),
+        )
+
+    relinked = _resolve_links(needs, dirty, new_states, graph, needs_config, schema)
+
+    constraints = compile_constraints(needs_config)
+    check_results = evaluate_constraint_checks(
+        (need for id, need in needs.items() if id in relinked),
+        needs_config,
+        constraints,
+    )
+    for id, need in needs.items():
+        state = new_states[id]
+        if id not in relinked:
+            need["style"] = state.style
+            need.set_constraint_results(state.constraint_results)
+            for warning in state.constraint_warnings:
+                warning.replay()
+            continue
+        with record_warnings() as constraint_warnings:
+            process_need_constraints(
+                need,
+                needs_config,
+                constraints=constraints,
+                check_results=check_results.get(id, {}),
+            )
+        state.constraint_results = need.constraint_results
+        state.style = need["style"]
+        state.constraint_warnings = tuple(constraint_warnings)
+
+    _save_cache(
+        cache_path,
+        _PostProcessCache(
+            fingerprint=fingerprint,
+            extends_warned=bool(extend_warnings),
+            needs=new_states,
+            order=order,
+            links=graph,
+        ),
+    )
+
+
+def _resolve_links(
+    needs: NeedsMutable,
+    dirty: set[str],
+    states: Mapping[str, _NeedState],
+    graph: _LinkGraph,
+    needs_config: NeedsSphinxConfig,
+    schema: FieldsSchema,
+) -> set[str]:
+    """Resolve links between needs, like :func:`.resolve_links`,
+    updating the link graph and the link state of the needs in place.
+
+    Only the needs affected by changes since the previous build are resolved again,
+    the others are restored from their state.
+
+    :param dirty: Ids of needs that were added, removed or processed again.
+    :returns: Ids of the needs whose links were resolved again.
+    """
+    retarget: set[str] = set()
+    """Needs whose back links must be resolved again."""
+    recheck: set[str] = set()
+    """Needs whose outgoing links must be checked again."""
+    for id in dirty:
+        need = needs.get(id)
+        edges = (
+            ()
+            if need is None
+            else tuple(
+                (link_type, link.id, link.part)
+                for link_type, links in need.iter_links_items(as_str=False)
+                for link in links
+            )
+        )
+        if (targets := graph.update(id, edges)) is not None:
+            retarget.update(targets)
+        retarget.add(id)
+    # link conditions and dead links depend on the target need
+    for id in retarget:
+        recheck.update(graph.sources(id))
+    retarget.intersection_update(needs)
+    recheck.update(dirty)
+    recheck.intersection_update(needs)
+
+    for id, need in needs.items():
+        state = states[id]
+        if id not in retarget:
+            for link_type, links in state.backlinks.items():
+                need.set_backlinks(link_type, links)
+            for part_id, part_links in state.part_backlinks.items():
+                for link_type, links in part_links.items():
+                    need.set_backlinks(link_type, links, part_id=part_id)
+            continue
+        need.reset_backlinks()
+        backlinks: dict[str, list[NeedLink]] = {}
+        part_backlinks: dict[tuple[str, str], list[NeedLink]] = {}
+        for link_type, source, part in graph.incoming.get(id, ()):
+            backlinks.setdefault(link_type, []).append(NeedLink(id=source))
+            if part is not None and need.get_part(part) is not None:
+                part_backlinks.setdefault((part, link_type), []).append(
+                    NeedLink(id=source)
+                )
+        for link_type, links in backlinks.items():
+            need.set_backlinks(link_type, links)
+        for (part_id, link_type), links in part_backlinks.items():
+            need.set_backlinks(link_type, links, part_id=part_id)
+        need.sort_links()
+        state.backlinks = dict(need.iter_backlinks_items(as_str=False))
+        state.part_backlinks = {part.id: dict(part.backlinks) for part in need.parts}
+
+    allow_dead_links = get_allow_dead_links(schema)
+    condition_results = evaluate_link_conditions(
+        (needs[id] for id in recheck), needs, needs_config
+    )
+    for id, need in needs.items():
+        state = states[id]
+        if id in recheck:
+            with record_warnings() as link_warnings:
+                check_need_links(
+                    need, needs, needs_config, allow_dead_links, condition_results
+                )
+            state.has_dead_links = need["has_dead_links"]
+            state.has_forbidden_dead_links = need["has_forbidden_dead_links"]
+            state.link_warnings = tuple(link_warnings)
+            continue
+        if state.has_dead_links:
+            need["has_dead_links"] = True
+        if state.has_forbidden_dead_links:
+            need["has_forbidden_dead_links"] = True
+        for warning in state.link_warnings:
+            warning.replay()
+
+    LOGGER.verbose(
+        f"Resolved back links of {len(retarget)} needs, "
+        f"and checked the links of {len(recheck)} needs"
+    )
+    return retarget | recheck
+
+
+def _dirty_needs(
+    states: Mapping[str, _NeedState],
+    source_digests: Mapping[str, bytes],
+    *,
+    order_changed: bool = False,
+) -> set[str]:
+    """Get the ids of needs that must be processed again.
+
+    These are the needs that were added, removed or changed,
+    the needs that read a need which moved from before them to after them (or vice versa),
+    and (transitively) the needs whose dynamic functions read any of them.
+
+    :param source_digests: The digests of the current needs, in order.
+    :param order_changed: Whether the order of the needs changed since the previous build.
+    """
+    dirty = {
+        id
+        for id, digest in source_digests.items()
+        if (state := states.get(id)) is None or state.source_digest != digest
+    }
+    dirty.update(id for id in states if id not in source_digests)
+    if order_changed:
+        positions = {id: position for position, id in enumerate(source_digests)}
+        for id, position in positions.items():
+            state = states.get(id)
+            if state is None or state.depends_on is None:
+                continue
+            if any(
+                (positions.get(read, position) < position) != (read in state.preceding)
+                for read in state.depends_on
+            ):
+                dirty.add(id)
+
+    readers: dict[str, list[str]] = {}
+    read_all: list[str] = []
+    for id, state in states.items():
+        if state.depends_on is None:
+            read_all.append(id)
+        else:
+            for dependency in state.depends_on:
+                readers.setdefault(dependency, []).append(id)
+    if dirty or order_changed:
+        dirty.update(read_all)
+
+    stack = list(dirty)
+    while stack:
+        for reader in readers.get(stack.pop(), ()):
+            if reader not in dirty:
+                dirty.add(reader)
+                stack.append(reader)
+    return dirty
+
+
+def _fingerprint(
+    app: Sphinx,
+    needs_config: NeedsSphinxConfig,
+    schema: FieldsSchema,
+    extends: Mapping[str, NeedsExtendType],
+) -> bytes:
+    """Create a digest of everything, other than the needs, that post-processing depends on.
+
+    If the ``needextend`` directives cannot be applied to a subset of the needs,
+    because their filters refer to all ``needs``, a unique value is returned.
+    """
+    if any(_refers_to_all_needs(extend) for extend in extends.values()):
+        return b""
+    hasher = hashlib.blake2b(digest_size=16)
+    hasher.update(f"{_CACHE_FORMAT}:{__version__}".encode())
+    for item in fields(NeedsSphinxConfig):
+        value = getattr(needs_config, item.name)
+        hasher.update(f"{item.name}={stable_repr(value)}".encode())
+    hasher.update(stable_repr(needs_config.functions).encode())
+    hasher.update(stable_repr(sorted(app.builder.tags)).encode())
+    hasher.update(value_digest(schema))
+    hasher.update(value_digest(sorted(extends.items())))
+    return hasher.digest()
+
+
+def _refers_to_all_needs(extend: NeedsExtendType) -> bool:
+    """Whether the filter of a ``needextend`` directive (possibly) refers to the ``needs`` variable."""
+    if extend["filter_is_id"]:
+        return False
+    try:
+        tree = ast.parse(extend["filter"])
+    except SyntaxError:
+        return True
+    return any(
+        isinstance(node, ast.Name) and node.id == "needs" for node in ast.walk(tree)
+    )
+
+
+def _load_cache(path: Path) -> _PostProcessCache | None:
+    """Load the cache file, returning None if it does not exist or cannot be read."""
+    try:
+        with path.open("rb") as f:
+            cache = pickle.load(f)
+    except Exception:
+        return None
+    return cache if isinstance(cache, _PostProcessCache) else None
+
+
+def _save_cache(path: Path, cache: _PostProcessCache) -> None:
+    """Save the cache file, replacing it only once it is completely written."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_suffix(".tmp")
+    with temp_path.open("wb") as f:
+        pickle.dump(cache, f, pickle.HIGHEST_PROTOCOL)
+    temp_path.replace(path)
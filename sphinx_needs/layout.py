@@ -14,6 +14,7 @@ from contextlib import suppress
 from functools import lru_cache
 from optparse import Values
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, ClassVar
 from urllib.parse import urlparse
 
 import requests
@@ -23,6 +24,7 @@ from docutils.parsers.rst import Parser, languages
 from docutils.parsers.rst.states import Inliner, Struct
 from docutils.utils import new_document
 from sphinx.application import Sphinx
+from sphinx.environment import BuildEnvironment
 from sphinx.util.logging import getLogger
 
 from sphinx_needs.config import NeedsSphinxConfig
@@ -38,6 +40,9 @@ from sphinx_needs.string_links import (
 )
 from sphinx_needs.utils import match_string_link
 
+if TYPE_CHECKING:
+    from sphinx_needs.functions.functions import DynamicFunctionParsed
+
 LOGGER = getLogger(__name__)
 
 
@@ -91,11 +96,195 @@ def _generate_inline_parser() -> tuple[Values, Inliner]:
     return doc_settings, inline_parser
 
 
+_parsed_lines: dict[str, tuple[nodes.Node, ...]] = {}
+"""Layout lines and prefixes parsed for inline rst, shared by all needs of a build."""
+
+
+def clear_parsed_layouts(_app: Sphinx, _env: BuildEnvironment) -> None:
+    """Forget the layout lines parsed in a previous build, e.g. with other roles."""
+    _parsed_lines.clear()
+
+
+def _parse_inline(line: str) -> tuple[nodes.Node, ...]:
+    """Parse a single line/string for inline rst, once per build.
+
+    The nodes are shared, so they must be copied before they are changed or inserted.
+    """
+    try:
+        return _parsed_lines[line]
+    except KeyError:
+        pass
+    doc_settings, inline_parser = _generate_inline_parser()
+    dummy_doc = new_document("dummy", doc_settings)
+    doc_memo = Struct(
+        document=dummy_doc,
+        reporter=dummy_doc.reporter,
+        language=languages.get_language(dummy_doc.settings.language_code),
+        title_styles=[],
+        section_level=0,
+        section_bubble_up_kludge=False,
+        inliner=None,
+    )
+    result, message = inline_parser.parse(  # type: ignore[attr-defined]
+        line, 0, doc_memo, dummy_doc
+    )
+    if message:
+        raise SphinxNeedLayoutException(message)
+    parsed = _parsed_lines[line] = tuple(result)
+    return parsed
+
+
+@lru_cache(maxsize=1024)
+def _split_functions(
+    text: str,
+) -> tuple[tuple[str, DynamicFunctionParsed | None], ...]:
+    """Split a text of a layout line into static text and ``<<..>>`` function calls.
+
+    :return: ``(text, None)`` for static text and ``(definition, call)`` for a call
+    :raises SphinxNeedLayoutException: if the text can not be split
+    """
+    from sphinx_needs.functions.functions import DynamicFunctionParsed
+
+    elements: list[tuple[str, DynamicFunctionParsed | None]] = []
+    for func_def, text_part in re.findall(r"(<<[^<>]+>>)|([^<>]+)", text):
+        # Check if normal string was detected
+        if len(text_part) > 0 and len(func_def) == 0:
+            elements.append((text_part, None))
+        # Check if function_definition was detected
+        elif len(text_part) == 0 and len(func_def) > 1:
+            func_def_clean = func_def.replace("<<", "").replace(">>", "")
+            elements.append(
+                (
+                    func_def_clean,
+                    DynamicFunctionParsed.from_string(func_def_clean, allow_need=False),
+                )
+            )
+        else:
+            raise SphinxNeedLayoutException(
+                f"Error during layout line parsing. This looks strange: {(func_def, text_part)}"
+            )
+    return tuple(elements)
+
+
 class LayoutHandler:
     """
     Cares about the correct layout handling
     """
 
+    # The grid layouts, by name, with the name of the method creating them,
+    # and the arguments for it.
+    grids: ClassVar[dict[str, str | dict[str, Any]]] = {
+        "simple": {
+            "func": "_grid_simple",
+            "configs": {
+                "colwidths": [100],
+                "side_left": False,
+                "side_right": False,
+                "footer": False,
+            },
+        },
+        "simple_footer": {
+            "func": "_grid_simple",
+            "configs": {
+                "colwidths": [100],
+                "side_left": False,
+                "side_right": False,
+                "footer": True,
+            },
+        },
+        "simple_side_left": {
+            "func": "_grid_simple",
+            "configs": {
+                "colwidths": [30, 70],
+                "side_left": "full",
+                "side_right": False,
+                "footer": False,
+            },
+        },
+        "simple_side_right": {
+            "func": "_grid_simple",
+            "configs": {
+                "colwidths": [70, 30],
+                "side_left": False,
+                "side_right": "full",
+                "footer": False,
+            },
+        },
+        "simple_side_left_partial": {
+            "func": "_grid_simple",
+            "configs": {
+                "colwidths": [20, 80],
+                "side_left": "part",
+                "side_right": False,
+                "footer": False,
+            },
+        },
+        "simple_side_right_partial": {
+            "func": "_grid_simple",
+            "configs": {
+                "colwidths": [80, 20],
+                "side_left": False,
+                "side_right": "part",
+                "footer": False,
+            },
+        },
+        "complex": "_grid_complex",
+        "content": {
+            "func": "_grid_content",
+            "configs": {
+                "colwidths": [100],
+                "side_left": False,
+                "side_right": False,
+                "footer": False,
+            },
+        },
+        "content_footer": {
+            "func": "_grid_content",
+            "configs": {
+                "colwidths": [100],
+                "side_left": False,
+                "side_right": False,
+                "footer": True,
+            },
+        },
+        "content_side_left": {
+            "func": "_grid_content",
+            "configs": {
+                "colwidths": [5, 95],
+                "side_left": True,
+                "side_right": False,
+                "footer": False,
+            },
+        },
+        "content_side_right": {
+            "func": "_grid_content",
+            "configs": {
+                "colwidths": [95, 5],
+                "side_left": False,
+                "side_right": True,
+                "footer": False,
+            },
+        },
+        "content_footer_side_left": {
+            "func": "_grid_content",
+            "configs": {
+                "colwidths": [5, 95],
+                "side_left": True,
+                "side_right": False,
+                "footer": True,
+            },
+        },
+        "content_footer_side_right": {
+            "func": "_grid_content",
+            "configs": {
+                "colwidths": [95, 5],
+                "side_left": False,
+                "side_right": True,
+                "footer": True,
+            },
+        },
+    }
+
     def __init__(
         self,
         app: Sphinx,
@@ -155,134 +344,6 @@ class LayoutHandler:
         self.node_table = nodes.table(classes=classes, ids=[self.need["id"]])
         self.node_tbody = nodes.tbody()
 
-        self.grids = {
-            "simple": {
-                "func": self._grid_simple,
-                "configs": {
-                    "colwidths": [100],
-                    "side_left": False,
-                    "side_right": False,
-                    "footer": False,
-                },
-            },
-            "simple_footer": {
-                "func": self._grid_simple,
-                "configs": {
-                    "colwidths": [100],
-                    "side_left": False,
-                    "side_right": False,
-                    "footer": True,
-                },
-            },
-            "simple_side_left": {
-                "func": self._grid_simple,
-                "configs": {
-                    "colwidths": [30, 70],
-                    "side_left": "full",
-                    "side_right": False,
-                    "footer": False,
-                },
-            },
-            "simple_side_right": {
-                "func": self._grid_simple,
-                "configs": {
-                    "colwidths": [70, 30],
-                    "side_left": False,
-                    "side_right": "full",
-                    "footer": False,
-                },
-            },
-            "simple_side_left_partial": {
-                "func": self._grid_simple,
-                "configs": {
-                    "colwidths": [20, 80],
-                    "side_left": "part",
-                    "side_right": False,
-                    "footer": False,
-                },
-            },
-            "simple_side_right_partial": {
-                "func": self._grid_simple,
-                "configs": {
-                    "colwidths": [80, 20],
-                    "side_left": False,
-                    "side_right": "part",
-                    "footer": False,
-                },
-            },
-            "complex": self._grid_complex,
-            "content": {
-                "func": self._grid_content,
-                "configs": {
-                    "colwidths": [100],
-                    "side_left": False,
-                    "side_right": False,
-                    "footer": False,
-                },
-            },
-            "content_footer": {
-                "func": self._grid_content,
-                "configs": {
-                    "colwidths": [100],
-                    "side_left": False,
-                    "side_right": False,
-                    "footer": True,
-                },
-            },
-            "content_side_left": {
-                "func": self._grid_content,
-                "configs": {
-                    "colwidths": [5, 95],
-                    "side_left": True,
-                    "side_right": False,
-                    "footer": False,
-                },
-            },
-            "content_side_right": {
-                "func": self._grid_content,
-                "configs": {
-                    "colwidths": [95, 5],
-                    "side_left": False,
-                    "side_right": True,
-                    "footer": False,
-                },
-            },
-            "content_footer_side_left": {
-                "func": self._grid_content,
-                "configs": {
-                    "colwidths": [5, 95],
-                    "side_left": True,
-                    "side_right": False,
-                    "footer": True,
-                },
-            },
-            "content_footer_side_right": {
-                "func": self._grid_content,
-                "configs": {
-                    "colwidths": [95, 5],
-                    "side_left": False,
-                    "side_right": True,
-                    "footer": True,
-                },
-            },
-        }
-
-        # Dummy Document setup
-        self.doc_settings, self.inline_parser = _generate_inline_parser()
-        self.dummy_doc = new_document("dummy", self.doc_settings)
-        self.doc_language = languages.get_language(
-            self.dummy_doc.settings.language_code
-        )
-        self.doc_memo = Struct(
-            document=self.dummy_doc,
-            reporter=self.dummy_doc.reporter,
-            language=self.doc_language,
-            title_styles=[],
-            section_level=0,
-            section_bubble_up_kludge=False,
-            inliner=None,
-        )
-
         self.functions: dict[
             str, Callable[..., None | nodes.Node | list[nodes.Node]]
         ] = {
@@ -312,11 +373,11 @@ class LayoutHandler:
                 )
             )
 
-        func = self.grids[self.layout["grid"]]
-        if callable(func):
-            func()
+        grid = self.grids[self.layout["grid"]]
+        if isinstance(grid, str):
+            getattr(self, grid)()
         else:
-            func["func"](**func["configs"])  # type: ignore[index]
+            getattr(self, grid["func"])(**grid["configs"])
 
         return self.node_table
 
@@ -351,12 +412,7 @@ class LayoutHandler:
         :param line: string to parse
         :return: nodes
         """
-        result, message = self.inline_parser.parse(  # type: ignore[attr-defined]
-            line, 0, self.doc_memo, self.dummy_doc
-        )
-        if message:
-            raise SphinxNeedLayoutException(message)
-        return result  # type: ignore[no-any-return]
+        return [node.deepcopy() for node in _parse_inline(line)]
 
     def _func_replace(self, section_nodes: list[nodes.Node]) -> list[nodes.Node]:
         """
@@ -377,83 +433,62 @@ class LayoutHandler:
                     node.replace(child, new_child)  # type: ignore[attr-defined]
                 return_nodes.append(node)
             else:
-                node_str = node.astext()
-                # func_elements = re.findall(r'<<([a-z_()]*)>>', node_str)
                 node_line = nodes.inline()
 
-                line_elements = re.findall(r"(<<[^<>]+>>)|([^<>]+)", node_str)
-
-                for line_element in line_elements:
-                    text = line_element[1]
-                    func_def = line_element[0]
-                    # Check if normal string was detected
-                    if len(text) > 0 and len(func_def) == 0:
-                        node_line += nodes.Text(text)
-                        result = nodes.Text(text)
-                    # Check if function_definition was detected
-                    elif len(text) == 0 and len(func_def) > 1:
-                        from sphinx_needs.functions.functions import (
-                            DynamicFunctionParsed,
-                        )
-
-                        func_def_clean = func_def.replace("<<", "").replace(">>", "")
-                        df = DynamicFunctionParsed.from_string(
-                            func_def_clean, allow_need=False
-                        )
-
-                        # Replace place holders
-                        # Looks for {{name}}, where name must be an option of need, and replaces it with the
-                        # related need content
-                        args = []
-                        for arg in df.args:
-                            # If argument is not a string, nothing to replace
-                            # (replacement in string-lists is not supported)
-                            try:
-                                args.append(
-                                    self._replace_place_holder(arg)
-                                    if isinstance(arg, str)
-                                    else arg
-                                )
-                            except SphinxNeedLayoutException as e:
-                                raise SphinxNeedLayoutException(
-                                    'Referenced item "{}" in {} not available in need {}'.format(
-                                        e, func_def_clean, self.need["id"]
-                                    )
-                                )
-
-                        kwargs = {}
-                        for key, karg in df.kwargs:
-                            # If argument is not a string, nothing to replace
-                            # (replacement in string-lists is not supported)
-                            try:
-                                kwargs[key] = (
-                                    self._replace_place_holder(karg)
-                                    if isinstance(karg, str)
-                                    else karg
-                                )
-                            except SphinxNeedLayoutException as e:
-                                raise SphinxNeedLayoutException(
-                                    'Referenced item "{}" in {} not available in need {}'.format(
-                                        e, func_def_clean, self.need["id"]
-                                    )
+                for func_def_clean, line_element in _split_functions(node.astext()):
+                    if line_element is None:
+                        node_line += nodes.Text(func_def_clean)
+                        continue
+
+                    # Replace place holders
+                    # Looks for {{name}}, where name must be an option of need, and replaces it with the
+                    # related need content
+                    args = []
+                    for arg in line_element.args:
+                        # If argument is not a string, nothing to replace
+                        # (replacement in string-lists is not supported)
+                        try:
+                            args.append(
+                                self._replace_place_holder(arg)
+                                if isinstance(arg, str)
+                                else arg
+                            )
+                        except SphinxNeedLayoutException as e:
+                            raise SphinxNeedLayoutException(
+                                'Referenced item "{}" in {} not available in need {}'.format(
+                                    e, func_def_clean, self.need["id"]
                                 )
+                            )
 
+                    kwargs = {}
+                    for key, karg in line_element.kwargs:
+                        # If argument is not a string, nothing to replace
+                        # (replacement in string-lists is not supported)
                         try:
-                            func = self.functions[df.name]
-                        except KeyError:
+                            kwargs[key] = (
+                                self._replace_place_holder(karg)
+                                if isinstance(karg, str)
+                                else karg
+                            )
+                        except SphinxNeedLayoutException as e:
                             raise SphinxNeedLayoutException(
-                                "Used function {} unknown. Please use {}".format(
-                                    df.name, ", ".join(self.functions.keys())
+                                'Referenced item "{}" in {} not available in need {}'.format(
+                                    e, func_def_clean, self.need["id"]
                                 )
                             )
-                        result = func(*args, **kwargs)
 
-                        if result:
-                            node_line += result
-                    else:
+                    try:
+                        func = self.functions[line_element.name]
+                    except KeyError:
                         raise SphinxNeedLayoutException(
-                            f"Error during layout line parsing. This looks strange: {line_element}"
+                            "Used function {} unknown. Please use {}".format(
+                                line_element.name, ", ".join(self.functions.keys())
+                            )
                         )
+                    result = func(*args, **kwargs)
+
+                    if result:
+                        node_line += result
 
                 return_nodes.append(node_line)
         return return_nodes
@@ -1,5 +1,5 @@
 $(document).ready(function() {
-    $('table.NEEDS_DATATABLES').DataTable( {
+    var options = {
         dom: 'lBfrtip',
         colReorder: true,
         scrollX: false,
@@ -12,6 +12,36 @@ $(document).ready(function() {
             'copy', 'excel', 'pdf'
         ],
         responsive: false
+    };
+
+    $('table.NEEDS_DATATABLES').not('.NEEDS_DATA').DataTable(options);
+
+    // Tables with ":render: data" only contain their header,
+    // the rows are fetched from a JSON file and drawn when they are scrolled to.
+    var root = document.documentElement.dataset.content_root;
+    if (root === undefined) {
+        root = (window.DOCUMENTATION_OPTIONS && DOCUMENTATION_OPTIONS.URL_ROOT) || '';
+    }
+    $('table.NEEDS_DATATABLES.NEEDS_DATA').each(function() {
+        // the name of the file is given by the NEEDS_DATA_<name> class of the table
+        var name = this.className.match(/\bNEEDS_DATA_(\w+)/)[1];
+        var columns = $(this).find('thead th').map(function(index) {
+            return {data: 'cells.' + index};
+        }).get();
+        $(this).DataTable($.extend({}, options, {
+            ajax: {
+                url: root + '_static/sphinx-needs/needtables/' + name + '.json',
+                dataSrc: 'rows'
+            },
+            columns: columns,
+            createdRow: function(row, data) {
+                $(row).addClass(data.classes);
+            },
+            deferRender: true,
+            scroller: true,
+            scrollY: '70vh',
+            scrollCollapse: true
+        }));
     });
 
 } );
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
 from typing import Literal
 
 from docutils.nodes import Node
 from sphinx import version_info
 from sphinx.util import logging
-from sphinx.util.logging import SphinxLoggerAdapter
+from sphinx.util.logging import SphinxLoggerAdapter, get_node_location
 
 
 def get_logger(name: str) -> SphinxLoggerAdapter:
@@ -111,6 +114,49 @@ WarningSubTypeDescription: dict[WarningSubTypes, str] = {
 }
 
 
+@dataclass(frozen=True, slots=True)
+class LoggedWarning:
+    """A warning logged with :func:`log_warning`, that can be logged again with :meth:`replay`."""
+
+    logger: str
+    message: str
+    subtype: WarningSubTypes
+    location: str | tuple[str | None, int | None] | None
+    color: str | None
+    once: bool
+    type: str
+
+    def replay(self) -> None:
+        """Log the warning again."""
+        log_warning(
+            get_logger(self.logger),
+            self.message,
+            self.subtype,
+            location=self.location,
+            color=self.color,
+            once=self.once,
+            type=self.type,
+        )
+
+
+_warning_records: list[list[LoggedWarning]] = []
+
+
+@contextmanager
+def record_warnings() -> Iterator[list[LoggedWarning]]:
+    """Record the warnings logged with :func:`log_warning` within the context,
+    so that they can be replayed later, e.g. when re-using cached results.
+
+    The warnings are still logged as normal.
+    """
+    records: list[LoggedWarning] = []
+    _warning_records.append(records)
+    try:
+        yield records
+    finally:
+        _warning_records.remove(records)
+
+
 def log_warning(
     logger: SphinxLoggerAdapter,
     message: str,
@@ -122,6 +168,21 @@ def log_warning(
     once: bool = False,
     type: str = "needs",
 ) -> None:
+    if _warning_records:
+        if isinstance(location, Node):
+            location = get_node_location(location)
+        record = LoggedWarning(
+            logger.logger.name.removeprefix(f"{logging.NAMESPACE}."),
+            message,
+            subtype,
+            location,
+            color,
+            once,
+            type,
+        )
+        for records in _warning_records:
+            records.append(record)
+
     # Since sphinx in v7.3, sphinx will show warning types if `show_warning_types=True` is set,
     # and in v8.0 this was made the default.
     if version_info < (8,):
@@ -1,17 +1,137 @@
 from __future__ import annotations
 
+import ast
+from collections.abc import Iterable, Mapping
+from contextlib import suppress
+from dataclasses import dataclass
 from typing import Any, cast
 
-from sphinx_needs._jinja import render_template_string
+from sphinx_needs._jinja import (
+    CompiledTemplate,
+    compile_template,
+    render_template_string,
+)
 from sphinx_needs.config import NeedsSphinxConfig
 from sphinx_needs.data import NeedsMutable
-from sphinx_needs.exceptions import NeedsConstraintFailed
-from sphinx_needs.filter_common import filter_single_need
+from sphinx_needs.exceptions import NeedsConstraintFailed, NeedsInvalidFilter
+from sphinx_needs.filter_common import filter_single_need, filter_single_needs
 from sphinx_needs.logging import get_logger, log_warning
-from sphinx_needs.need_item import NeedConstraintResults
+from sphinx_needs.need_item import NeedConstraintResults, NeedItem
 
 logger = get_logger(__name__)
 
+ConstraintCheckResults = Mapping[
+    str, Mapping[str, list[bool | NeedsInvalidFilter | None]]
+]
+"""The results of the checks of each constraint, per need id, as
+``{need id: {constraint: [result of check_0, result of check_1, ...]}}``,
+where the result is None for checks that refer to the ``style`` of the need."""
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledConstraint:
+    """A constraint of ``needs_constraints``, prepared for evaluation."""
+
+    checks: tuple[tuple[str, str], ...]
+    """The ``(name, filter string)`` of each check."""
+    style_checks: frozenset[str]
+    """The names of the checks that (may) refer to the ``style`` field,
+    which failing checks change, so they must be evaluated in order for each need."""
+    severity: str | None
+    error_message: str | None
+    error_template: CompiledTemplate | None
+    """The compiled ``error_message``, or ``None`` if it is not a valid template,
+    in which case rendering it reports the error."""
+
+    def render_error(self, need: NeedItem) -> str | None:
+        """Render the error message for a need that failed a check."""
+        if self.error_message is None:
+            return None
+        context = cast(dict[str, Any], need)
+        if self.error_template is not None:
+            return self.error_template.render(context)
+        return render_template_string(self.error_message, context, autoescape=False)
+
+
+def compile_constraints(config: NeedsSphinxConfig) -> dict[str, CompiledConstraint]:
+    """Prepare all ``needs_constraints`` for evaluation,
+    compiling their error message templates once.
+    """
+    compiled: dict[str, CompiledConstraint] = {}
+    for constraint, executable_constraints in config.constraints.items():
+        error_message: str | None = None
+        error_template: CompiledTemplate | None = None
+        if "error_message" in executable_constraints:
+            error_message = str(executable_constraints["error_message"])
+            # an invalid template is reported, if the message is rendered
+            with suppress(Exception):
+                error_template = compile_template(error_message, autoescape=False)
+        checks = tuple(
+            (name, cmd)
+            for name, cmd in executable_constraints.items()
+            # special keys, that are not a check
+            if name not in ("severity", "error_message")
+        )
+        compiled[constraint] = CompiledConstraint(
+            checks=checks,
+            style_checks=frozenset(
+                name for name, cmd in checks if _refers_to_style(cmd)
+            ),
+            severity=executable_constraints.get("severity"),
+            error_message=error_message,
+            error_template=error_template,
+        )
+    return compiled
+
+
+def _refers_to_style(filter_string: str) -> bool:
+    """Whether a filter string (possibly) refers to the ``style`` field."""
+    try:
+        tree = ast.parse(filter_string, mode="eval")
+    except SyntaxError:
+        return True
+    return any(
+        isinstance(node, ast.Name) and node.id == "style" for node in ast.walk(tree)
+    )
+
+
+def evaluate_constraint_checks(
+    needs: Iterable[NeedItem],
+    config: NeedsSphinxConfig,
+    constraints: Mapping[str, CompiledConstraint],
+) -> ConstraintCheckResults:
+    """Evaluate the checks of all constraints, for the needs that declare them.
+
+    Each check is evaluated for all of its needs at once,
+    so that its filter string is only prepared once.
+    Checks referring to the ``style`` field are not evaluated,
+    since the failure of an earlier check may change it;
+    :func:`process_need_constraints` evaluates them in order instead.
+    """
+    declaring: dict[str, dict[str, NeedItem]] = {}
+    for need in needs:
+        for constraint in need["constraints"]:
+            if constraint in constraints:
+                declaring.setdefault(constraint, {})[need["id"]] = need
+
+    results: dict[str, dict[str, list[bool | NeedsInvalidFilter | None]]] = {}
+    for constraint, constraint_needs in declaring.items():
+        for need_id in constraint_needs:
+            results.setdefault(need_id, {})[constraint] = []
+        compiled = constraints[constraint]
+        for name, cmd in compiled.checks:
+            if name in compiled.style_checks:
+                for need_id in constraint_needs:
+                    results[need_id][constraint].append(None)
+                continue
+            for need_id, passed in zip(
+                constraint_needs,
+                filter_single_needs(constraint_needs.values(), config, cmd),
+                strict=True,
+            ):
+                results[need_id][constraint].append(passed)
+    return results
+
 
 def process_constraints(needs: NeedsMutable, config: NeedsSphinxConfig) -> None:
     """Analyse constraints of all needs,
@@ -21,85 +141,109 @@ def process_constraints(needs: NeedsMutable, config: NeedsSphinxConfig) -> None:
     The ``style`` field may also be changed, if a constraint fails
     (depending on the config value ``constraint_failed_options``)
     """
-    config_constraints = config.constraints
-
+    constraints = compile_constraints(config)
+    check_results = evaluate_constraint_checks(needs.values(), config, constraints)
     for need in needs.values():
-        need_id = need["id"]
-
-        results: dict[str, tuple[tuple[str, bool, str | None], ...]] = {}
-
-        for constraint in need["constraints"]:
-            results[constraint] = ()
-
-            try:
-                executable_constraints = config_constraints[constraint]
-            except KeyError:
-                # Note, this is already checked for in add_need
-                continue
-
-            # name is check_0, check_1, ...
-            for name, cmd in executable_constraints.items():
-                if name in ("severity", "error_message"):
-                    # special keys, that are not a check
-                    continue
-
-                # compile constraint and check if need fulfils it
+        process_need_constraints(
+            need,
+            config,
+            constraints=constraints,
+            check_results=check_results.get(need["id"], {}),
+        )
+
+
+def process_need_constraints(
+    need: NeedItem,
+    config: NeedsSphinxConfig,
+    *,
+    constraints: Mapping[str, CompiledConstraint] | None = None,
+    check_results: Mapping[str, list[bool | NeedsInvalidFilter | None]] | None = None,
+) -> None:
+    """Analyse the constraints of a single need,
+    and set the corresponding fields on the need data item
+    (see :func:`process_constraints`).
+
+    :param constraints: The compiled constraints, compiled from ``config`` if not given.
+    :param check_results: The results of the need's checks,
+        as returned by :func:`evaluate_constraint_checks`, evaluated if not given.
+    """
+    if constraints is None:
+        constraints = compile_constraints(config)
+    if check_results is None:
+        check_results = evaluate_constraint_checks([need], config, constraints).get(
+            need["id"], {}
+        )
+    need_id = need["id"]
+
+    results: dict[str, tuple[tuple[str, bool, str | None], ...]] = {}
+
+    for constraint in need["constraints"]:
+        results[constraint] = ()
+
+        try:
+            compiled = constraints[constraint]
+        except KeyError:
+            # Note, this is already checked for in add_need
+            continue
+
+        # name is check_0, check_1, ...
+        for (name, cmd), constraint_passed in zip(
+            compiled.checks, check_results[constraint], strict=True
+        ):
+            if constraint_passed is None:
+                # the check refers to the style, which earlier checks may have changed
                 constraint_passed = filter_single_need(need, config, cmd)
-
-                error_msg: str | None = None
-                if not constraint_passed:
-                    if "error_message" in executable_constraints:
-                        msg = str(executable_constraints["error_message"])
-                        error_msg = render_template_string(
-                            msg,
-                            cast(dict[str, Any], need),
-                            autoescape=False,
-                        )
-
-                    if "severity" not in executable_constraints:
-                        raise NeedsConstraintFailed(
-                            f"'severity' key not set for constraint {constraint!r} in config 'needs_constraints'"
-                        )
-                    severity = executable_constraints["severity"]
-                    if severity not in config.constraint_failed_options:
-                        raise NeedsConstraintFailed(
-                            f"Severity {severity!r} not set in config 'needs_constraint_failed_options'"
-                        )
-                    failed_options = config.constraint_failed_options[severity]
-
-                    # log/except if needed
-                    if "warn" in failed_options.get("on_fail", []):
-                        log_warning(
-                            logger,
-                            f"Constraint {cmd} for need {need_id} FAILED! severity: {severity} {need.get('constraints_error', '')}",
-                            "constraint",
-                            location=(need["docname"], need["lineno"]),
-                            color="red",
-                        )
-                    if "break" in failed_options.get("on_fail", []):
-                        raise NeedsConstraintFailed(
-                            f"FAILED a breaking constraint: >> {cmd} << for need "
-                            f"{need_id} FAILED! breaking build process"
-                        )
-
-                    # set styles
-                    old_style = need["style"]
-                    if old_style and len(old_style) > 0:
-                        new_styles = "".join(
-                            ", " + x for x in failed_options.get("style", [])
-                        )
-                    else:
-                        old_style = ""
-                        new_styles = "".join(
-                            x + "," for x in failed_options.get("style", [])
-                        )
-
-                    if failed_options.get("force_style", False):
-                        need["style"] = new_styles.strip(", ")
-                    else:
-                        constraint_failed_style = old_style + new_styles
-                        need["style"] = constraint_failed_style
-
-                results[constraint] += ((name, constraint_passed, error_msg),)
-
-        need.set_constraint_results(NeedConstraintResults(results))
+            if isinstance(constraint_passed, NeedsInvalidFilter):
+                raise constraint_passed
+
+            error_msg: str | None = None
+            if not constraint_passed:
+                error_msg = compiled.render_error(need)
+
+                if compiled.severity is None:
+                    raise NeedsConstraintFailed(
+                        f"'severity' key not set for constraint {constraint!r} in config 'needs_constraints'"
+                    )
+                severity = compiled.severity
+                if severity not in config.constraint_failed_options:
+                    raise NeedsConstraintFailed(
+                        f"Severity {severity!r} not set in config 'needs_constraint_failed_options'"
+                    )
+                failed_options = config.constraint_failed_options[severity]
+
+                # log/except if needed
+                if "warn" in failed_options.get("on_fail", []):
+                    log_warning(
+                        logger,
+                        f"Constraint {cmd} for need {need_id} FAILED! severity: {severity} {need.get('constraints_error', '')}",
+                        "constraint",
+                        location=(need["docname"], need["lineno"]),
+                        color="red",
+                    )
+                if "break" in failed_options.get("on_fail", []):
+                    raise NeedsConstraintFailed(
+                        f"FAILED a breaking constraint: >> {cmd} << for need "
+                        f"{need_id} FAILED! breaking build process"
+                    )
+
+                # set styles
+                old_style = need["style"]
+                if old_style and len(old_style) > 0:
+                    new_styles = "".join(
+                        ", " + x for x in failed_options.get("style", [])
+                    )
+                else:
+                    old_style = ""
+                    new_styles = "".join(
+                        x + "," for x in failed_options.get("style", [])
+                    )
+
+                if failed_options.get("force_style", False):
+                    need["style"] = new_styles.strip(", ")
+                else:
+                    constraint_failed_style = old_style + new_styles
+                    need["style"] = constraint_failed_style
+
+            results[constraint] += ((name, constraint_passed, error_msg),)
+
+    need.set_constraint_results(NeedConstraintResults(results))
@@ -934,6 +934,26 @@ class NeedItem:
         if backlink not in self._backlinks[link_type]:
             self._backlinks[link_type].append(backlink)
 
+    def set_backlinks(
+        self,
+        link_type: str,
+        backlinks: list[NeedLink],
+        *,
+        part_id: str | None = None,
+    ) -> None:
+        """Replace the backlinks of a link type, for the need or one of its parts.
+
+        Unlike setting the ``<link_type>_back`` key, the list is used as is, without validation.
+
+        :raises KeyError: If the link type or part does not exist.
+        """
+        if link_type not in self._backlinks:
+            raise KeyError(f"Link type {link_type!r} does not exist in backlinks.")
+        if part_id is None:
+            self._backlinks[link_type] = backlinks
+        else:
+            self._parts[part_id].backlinks[link_type] = backlinks
+
     def get_part_item(self, part_id: str) -> NeedPartItem | None:
         """Get a part, merged with its parent need, by its ID."""
         try:
@@ -18,7 +18,7 @@ from sphinx.config import Config as _SphinxConfig
 from sphinx.environment import BuildEnvironment
 
 import sphinx_needs.debug as debug  # Need to set global var in it for timeing measurements
-from sphinx_needs import __version__
+from sphinx_needs import __version__, telemetry
 from sphinx_needs.api import get_needs_view
 from sphinx_needs.builder import (
     NeedsBuilder,
@@ -48,6 +48,11 @@ from sphinx_needs.defaults import (
     LAYOUTS,
     NEEDFLOW_CONFIG_DEFAULTS,
 )
+from sphinx_needs.diagram_cache import (
+    load_diagram_cache,
+    record_resolved_doc,
+    save_diagram_cache,
+)
 from sphinx_needs.directives.list2need import List2Need, List2NeedDirective
 from sphinx_needs.directives.need import (
     NeedDirective,
@@ -81,7 +86,11 @@ from sphinx_needs.directives.needgantt import (
     process_needgantt,
 )
 from sphinx_needs.directives.needif import IfDirective
-from sphinx_needs.directives.needimport import Needimport, NeedimportDirective
+from sphinx_needs.directives.needimport import (
+    Needimport,
+    NeedimportDirective,
+    clear_import_sources,
+)
 from sphinx_needs.directives.needlist import (
     Needlist,
     NeedlistDirective,
@@ -99,11 +108,14 @@ from sphinx_needs.directives.needtable import (
     Needtable,
     NeedtableDirective,
     process_needtables,
+    prune_needtable_data,
+    remove_needtable_data,
 )
 from sphinx_needs.directives.needuml import (
     NeedarchDirective,
     Needuml,
     NeedumlDirective,
+    clear_uml_expansions,
     process_needuml,
 )
 from sphinx_needs.environment import (
@@ -113,7 +125,9 @@ from sphinx_needs.environment import (
 )
 from sphinx_needs.exceptions import NeedsConfigException
 from sphinx_needs.external_needs import load_external_needs
+from sphinx_needs.filter_common import prepare_filters
 from sphinx_needs.functions import NEEDS_COMMON_FUNCTIONS
+from sphinx_needs.layout import clear_parsed_layouts
 from sphinx_needs.logging import get_logger, log_warning
 from sphinx_needs.needs_schema import (
     FieldLiteralValue,
@@ -144,6 +158,7 @@ from sphinx_needs.schema.config_utils import (
 from sphinx_needs.schema.process import process_schemas
 from sphinx_needs.services.github import GithubService
 from sphinx_needs.string_links import compile_string_links
+from sphinx_needs.template_cache import prepare_template_registry
 from sphinx_needs.utils import node_match
 from sphinx_needs.variant_data import (
     VariantDataError,
@@ -336,6 +351,7 @@ def setup(app: Sphinx) -> dict[str, Any]:
     app.connect("config-inited", load_config)
     app.connect("config-inited", merge_default_configs)
     # runs after the built-in layouts are merged in, and before the config is checked
+    app.connect("config-inited", prepare_template_registry, priority=549)
     app.connect("config-inited", compile_card_layouts, priority=550)
     app.connect("config-inited", compile_string_links, priority=551)
     app.connect("config-inited", check_configuration, priority=600)  # runs late
@@ -348,6 +364,8 @@ def setup(app: Sphinx) -> dict[str, Any]:
     app.connect("env-before-read-docs", resolve_schemas_config)
 
     app.connect("env-before-read-docs", load_external_needs)
+    app.connect("env-before-read-docs", start_read_phase, priority=900)
+    app.connect("env-updated", end_read_phase, priority=1)
 
     app.connect("env-purge-doc", purge_needs)
 
@@ -355,6 +373,9 @@ def setup(app: Sphinx) -> dict[str, Any]:
 
     app.connect("env-merge-info", merge_data)
 
+    app.connect("env-updated", clear_import_sources)
+    app.connect("env-updated", clear_uml_expansions)
+    app.connect("env-updated", clear_parsed_layouts)
     app.connect("env-updated", install_lib_static_files)
     app.connect("env-updated", install_permalink_file)
     # This should be called last, so that need-styles can override styles from used libraries
@@ -363,6 +384,7 @@ def setup(app: Sphinx) -> dict[str, Any]:
     # emitted during post_process_needs_data, both are passed the mutable needs dict
     app.add_event("needs-before-post-processing")
     app.add_event("needs-before-sealing")
+    app.connect("needs-before-post-processing", load_diagram_cache)
 
     # There is also the event doctree-read.
     # But it looks like in this event no references are already solved, which
@@ -377,16 +399,24 @@ def setup(app: Sphinx) -> dict[str, Any]:
         priority=100,
     )
     app.connect("doctree-resolved", process_need_nodes)
+    # before the tables of the document are written again
+    app.connect("doctree-resolved", remove_needtable_data, priority=400)
     app.connect("doctree-resolved", process_creator(NODE_TYPES))
+    app.connect("doctree-resolved", record_resolved_doc)
 
+    app.connect("write-started", debug.start_write_sampling, priority=100)
     app.connect("write-started", process_schemas)
     app.connect("write-started", ensure_post_process_needs_data)
+    app.connect("write-started", prepare_filters)
 
     app.connect("build-finished", process_warnings)
     app.connect("build-finished", build_needs_json)
     app.connect("build-finished", build_needs_id_json)
     app.connect("build-finished", build_needumls_pumls)
+    app.connect("build-finished", save_diagram_cache)
+    app.connect("build-finished", prune_needtable_data)
     app.connect("build-finished", debug.process_timing)
+    app.connect("build-finished", telemetry.write_telemetry_report, priority=9000)
     app.connect("build-finished", release_data_locks, priority=9999)
 
     # Be sure Sphinx-Needs config gets erased before any events or external API calls get executed.
@@ -410,6 +440,15 @@ def ensure_post_process_needs_data(app: Sphinx, builder: Builder) -> None:
     get_needs_view(app)
 
 
+def start_read_phase(_app: Sphinx, _env: BuildEnvironment, docnames: list[str]) -> None:
+    """Start the telemetry of reading the documents, that ends in :func:`end_read_phase`."""
+    telemetry.start_phase("read", len(docnames))
+
+
+def end_read_phase(_app: Sphinx, _env: BuildEnvironment) -> None:
+    telemetry.end_phase("read")
+
+
 def process_creator(
     node_list: _NODE_TYPES_T, doc_category: str = "all"
 ) -> Callable[[Sphinx, nodes.document, str], None]:
@@ -451,7 +490,11 @@ def process_creator(
                 and check_func is not None
                 and current_nodes[check_node]
             ):
-                check_func(app, doctree, fromdocname, current_nodes[check_node])
+                with telemetry.phase(
+                    f"resolve_{check_node.__name__.lower()}",
+                    len(current_nodes[check_node]),
+                ):
+                    check_func(app, doctree, fromdocname, current_nodes[check_node])
 
     return process_caller
 
@@ -738,12 +781,13 @@ def resolve_variant_data_config(app: Sphinx, config: Config) -> None:
     _derive_variant_data_proxy(needs_config)
 
 
-def prepare_env(app: Sphinx, env: BuildEnvironment, _docnames: list[str]) -> None:
+def prepare_env(app: Sphinx, env: BuildEnvironment, docnames: list[str]) -> None:
     """
     Prepares the sphinx environment to store sphinx-needs internal data.
     """
     needs_config = NeedsSphinxConfig(app.config)
     data = SphinxNeedsData(env)
+    data.read_docs = set(docnames)
 
     # The map may have been written after it was resolved, e.g. by another extension's
     # ``config-inited`` handler. Such a value is used as-is (it is not merged with the
@@ -770,10 +814,28 @@ def prepare_env(app: Sphinx, env: BuildEnvironment, _docnames: list[str]) -> Non
             # Otherwise, the service may get registered later by an external sphinx-needs extension
             services.register(name, service["class"], **service["class_init"])
 
+    telemetry.reset(needs_config.telemetry, needs_config.telemetry_tracemalloc)
+
     # Set time measurement flag
     if needs_config.debug_measurement:
         debug.START_TIME = timer()  # Store the rough start time of Sphinx build
         debug.EXECUTE_TIME_MEASUREMENTS = True
+        if needs_config.debug_measurement_mode in ("detailed", "fast"):
+            debug.MEASUREMENT_MODE = needs_config.debug_measurement_mode  # type: ignore[assignment]
+        else:
+            log_warning(
+                LOGGER,
+                f"needs_debug_measurement_mode must be 'detailed' or 'fast', "
+                f"got {needs_config.debug_measurement_mode!r}.",
+                "config",
+                None,
+            )
+            debug.MEASUREMENT_MODE = "detailed"
+        debug.SAMPLER = (
+            debug.StackSampler(needs_config.debug_sampling_interval)
+            if needs_config.debug_sampling_interval > 0
+            else None
+        )
 
     if needs_config.debug_filters:
         with contextlib.suppress(FileNotFoundError):
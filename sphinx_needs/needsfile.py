@@ -8,12 +8,13 @@ from __future__ import annotations
 
 import json
 import os
+import re
 import sys
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable, Iterator
 from copy import deepcopy
 from datetime import datetime
 from functools import lru_cache
-from typing import Any
+from typing import Any, ClassVar, TextIO, cast
 
 from jsonschema_rs import Draft7Validator, ValidationError
 from sphinx.environment import BuildEnvironment
@@ -155,7 +156,20 @@ class NeedsList:
             self.needs_list["versions"][version]["created"] = datetime.now().isoformat()
 
     def add_need(self, version: str, need_info: NeedItem) -> None:
+        """Add a need to a version.
+
+        The need is only converted to its JSON representation when it is written,
+        so that the representations of all needs are never held in memory at once.
+        Hence, ``needs_list`` holds the need item itself, not its JSON representation.
+        """
         self.update_or_add_version(version)
+        self.needs_list["versions"][version]["needs"][need_info["id"]] = need_info
+        self.needs_list["versions"][version]["needs_amount"] = len(
+            self.needs_list["versions"][version]["needs"]
+        )
+
+    def _writable_need(self, need_info: NeedItem) -> dict[str, Any]:
+        """Get the JSON representation of a need."""
         writable_needs = {
             key: value
             for key, value in need_info.items()
@@ -174,10 +188,7 @@ class NeedsList:
                     key in self._need_defaults and value == self._need_defaults[key]
                 )
             }
-        self.needs_list["versions"][version]["needs"][need_info["id"]] = writable_needs
-        self.needs_list["versions"][version]["needs_amount"] = len(
-            self.needs_list["versions"][version]["needs"]
-        )
+        return writable_needs
 
     def wipe_version(self, version: str) -> None:
         if version in self.needs_list["versions"]:
@@ -197,11 +208,11 @@ class NeedsList:
         self._finalise()
         needs_dir = needs_path if needs_path else self.outdir
         with open(os.path.join(needs_dir, needs_file), "w") as f:
-            json.dump(self.needs_list, f, sort_keys=True)
+            write_sorted_json(f, self.needs_list, self._writable_need)
 
     def dump_json(self) -> str:
         self._finalise()
-        return json.dumps(self.needs_list, sort_keys=True)
+        return "".join(iter_sorted_json(self.needs_list, self._writable_need))
 
     def load_json(self, file: str) -> None:
         if not os.path.isabs(file):
@@ -218,9 +229,7 @@ class NeedsList:
             if errors.schema:
                 self.log.info(f"Schema validation errors detected in file {file}:")
                 for error in errors.schema:
-                    self.log.info(
-                        f"  {error.message} -> {'.'.join(str(p) for p in error.instance_path)}"
-                    )
+                    self.log.info(f"  {format_schema_error(error)}")
 
             with open(file) as needs_file:
                 try:
@@ -238,11 +247,268 @@ class NeedsList:
             self.log.debug(f"needs.json file loaded: {file}")
 
 
+def iter_sorted_json(
+    value: Any, convert_need: Callable[[NeedItem], dict[str, Any]]
+) -> Iterator[str]:
+    """Encode a value as JSON in chunks, identical to ``json.dumps(value, sort_keys=True)``.
+
+    Dictionaries are encoded key by key, and need items are converted with ``convert_need``
+    only when they are encoded, so that only one need is held in its converted form at a time.
+    """
+    if isinstance(value, NeedItem):
+        yield json.dumps(convert_need(value), sort_keys=True)
+    elif isinstance(value, dict):
+        if not value:
+            yield "{}"
+            return
+        separator = "{"
+        for key in sorted(value):
+            yield f"{separator}{json.dumps(key)}: "
+            yield from iter_sorted_json(value[key], convert_need)
+            separator = ", "
+        yield "}"
+    else:
+        yield json.dumps(value, sort_keys=True)
+
+
+def write_sorted_json(
+    file: TextIO, value: Any, convert_need: Callable[[NeedItem], dict[str, Any]]
+) -> None:
+    """Write a value as JSON to a file, identical to ``json.dump(value, file, sort_keys=True)``,
+    streaming the encoding of dictionaries and need items (see :func:`iter_sorted_json`).
+    """
+    for chunk in iter_sorted_json(value, convert_need):
+        file.write(chunk)
+
+
+class NeedsFileReader:
+    """Read a ``needs.json`` file incrementally, without loading it into memory at once.
+
+    Needs are decoded one at a time,
+    so that memory use is bounded by the largest need, rather than the size of the file.
+    Each method reads the file from the start.
+
+    :raises OSError: If the file cannot be read.
+    :raises json.JSONDecodeError: If the file is not valid JSON.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self.path = path
+
+    def read_summary(
+        self, on_need: Callable[[str, str, Any], None] | None = None
+    ) -> tuple[dict[str, Any], dict[str, dict[str, Any]]]:
+        """Read everything except the needs.
+
+        :param on_need: If given, called with ``(version, id, need)`` for each need,
+            in the order of the file, instead of skipping it.
+        :returns: The top-level data (without ``versions``),
+            and the data of each version, with its ``needs`` replaced by their number.
+        """
+        header: dict[str, Any] = {}
+        versions: dict[str, dict[str, Any]] = {}
+        with open(self.path) as f:
+            stream = _JsonStream(f)
+            for key in stream.iter_object():
+                if key != "versions" or stream.peek() != "{":
+                    header[key] = stream.value()
+                    continue
+                for version in stream.iter_object():
+                    if stream.peek() != "{":
+                        versions[version] = stream.value()
+                        continue
+                    data: dict[str, Any] = {}
+                    for version_key in stream.iter_object():
+                        if version_key == "needs" and stream.peek() == "{":
+                            data["needs"] = 0
+                            for need_id in stream.iter_object():
+                                if on_need is None:
+                                    stream.skip()
+                                else:
+                                    on_need(version, need_id, stream.value())
+                                data["needs"] += 1
+                        else:
+                            data[version_key] = stream.value()
+                    versions[version] = data
+        return header, versions
+
+    def iter_needs(self, version: str) -> Iterator[tuple[str, Any]]:
+        """Yield the ``(id, need)`` pairs of a version, in the order of the file."""
+        with open(self.path) as f:
+            stream = _JsonStream(f)
+            for key in stream.iter_object():
+                if key != "versions" or stream.peek() != "{":
+                    stream.skip()
+                    continue
+                for version_name in stream.iter_object():
+                    if version_name != version or stream.peek() != "{":
+                        stream.skip()
+                        continue
+                    for version_key in stream.iter_object():
+                        if version_key != "needs" or stream.peek() != "{":
+                            stream.skip()
+                            continue
+                        for need_id in stream.iter_object():
+                            yield need_id, stream.value()
+                        return
+
+
+class _JsonStream:
+    """A minimal incremental JSON reader, for walking objects key by key.
+
+    Values are decoded with :meth:`json.JSONDecoder.raw_decode`,
+    reading more of the file whenever the buffer ends within a value.
+    Skipped values are only scanned for their end, so they are never held in memory at once.
+    """
+
+    __slots__ = ("_buffer", "_eof", "_file", "_pos")
+
+    _decoder: ClassVar[json.JSONDecoder] = json.JSONDecoder()
+    _whitespace: ClassVar[re.Pattern[str]] = re.compile(r"[ \t\n\r]*")
+    _structure: ClassVar[re.Pattern[str]] = re.compile(r'["{}\[\]]')
+    _string_end: ClassVar[re.Pattern[str]] = re.compile(r'["\\]')
+    _scalar: ClassVar[re.Pattern[str]] = re.compile(r"[^ \t\n\r,:\]}]*")
+    chunk_size: ClassVar[int] = 1 << 20
+
+    def __init__(self, file: TextIO) -> None:
+        self._file = file
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        """Read more of the file into the buffer, dropping what was already consumed.
+
+        At least as many characters as are in the buffer are read,
+        so that re-decoding a value spanning many reads is amortised linear.
+        """
+        if self._eof:
+            return False
+        remaining = self._buffer[self._pos :]
+        chunk = self._file.read(max(self.chunk_size, len(remaining)))
+        if not chunk:
+            self._eof = True
+            return False
+        self._buffer = remaining + chunk
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character, without consuming it."""
+        while True:
+            match = self._whitespace.match(self._buffer, self._pos)
+            self._pos = match.end() if match else self._pos
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                raise json.JSONDecodeError("Expecting value", self._buffer, self._pos)
+
+    def _expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise json.JSONDecodeError(f"Expecting {char!r}", self._buffer, self._pos)
+        self._pos += 1
+
+    def value(self) -> Any:
+        """Decode the next value."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            # a number at the end of the buffer may continue in the next chunk
+            if end == len(self._buffer) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+    def skip(self) -> None:
+        """Skip the next value, without decoding it.
+
+        Strings, arrays and objects are scanned for their end, counting brackets outside of strings,
+        and consumed parts of the buffer are dropped as more of the file is read.
+        Unlike :meth:`value`, the skipped value is not validated, other than being terminated.
+        """
+        if self.peek() not in '"[{':
+            while True:
+                scalar = cast(
+                    re.Match[str], self._scalar.match(self._buffer, self._pos)
+                )
+                self._pos = scalar.end()
+                if self._pos < len(self._buffer) or not self._fill():
+                    return
+        depth = 0
+        in_string = False
+        while True:
+            pattern = self._string_end if in_string else self._structure
+            if (match := pattern.search(self._buffer, self._pos)) is None:
+                self._pos = len(self._buffer)
+                if not self._fill():
+                    raise json.JSONDecodeError(
+                        "Unterminated value", self._buffer, self._pos
+                    )
+                continue
+            char = match.group()
+            self._pos = match.end()
+            if char == "\\":
+                # skip the escaped character, which may be in the next chunk
+                if self._pos == len(self._buffer) and not self._fill():
+                    raise json.JSONDecodeError(
+                        "Unterminated string", self._buffer, self._pos
+                    )
+                self._pos += 1
+                continue
+            if char == '"':
+                in_string = not in_string
+            elif char in "[{":
+                depth += 1
+            else:
+                depth -= 1
+            if depth == 0 and not in_string:
+                return
+
+    def iter_object(self) -> Iterator[str]:
+        """Yield the keys of the next value, which must be an object.
+
+        After each key, the caller must consume its value,
+        with :meth:`value`, :meth:`skip` or :meth:`iter_object`, before continuing.
+        """
+        self._expect("{")
+        if self.peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            if self.peek() != '"':
+                raise json.JSONDecodeError(
+                    "Expecting property name enclosed in double quotes",
+                    self._buffer,
+                    self._pos,
+                )
+            key = self.value()
+            self._expect(":")
+            yield key
+            char = self.peek()
+            self._pos += 1
+            if char == "}":
+                return
+            if char != ",":
+                raise json.JSONDecodeError(
+                    "Expecting ',' delimiter", self._buffer, self._pos - 1
+                )
+
+
 class Errors:
     def __init__(self, schema_errors: list[ValidationError]):
         self.schema = schema_errors
 
 
+def format_schema_error(error: ValidationError) -> str:
+    """Format a schema validation error, with the path to the invalid value."""
+    return f"{error.message} -> {'.'.join(str(p) for p in error.instance_path)}"
+
+
 def check_needs_file(path: str) -> Errors:
     """
     Checks a given json-file, if it passes our needs.json structure tests.
@@ -271,6 +537,11 @@ def _load_schema() -> dict[str, Any]:
         return json.load(schema_file)  # type: ignore[no-any-return]
 
 
+@lru_cache
+def _load_validator() -> Draft7Validator:
+    return Draft7Validator(_load_schema())
+
+
 def check_needs_data(data: Any) -> Errors:
     """
     Checks a given json-file, if it passes our needs.json structure tests.
@@ -281,10 +552,7 @@ def check_needs_data(data: Any) -> Errors:
     :param data: Loaded needs.json file
     :return: Dict, with error reports
     """
-    needs_schema = _load_schema()
-
-    validator = Draft7Validator(needs_schema)
-    schema_errors = list(validator.iter_errors(data))
+    schema_errors = list(_load_validator().iter_errors(data))
 
     # In future there may be additional types of validations.
     # So lets already use a class for all errors
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Iterable, Mapping
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Final, TypedDict, cast
 
@@ -50,6 +50,7 @@ def validate_field_link_schemas(
     config: NeedsSphinxConfig,
     fields_schema: FieldsSchema,
     needs: NeedsView,
+    shard: Iterable[NeedItem] | None = None,
 ) -> dict[str, list[OntologyWarning]]:
     """Validate all needs against the combined field and link schema.
 
@@ -65,6 +66,7 @@ def validate_field_link_schemas(
     :param config: The Sphinx-Needs configuration.
     :param fields_schema: The fields schema containing core, extra, and link field definitions.
     :param needs: The needs view to validate.
+    :param shard: The needs to validate, if not all needs.
     :return: Mapping of need ID to list of validation warnings.
     """
     # Build combined properties from all field and link schemas
@@ -89,7 +91,7 @@ def validate_field_link_schemas(
     validator = compile_validator(schema)
     schema_properties = validator.properties
 
-    for need in needs.values():
+    for need in needs.values() if shard is None else shard:
         # Project the need to only the properties present in the schema,
         # excluding None values (we don't allow {"type": ["string", "null"]})
         need_data: dict[str, Any] = {
@@ -155,11 +157,14 @@ def validate_type_schema(
     field_properties: Mapping[str, NeedFieldProperties],
     *,
     fields_schema: FieldsSchema,
+    shard: Iterable[NeedItem] | None = None,
 ) -> dict[str, list[OntologyWarning]]:
     """Validate needs against a type schema.
 
     :param fields_schema: The fields schema, used to derive the set of
         field names visible to ``select`` schemas.
+    :param shard: The needs to validate, if not all needs.
+        Linked needs are still looked up in ``needs``, for network validation.
     """
     need_2_warnings: dict[str, list[OntologyWarning]] = {}
 
@@ -196,7 +201,7 @@ def validate_type_schema(
 
     validator_cache: dict[tuple[str, ...], SchemaValidator] = {}
 
-    for need in needs.values():
+    for need in needs.values() if shard is None else shard:
         # maintain state for nested network validation
         if select_validator is not None and not _check_select_match(
             need,
@@ -1,14 +1,22 @@
+import multiprocessing
+import os
 import time
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from typing import cast
 
 from sphinx.application import Sphinx
 from sphinx.builders import Builder
 from sphinx.util import logging
+from sphinx.util.parallel import parallel_available
 
+from sphinx_needs import telemetry
 from sphinx_needs.api import get_needs_view
 from sphinx_needs.config import NeedsSphinxConfig
 from sphinx_needs.data import SphinxNeedsData
 from sphinx_needs.logging import log_error, log_warning
+from sphinx_needs.need_item import NeedItem
+from sphinx_needs.needs_schema import FieldsSchema
 from sphinx_needs.needsfile import generate_needs_schema
 from sphinx_needs.schema.config import SchemasRootType
 from sphinx_needs.schema.core import (
@@ -22,10 +30,12 @@ from sphinx_needs.schema.reporting import (
     generate_json_schema_validation_report,
     get_formatted_warnings,
 )
+from sphinx_needs.views import NeedsView
 
 logger = logging.getLogger(__name__)
 
 
+@telemetry.record_phase("schema_validation")
 def process_schemas(app: Sphinx, builder: Builder) -> None:
     """
     Validate all needs in a loop.
@@ -46,34 +56,37 @@ def process_schemas(app: Sphinx, builder: Builder) -> None:
     start_time = time.perf_counter()
 
     needs = get_needs_view(app)
+    telemetry.count_items(len(needs))
 
-    need_2_warnings: dict[str, list[OntologyWarning]] = {}
-
-    # Validate all needs against combined field + link schemas
-    field_link_warnings = validate_field_link_schemas(config, needs_schema, needs)
-    for key, warnings in field_link_warnings.items():
-        need_2_warnings.setdefault(key, []).extend(warnings)
-
-    # Validate needs against user-defined type schemas. We read the
+    # Needs are also validated against user-defined type schemas. We read the
     # type-injected copy stored on the environment by resolve_schemas_config,
     # not config.schema_definitions itself (see resolve_schemas_config for why).
     type_schemas: list[SchemasRootType] = SphinxNeedsData(
         app.env
     ).get_resolved_schemas()
-    if type_schemas:
-        field_properties: Mapping[str, NeedFieldProperties] = generate_needs_schema(
-            needs_schema
-        )["properties"]
-        for type_schema in type_schemas:
-            type_warnings = validate_type_schema(
-                config,
-                type_schema,
-                needs,
-                field_properties,
-                fields_schema=needs_schema,
-            )
-            for key, warnings in type_warnings.items():
-                need_2_warnings.setdefault(key, []).extend(warnings)
+    validation = _Validation(
+        config=config,
+        fields_schema=needs_schema,
+        needs=needs,
+        type_schemas=type_schemas,
+        field_properties=generate_needs_schema(needs_schema)["properties"]
+        if type_schemas
+        else {},
+    )
+    workers = config.schema_validation_workers or os.cpu_count() or 1
+    if workers > 1 and parallel_available and len(needs) >= 2 * workers:
+        field_link_warnings, type_warnings = _validate_parallel(validation, workers)
+    else:
+        field_link_warnings, type_warnings = validation.run()
+
+    # Warnings of the combined field + link schemas come first,
+    # then those of each type schema
+    need_2_warnings: dict[str, list[OntologyWarning]] = {}
+    for key, warnings in field_link_warnings.items():
+        need_2_warnings.setdefault(key, []).extend(warnings)
+    for schema_warnings in type_warnings:
+        for key, warnings in schema_warnings.items():
+            need_2_warnings.setdefault(key, []).extend(warnings)
 
     # Stop timer after validation loop
     end_time = time.perf_counter()
@@ -112,3 +125,122 @@ def process_schemas(app: Sphinx, builder: Builder) -> None:
     logger.info(
         f"Schema validation completed with {len(formatted_warnings)} warning(s) in {duration:.3f} seconds. Validated {validated_rate} needs/s."
     )
+
+
+_ValidationResult = tuple[
+    dict[str, list[OntologyWarning]], list[dict[str, list[OntologyWarning]]]
+]
+"""The warnings of the field and link schemas, and of each type schema, by need id."""
+
+
+@dataclass(frozen=True, slots=True)
+class _Validation:
+    """The input of validating the needs, shared with worker processes."""
+
+    config: NeedsSphinxConfig
+    fields_schema: FieldsSchema
+    needs: NeedsView
+    type_schemas: list[SchemasRootType]
+    field_properties: Mapping[str, NeedFieldProperties]
+
+    def run(self, shard: Sequence[NeedItem] | None = None) -> _ValidationResult:
+        """Validate the needs of a shard, or all needs.
+
+        Linked needs are looked up in all needs, for network validation.
+        """
+        field_link_warnings = validate_field_link_schemas(
+            self.config, self.fields_schema, self.needs, shard
+        )
+        type_warnings = [
+            validate_type_schema(
+                self.config,
+                type_schema,
+                self.needs,
+                self.field_properties,
+                fields_schema=self.fields_schema,
+                shard=shard,
+            )
+            for type_schema in self.type_schemas
+        ]
+        return field_link_warnings, type_warnings
+
+
+_worker_validation: _Validation | None = None
+"""The validation of the parent process, inherited by forked worker processes."""
+
+
+def _validate_parallel(validation: _Validation, workers: int) -> _ValidationResult:
+    """Validate the needs in forked worker processes, each validating a contiguous shard.
+
+    The workers inherit the needs and configuration from this process, instead of
+    receiving them pickled, and compile their own validators.
+    Their warnings refer to needs by id, and are merged in the order of the needs,
+    so that the result is the same as validating them in this process.
+    """
+    global _worker_validation
+    need_ids = list(validation.needs)
+    size = -(-len(need_ids) // workers)
+    shards = [need_ids[i : i + size] for i in range(0, len(need_ids), size)]
+    _worker_validation = validation
+    try:
+        with multiprocessing.get_context("fork").Pool(len(shards)) as pool:
+            results = pool.map(_validate_shard, shards)
+    finally:
+        _worker_validation = None
+
+    field_link_warnings: dict[str, list[OntologyWarning]] = {}
+    type_warnings: list[dict[str, list[OntologyWarning]]] = [
+        {} for _ in validation.type_schemas
+    ]
+    for shard_field_link, shard_types in results:
+        field_link_warnings.update(_restore_needs(shard_field_link, validation.needs))
+        for merged, shard_type in zip(type_warnings, shard_types, strict=True):
+            merged.update(_restore_needs(shard_type, validation.needs))
+    return field_link_warnings, type_warnings
+
+
+def _validate_shard(need_ids: list[str]) -> _ValidationResult:
+    """Validate a shard of needs, in a worker process."""
+    assert _worker_validation is not None, "worker did not inherit the validation"
+    needs = _worker_validation.needs
+    field_link_warnings, type_warnings = _worker_validation.run(
+        [needs[need_id] for need_id in need_ids]
+    )
+    return (
+        _strip_needs(field_link_warnings),
+        [_strip_needs(warnings) for warnings in type_warnings],
+    )
+
+
+def _strip_needs(
+    need_2_warnings: dict[str, list[OntologyWarning]],
+) -> dict[str, list[OntologyWarning]]:
+    """Replace the needs of warnings by their id, to send them back from a worker cheaply."""
+
+    def _strip(warning: OntologyWarning) -> OntologyWarning:
+        stripped = cast(OntologyWarning, {**warning, "need": warning["need"]["id"]})
+        if "children" in warning:
+            stripped["children"] = [_strip(child) for child in warning["children"]]
+        return stripped
+
+    return {
+        key: [_strip(warning) for warning in warnings]
+        for key, warnings in need_2_warnings.items()
+    }
+
+
+def _restore_needs(
+    need_2_warnings: dict[str, list[OntologyWarning]], needs: NeedsView
+) -> dict[str, list[OntologyWarning]]:
+    """Replace the need ids of warnings from a worker by the needs of this process."""
+
+    def _restore(warning: OntologyWarning) -> OntologyWarning:
+        warning["need"] = needs[cast(str, warning["need"])]
+        for child in warning.get("children", ()):
+            _restore(child)
+        return warning
+
+    for warnings in need_2_warnings.values():
+        for warning in warnings:
+            _restore(warning)
+    return need_2_warnings
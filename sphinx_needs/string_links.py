@@ -104,7 +104,7 @@ def compiled_string_links(
     impossible -- both paths compile the same strings -- but it decides whether a
     user's links render, so it is reported rather than swallowed.
 
-    This function is called once per rendered need and once per needtable cell, so the
+    This function is called once per rendered need and once per document with needtables, so the
     report is emitted with ``once=True``: one line per entry, not one per need. Sphinx
     resets that filter per application, so a later build in the same process still
     reports; a parallel build may report once per worker process.
@@ -0,0 +1,239 @@
+"""Per-phase telemetry of a build, activated by :ref:`needs_telemetry`.
+
+Each phase of the build, that sphinx-needs takes part in, records its wall time, CPU time,
+growth of the peak resident memory, and the number of items (documents, needs or nodes) it processed.
+With :ref:`needs_telemetry_tracemalloc`, the peak of the memory allocated by Python in the phase is recorded as well.
+
+Phases may be nested, e.g. post-processing the needs within the schema validation
+that first requests them, in which case the time of the inner phase is included in the outer one.
+A phase run several times, e.g. once per document, is reported as one entry.
+
+Recording is switched on or off when the environment is prepared for reading,
+at the start of each build.
+
+The report is written as ``needs_telemetry.json`` into the output directory,
+with sorted keys, so that the reports of two builds can be compared with a plain diff.
+
+As for :ref:`needs_debug_measurement`, phases run in parallel worker processes are not recorded.
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import wraps
+from pathlib import Path
+from typing import Any, TypeVar
+
+from sphinx.application import Sphinx
+
+try:
+    import resource
+except ImportError:  # e.g. on Windows
+    resource = None  # type: ignore[assignment]
+
+REPORT_FILENAME = "needs_telemetry.json"
+
+_REPORT_FORMAT = 1
+"""Increase, if the format of the report changes."""
+
+ENABLED = False
+"""Whether phases are recorded, set by :func:`reset` during ``env-before-read-docs``."""
+
+TRACE_MEMORY = False
+"""Whether the memory allocated by Python is traced, set by :func:`reset` during ``env-before-read-docs``."""
+
+T = TypeVar("T", bound=Callable[..., Any])
+
+
+@dataclass(slots=True)
+class PhaseStats:
+    """The telemetry of all runs of a phase."""
+
+    runs: int = 0
+    wall_time: float = 0.0
+    """The elapsed time, in seconds."""
+    cpu_time: float = 0.0
+    """The CPU time of the process, in seconds."""
+    peak_rss_delta: int | None = None
+    """The highest growth of the peak resident memory of the process in a run, in bytes,
+    or ``None`` if it cannot be measured on this platform."""
+    traced_peak: int | None = None
+    """The highest peak of the memory allocated by Python in a run, in bytes,
+    above what was allocated at its start, if traced."""
+    items: int = 0
+    """The number of documents, needs or nodes processed."""
+
+
+@dataclass(slots=True)
+class _OpenPhase:
+    name: str
+    wall_start: float
+    cpu_start: float
+    rss_start: int | None
+    traced_start: int = 0
+    traced_peak: int = 0
+    items: int = 0
+
+
+_phases: dict[str, PhaseStats] = {}
+"""The telemetry of the current build, by phase name."""
+
+_open: list[_OpenPhase] = []
+"""The phases in progress, outermost first."""
+
+
+_started_tracing = False
+"""Whether tracing was started here, and so should be stopped here as well."""
+
+
+def reset(enabled: bool, trace_memory: bool = False) -> None:
+    """Forget the telemetry of a previous build, and set whether to record this one."""
+    global ENABLED, TRACE_MEMORY, _started_tracing
+    _phases.clear()
+    _open.clear()
+    ENABLED = enabled
+    TRACE_MEMORY = enabled and trace_memory
+    if TRACE_MEMORY and not tracemalloc.is_tracing():
+        tracemalloc.start()
+        _started_tracing = True
+    elif not TRACE_MEMORY and _started_tracing:
+        tracemalloc.stop()
+        _started_tracing = False
+
+
+def start_phase(name: str, items: int = 0) -> None:
+    """Start recording a phase, that is not a single block of code.
+
+    :param name: The name to report the phase under.
+    :param items: The number of items, that the phase is known to process.
+    """
+    if not ENABLED:
+        return
+    phase = _OpenPhase(name, time.perf_counter(), time.process_time(), _peak_rss())
+    phase.items = items
+    if TRACE_MEMORY:
+        _update_traced_peaks()
+        phase.traced_start = phase.traced_peak = tracemalloc.get_traced_memory()[0]
+    _open.append(phase)
+
+
+def end_phase(name: str) -> None:
+    """End recording the innermost phase of the given name, if it was started."""
+    if not ENABLED:
+        return
+    for index in range(len(_open) - 1, -1, -1):
+        if _open[index].name == name:
+            break
+    else:
+        return
+    if TRACE_MEMORY:
+        _update_traced_peaks()
+    phase = _open.pop(index)
+    stats = _phases.setdefault(name, PhaseStats())
+    stats.runs += 1
+    stats.wall_time += time.perf_counter() - phase.wall_start
+    stats.cpu_time += time.process_time() - phase.cpu_start
+    stats.items += phase.items
+    if phase.rss_start is not None and (rss_end := _peak_rss()) is not None:
+        stats.peak_rss_delta = max(stats.peak_rss_delta or 0, rss_end - phase.rss_start)
+    if TRACE_MEMORY:
+        stats.traced_peak = max(
+            stats.traced_peak or 0, phase.traced_peak - phase.traced_start
+        )
+
+
+@contextmanager
+def phase(name: str, items: int = 0) -> Iterator[None]:
+    """Record a phase of the build, while the context is active.
+
+    :param name: The name to report the phase under.
+    :param items: The number of items, that the phase is known to process.
+    """
+    if not ENABLED:
+        yield
+        return
+    start_phase(name, items)
+    try:
+        yield
+    finally:
+        end_phase(name)
+
+
+def record_phase(name: str) -> Callable[[T], T]:
+    """Decorator, recording each call of the function as a run of a phase.
+
+    :param name: The name to report the phase under.
+    """
+
+    def inner(func: T) -> T:
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not ENABLED:
+                return func(*args, **kwargs)
+            with phase(name):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return inner
+
+
+def count_items(items: int) -> None:
+    """Add to the number of items processed by the innermost phase in progress."""
+    if ENABLED and _open:
+        _open[-1].items += items
+
+
+def get_phases() -> dict[str, PhaseStats]:
+    """The telemetry recorded so far, by phase name."""
+    return _phases
+
+
+def write_telemetry_report(app: Sphinx, _exception: Exception | None) -> None:
+    """Write the telemetry of the build to ``needs_telemetry.json`` in the output directory."""
+    if not ENABLED:
+        return
+    report = {
+        "format": _REPORT_FORMAT,
+        "builder": app.builder.name,
+        "trace_memory": TRACE_MEMORY,
+        "phases": {
+            name: {
+                "runs": stats.runs,
+                "wall_time": round(stats.wall_time, 6),
+                "cpu_time": round(stats.cpu_time, 6),
+                "peak_rss_delta": stats.peak_rss_delta,
+                "traced_peak": stats.traced_peak,
+                "items": stats.items,
+            }
+            for name, stats in _phases.items()
+        },
+    }
+    path = Path(str(app.outdir), REPORT_FILENAME)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n", "utf8")
+
+
+def _peak_rss() -> int | None:
+    """The peak resident memory of the process so far, in bytes, if available."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # reported in bytes on macOS, and in kilobytes elsewhere
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _update_traced_peaks() -> None:
+    """Add the traced peak since the last update to all open phases, and reset it,
+    so that a nested phase measures its own peak, without losing that of the outer phases.
+    """
+    peak = tracemalloc.get_traced_memory()[1]
+    for open_phase in _open:
+        open_phase.traced_peak = max(open_phase.traced_peak, peak)
+    tracemalloc.reset_peak()
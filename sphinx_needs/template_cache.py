@@ -0,0 +1,54 @@
+"""Sizing and pre-warming of the compiled template registry.
+
+Templates given in the configuration, such as :ref:`needs_role_need_template`,
+are rendered for many needs, so they are compiled once per build, during ``config-inited``,
+and then found in the registry by every call site rendering them.
+"""
+
+from __future__ import annotations
+
+from contextlib import suppress
+from typing import TYPE_CHECKING
+
+from sphinx_needs._jinja import compile_template, template_registry
+from sphinx_needs.config import NeedsSphinxConfig
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from sphinx.application import Sphinx
+    from sphinx.config import Config
+
+
+def prepare_template_registry(_app: Sphinx, config: Config) -> None:
+    """Size the template registry by :ref:`needs_template_cache_size`,
+    reset its counters, and compile the templates of the configuration.
+
+    Connected to ``config-inited`` at priority 549,
+    i.e. before ``needs_string_links`` are compiled.
+    Invalid templates are skipped here, and reported where they are rendered.
+
+    :param config: The Sphinx configuration.
+    """
+    needs_config = NeedsSphinxConfig(config)
+    template_registry.resize(needs_config.template_cache_size)
+    template_registry.reset_stats()
+    for template in _config_templates(needs_config):
+        with suppress(Exception):
+            compile_template(template, autoescape=False)
+
+
+def _config_templates(needs_config: NeedsSphinxConfig) -> Iterator[str]:
+    """The templates of the configuration, that are rendered with :func:`compile_template`."""
+    if isinstance(needs_config.role_need_template, str):
+        yield needs_config.role_need_template
+    if isinstance(needs_config.diagram_template, str):
+        yield needs_config.diagram_template
+    if isinstance(needs_config.constraints, dict):
+        for constraint in needs_config.constraints.values():
+            if isinstance(constraint, dict) and "error_message" in constraint:
+                yield str(constraint["error_message"])
+    if isinstance(needs_config.external_needs, list):
+        for source in needs_config.external_needs:
+            if isinstance(source, dict) and source.get("target_url"):
+                yield str(source["target_url"])
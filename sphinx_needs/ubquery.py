@@ -13,7 +13,9 @@ This opens a pathway to per-type fields
 which is not possible with ``eval()`` since it eagerly evaluates all names
 in the expression context upfront.
 
-The public entry point is :func:`try_build_simple_predicate`.
+The public entry points are :func:`try_build_simple_predicate`,
+which evaluates a single need, and :func:`try_build_batch_predicate`,
+which evaluates many needs at once from a columnar snapshot of their values.
 """
 
 from __future__ import annotations
@@ -23,10 +25,14 @@ import operator
 import re
 from collections.abc import Callable, Mapping
 from functools import lru_cache
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
+from sphinx_needs.exceptions import NeedsInvalidFilter
 from sphinx_needs.need_item import NeedItem, NeedPartItem
 
+if TYPE_CHECKING:
+    from sphinx_needs.views import _Column
+
 _COMPARE_OPS: dict[type, Callable[[Any, Any], Any]] = {
     ast.Eq: operator.eq,
     ast.NotEq: operator.ne,
@@ -97,6 +103,22 @@ def _get_field(
 #: The second argument is an optional fallback mapping (e.g. ``config.filter_data``).
 SimplePredicate = Callable[[NeedItem | NeedPartItem, Mapping[str, Any] | None], bool]
 
+#: Type alias for predicates returned by the batch builder.
+#: They take a getter for the columns of a :class:`~sphinx_needs.views._Columns` snapshot,
+#: the rows to evaluate, and an optional fallback mapping (e.g. ``config.filter_data``),
+#: and return the matching rows (in the given order) and the error raised for each failing row.
+BatchPredicate = Callable[
+    [Callable[[str], "_Column"], list[int], Mapping[str, Any] | None],
+    tuple[list[int], dict[int, Exception]],
+]
+
+_Leaf = tuple[tuple[str, ...], Callable[[Any], Any]]
+"""An operand, and the function to apply to its value.
+
+The operand is either a single need field name,
+or an attribute chain resolved against the fallback context (e.g. ``("var", "cpu")``).
+"""
+
 
 @lru_cache(maxsize=256)
 def try_build_simple_predicate(
@@ -113,14 +135,27 @@ def try_build_simple_predicate(
     return _expr_to_predicate(tree.body)
 
 
-def _expr_to_predicate(
-    expr: ast.expr,
-) -> SimplePredicate | None:
-    """Convert an AST expression to a native callable, or None if too complex.
+@lru_cache(maxsize=256)
+def try_build_batch_predicate(
+    filter_string: str,
+) -> BatchPredicate | None:
+    """Try to compile a filter string into a predicate evaluated on columns of need values.
 
-    Each returned callable has signature ``(need, ctx) -> bool`` where *ctx*
-    is an optional fallback mapping (e.g. ``config.filter_data``).
+    The same filter strings are supported as for :func:`try_build_simple_predicate`,
+    but each operation is evaluated only once per distinct value of a column,
+    rather than once per need.
+
+    Returns None if the expression is too complex to short-circuit.
     """
+    try:
+        tree = ast.parse(filter_string, mode="eval")
+    except SyntaxError:
+        return None
+    return _expr_to_batch(tree.body, strict=True)
+
+
+def _expr_to_leaf(expr: ast.expr) -> _Leaf | None:
+    """Convert an AST expression, which operates on a single operand, to a leaf."""
 
     # --- comparisons: ==, !=, <, <=, >, >= ---
     if isinstance(expr, ast.Compare) and len(expr.ops) == 1:
@@ -151,12 +186,8 @@ def _expr_to_predicate(
                     return None
                 op_fn = _COMPARE_OPS[op_type]
                 if swapped:
-                    return lambda need, ctx=None, _f=field, _v=value, _op=op_fn: _op(  # type: ignore[misc]
-                        _v, _get_field(need, _f, ctx)
-                    )
-                return lambda need, ctx=None, _f=field, _v=value, _op=op_fn: _op(  # type: ignore[misc]
-                    _get_field(need, _f, ctx), _v
-                )
+                    return (field,), lambda x, _v=value, _op=op_fn: _op(_v, x)
+                return (field,), lambda x, _v=value, _op=op_fn: _op(x, _v)
 
             # --- attribute chain comparisons: var.cpu == "arm" ---
             chain: tuple[str, ...] | None = None
@@ -181,12 +212,8 @@ def _expr_to_predicate(
             if chain is not None and chain[0] in _FALLBACK_ROOTS:
                 op_fn = _COMPARE_OPS[op_type]
                 if chain_swapped:
-                    return lambda need, ctx=None, _c=chain, _v=chain_value, _op=op_fn: (  # type: ignore[misc]
-                        _op(_v, _resolve_chain(ctx, _c))
-                    )
-                return lambda need, ctx=None, _c=chain, _v=chain_value, _op=op_fn: _op(  # type: ignore[misc]
-                    _resolve_chain(ctx, _c), _v
-                )
+                    return chain, lambda x, _v=chain_value, _op=op_fn: _op(_v, x)
+                return chain, lambda x, _v=chain_value, _op=op_fn: _op(x, _v)
 
         # field in [literal, ...] / field not in [literal, ...]
         if isinstance(expr.ops[0], ast.In | ast.NotIn):
@@ -206,12 +233,8 @@ def _expr_to_predicate(
                     if isinstance(e, ast.Constant)
                 )
                 if negate:
-                    return lambda need, ctx=None, _f=field_name, _v=values: (  # type: ignore[misc]
-                        _get_field(need, _f, ctx) not in _v
-                    )
-                return lambda need, ctx=None, _f=field_name, _v=values: (  # type: ignore[misc]
-                    _get_field(need, _f, ctx) in _v
-                )
+                    return (field_name,), lambda x, _v=values: x not in _v
+                return (field_name,), lambda x, _v=values: x in _v
 
             # "value" in field  (e.g. "tag" in tags)
             # "value" not in field
@@ -225,12 +248,8 @@ def _expr_to_predicate(
                 if in_field in _CONTEXT_ONLY_NAMES:
                     return None
                 if negate:
-                    return lambda need, ctx=None, _f=in_field, _v=in_value: (  # type: ignore[misc]
-                        _v not in _get_field(need, _f, ctx)
-                    )
-                return lambda need, ctx=None, _f=in_field, _v=in_value: (  # type: ignore[misc]
-                    _v in _get_field(need, _f, ctx)
-                )
+                    return (in_field,), lambda x, _v=in_value: _v not in x
+                return (in_field,), lambda x, _v=in_value: _v in x
 
             # "value" in var.field  (e.g. "arm" in var.archs)
             # "value" not in var.field
@@ -243,12 +262,8 @@ def _expr_to_predicate(
                 if in_chain is not None and in_chain[0] in _FALLBACK_ROOTS:
                     in_val = expr.left.value
                     if negate:
-                        return lambda need, ctx=None, _c=in_chain, _v=in_val: (  # type: ignore[misc]
-                            _v not in _resolve_chain(ctx, _c)
-                        )
-                    return lambda need, ctx=None, _c=in_chain, _v=in_val: (  # type: ignore[misc]
-                        _v in _resolve_chain(ctx, _c)
-                    )
+                        return in_chain, lambda x, _v=in_val: _v not in x
+                    return in_chain, lambda x, _v=in_val: _v in x
 
     # --- search(pattern, field) function call ---
     if (
@@ -268,15 +283,35 @@ def _expr_to_predicate(
             compiled = re.compile(pattern)
         except re.error:
             return None
-        return lambda need, ctx=None, _rx=compiled, _f=search_field: (  # type: ignore[misc]
-            _rx.search(_get_field(need, _f, ctx)) is not None
-        )
+        return (search_field,), lambda x, _rx=compiled: _rx.search(x) is not None
 
     # --- bare name (e.g. is_external) ---
     if isinstance(expr, ast.Name):
         if expr.id in _CONTEXT_ONLY_NAMES:
             return None
-        return lambda need, ctx=None, _f=expr.id: bool(_get_field(need, _f, ctx))  # type: ignore[misc]
+        return (expr.id,), bool
+
+    return None
+
+
+def _expr_to_predicate(
+    expr: ast.expr,
+) -> SimplePredicate | None:
+    """Convert an AST expression to a native callable, or None if too complex.
+
+    Each returned callable has signature ``(need, ctx) -> bool`` where *ctx*
+    is an optional fallback mapping (e.g. ``config.filter_data``).
+    """
+
+    if (leaf := _expr_to_leaf(expr)) is not None:
+        operand, apply = leaf
+        if len(operand) == 1:
+            return lambda need, ctx=None, _f=operand[0], _fn=apply: _fn(  # type: ignore[misc]
+                _get_field(need, _f, ctx)
+            )
+        return lambda need, ctx=None, _c=operand, _fn=apply: _fn(  # type: ignore[misc]
+            _resolve_chain(ctx, _c)
+        )
 
     # --- not <expr> ---
     if isinstance(expr, ast.UnaryOp) and isinstance(expr.op, ast.Not):
@@ -297,3 +332,146 @@ def _expr_to_predicate(
             return lambda need, ctx=None, _fns=preds: any(fn(need, ctx) for fn in _fns)  # type: ignore[misc]
 
     return None
+
+
+def _to_bool(result: Any, strict: bool) -> bool:
+    """Convert the result of a leaf to a boolean.
+
+    :param strict: Whether the result is that of the whole filter,
+        which must be a boolean (as checked for the other filter paths).
+    """
+    if isinstance(result, bool):
+        return result
+    if strict:
+        raise NeedsInvalidFilter(
+            f"Filter did not evaluate to a boolean, instead {type(result)}: {result}"
+        )
+    return bool(result)
+
+
+def _leaf_to_batch(leaf: _Leaf, strict: bool) -> BatchPredicate:
+    """Convert a leaf to a batch predicate, which applies the leaf once per distinct value."""
+    operand, apply = leaf
+
+    def _batch(
+        columns: Callable[[str], _Column],
+        rows: list[int],
+        ctx: Mapping[str, Any] | None,
+    ) -> tuple[list[int], dict[int, Exception]]:
+        if len(operand) > 1 or (ctx is not None and operand[0] in ctx):
+            # the value is the same for all rows
+            try:
+                value = (
+                    _resolve_chain(ctx, operand)
+                    if len(operand) > 1
+                    else ctx[operand[0]]  # type: ignore[index]
+                )
+                result = _to_bool(apply(value), strict)
+            except NeedsInvalidFilter:
+                raise
+            except Exception as e:
+                return [], dict.fromkeys(rows, e)
+            return (list(rows) if result else []), {}
+
+        column = columns(operand[0])
+        codes, values = column.codes, column.values
+        results: dict[int, bool | Exception] = {}
+        matched: list[int] = []
+        errors: dict[int, Exception] = {}
+        for row in rows:
+            code = codes[row]
+            if (res := results.get(code)) is None:
+                if code < 0:
+                    res = NameError(f"name {operand[0]!r} is not defined")
+                else:
+                    try:
+                        res = _to_bool(apply(values[code]), strict)
+                    except NeedsInvalidFilter:
+                        raise
+                    except Exception as e:
+                        res = e
+                results[code] = res
+            if res is True:
+                matched.append(row)
+            elif res is not False:
+                errors[row] = res
+        return matched, errors
+
+    return _batch
+
+
+def _expr_to_batch(expr: ast.expr, strict: bool = False) -> BatchPredicate | None:
+    """Convert an AST expression to a batch predicate, or None if too complex.
+
+    The semantics match those of :func:`_expr_to_predicate`, applied to each row:
+    ``and`` / ``or`` only evaluate later operands for the rows not yet decided,
+    and a row for which an operand raises an error is neither matched nor evaluated further.
+
+    :param strict: Whether this is the whole filter, whose result must be a boolean.
+    """
+
+    if (leaf := _expr_to_leaf(expr)) is not None:
+        return _leaf_to_batch(leaf, strict)
+
+    # --- not <expr> ---
+    if isinstance(expr, ast.UnaryOp) and isinstance(expr.op, ast.Not):
+        inner = _expr_to_batch(expr.operand)
+        if inner is not None:
+            operand_fn: BatchPredicate = inner
+
+            def _not(
+                columns: Callable[[str], _Column],
+                rows: list[int],
+                ctx: Mapping[str, Any] | None,
+            ) -> tuple[list[int], dict[int, Exception]]:
+                matched, errors = operand_fn(columns, rows, ctx)
+                excluded = {*matched, *errors}
+                return [r for r in rows if r not in excluded], errors
+
+            return _not
+
+    # --- <expr> and <expr> and ... ---
+    if isinstance(expr, ast.BoolOp) and isinstance(expr.op, ast.And):
+        batch_preds = [_expr_to_batch(v) for v in expr.values]
+        if all(p is not None for p in batch_preds):
+            and_fns = [p for p in batch_preds if p is not None]
+
+            def _and(
+                columns: Callable[[str], _Column],
+                rows: list[int],
+                ctx: Mapping[str, Any] | None,
+            ) -> tuple[list[int], dict[int, Exception]]:
+                errors: dict[int, Exception] = {}
+                for fn in and_fns:
+                    rows, fn_errors = fn(columns, rows, ctx)
+                    errors.update(fn_errors)
+                return rows, errors
+
+            return _and
+
+    # --- <expr> or <expr> or ... ---
+    if isinstance(expr, ast.BoolOp) and isinstance(expr.op, ast.Or):
+        batch_preds = [_expr_to_batch(v) for v in expr.values]
+        if all(p is not None for p in batch_preds):
+            or_fns = [p for p in batch_preds if p is not None]
+
+            def _or(
+                columns: Callable[[str], _Column],
+                rows: list[int],
+                ctx: Mapping[str, Any] | None,
+            ) -> tuple[list[int], dict[int, Exception]]:
+                decided: set[int] = set()
+                errors: dict[int, Exception] = {}
+                remaining = rows
+                for fn in or_fns:
+                    matched, fn_errors = fn(columns, remaining, ctx)
+                    decided.update(matched)
+                    errors.update(fn_errors)
+                    remaining = [
+                        r for r in remaining if r not in decided and r not in errors
+                    ]
+                return [r for r in rows if r in decided], errors
+
+            return _or
+
+    return None
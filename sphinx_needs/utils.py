@@ -1,18 +1,22 @@
 from __future__ import annotations
 
 import cProfile
+import hashlib
 import importlib
 import operator
 import os
+import pickle
 import re
-from collections.abc import Callable, Iterable
-from dataclasses import dataclass
+import types
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass, field, fields, is_dataclass
 from functools import lru_cache, reduce, wraps
 from typing import TYPE_CHECKING, Any, Protocol, TypeVar
 from urllib.parse import urlparse
 
 from docutils import nodes
 from sphinx.application import Sphinx
+from sphinx.builders import Builder
 from sphinx.environment import BuildEnvironment
 
 from sphinx_needs._jinja import render_template_string
@@ -82,6 +86,70 @@ def split_need_id(need_id_full: str) -> tuple[str, str | None]:
     return need_id, need_part_id
 
 
+@dataclass(frozen=True, slots=True)
+class NeedtableRenderContext:
+    """Everything the cells of a table need, that is the same for every cell.
+
+    Create it with :meth:`create` once per document, rather than once per cell,
+    and pass it to :func:`render_cell`.
+    """
+
+    builder: Builder
+    fromdocname: str
+    """The document the table is written to."""
+    all_needs: NeedsView
+    render_context: dict[str, Any]
+    """The :ref:`needs_render_context`, for rendering string links."""
+    string_link_fields: frozenset[str]
+    """The fields, whose string values are split into several links."""
+    link_fields: frozenset[str]
+    """The link fields, and their ``_back`` counterparts."""
+    string_links: dict[str, tuple[CompiledStringLink, ...]]
+    """The string links applying to each field, that any apply to."""
+    _relative_uris: dict[str, str] = field(default_factory=dict)
+
+    @classmethod
+    def create(
+        cls, app: Sphinx, fromdocname: str, all_needs: NeedsView
+    ) -> NeedtableRenderContext:
+        """Collect the configuration and schema needed to render the cells of a table.
+
+        :param app: current sphinx app
+        :param fromdocname: current document
+        :param all_needs: Dictionary of all need objects
+        """
+        needs_config = NeedsSphinxConfig(app.config)
+        link_fields: set[str] = set()
+        for link_field in SphinxNeedsData(app.env).get_schema().iter_link_fields():
+            link_fields.add(link_field.name)
+            link_fields.add(link_field.name + "_back")
+        string_links: dict[str, list[CompiledStringLink]] = {}
+        for link_conf in compiled_string_links(needs_config).values():
+            for option in link_conf.options:
+                string_links.setdefault(option, []).append(link_conf)
+        return cls(
+            builder=app.builder,
+            fromdocname=fromdocname,
+            all_needs=all_needs,
+            render_context=needs_config.render_context,
+            string_link_fields=frozenset(string_link_field_names(needs_config)),
+            link_fields=frozenset(link_fields),
+            string_links={
+                option: tuple(confs) for option, confs in string_links.items()
+            },
+        )
+
+    def relative_uri(self, docname: str) -> str:
+        """The uri of a document, relative to the document the table is written to."""
+        try:
+            return self._relative_uris[docname]
+        except KeyError:
+            uri = self._relative_uris[docname] = self.builder.get_relative_uri(
+                self.fromdocname, docname
+            )
+            return uri
+
+
 def row_col_maker(
     app: Sphinx,
     fromdocname: str,
@@ -95,6 +163,8 @@ def row_col_maker(
     """
     Creates and returns a column.
 
+    To render many cells, create a :class:`NeedtableRenderContext` once and use :func:`render_cell`.
+
     :param app: current sphinx app
     :param fromdocname: current document
     :param all_needs: Dictionary of all need objects
@@ -105,43 +175,61 @@ def row_col_maker(
     :param prefix: string, which is used as prefix for the text output
     :return: column object (nodes.entry)
     """
-    builder = app.builder
-    env = app.env
-    needs_config = NeedsSphinxConfig(env.config)
+    return render_cell(
+        NeedtableRenderContext.create(app, fromdocname, all_needs),
+        need_info,
+        need_key,
+        make_ref=make_ref,
+        ref_lookup=ref_lookup,
+        prefix=prefix,
+    )
+
+
+def render_cell(
+    context: NeedtableRenderContext,
+    need_info: NeedItem | NeedPartItem,
+    need_key: str,
+    make_ref: bool = False,
+    ref_lookup: bool = False,
+    prefix: str = "",
+) -> nodes.entry:
+    """
+    Creates and returns a column, like :func:`row_col_maker`,
+    for the document and needs of the given context.
 
+    :param context: The context shared by all cells of the table
+    :param need_info: need_info object, which stores all related need data
+    :param need_key: The key to access the needed data from need_info
+    :param make_ref: If true, creates a reference for the given data in need_key
+    :param ref_lookup: If true, it uses the data to lookup for a related need and uses its data to create the reference
+    :param prefix: string, which is used as prefix for the text output
+    :return: column object (nodes.entry)
+    """
     row_col = nodes.entry(classes=["needs_" + need_key])
     para_col = nodes.paragraph()
 
-    needs_string_links_option = string_link_field_names(needs_config)
-    # compiled once per cell, not once per value in the cell
-    link_string_list = compiled_string_links(needs_config)
-
     if need_key in need_info and need_info[need_key] is not None:
         value = need_info[need_key]
         if isinstance(value, list | set):
             data = value
-        elif isinstance(value, str) and need_key in needs_string_links_option:
+        elif isinstance(value, str) and need_key in context.string_link_fields:
             data = split_string_link_value(value)
         else:
             data = [value]
 
+        is_link_field = need_key in context.link_fields
+        field_string_links = list(context.string_links.get(need_key, ()))
+
         for index, datum in enumerate(data):
             link_id = datum
             link_part = None
 
-            needs_schema = SphinxNeedsData(env).get_schema()
-            link_list = []
-            for link_field in needs_schema.iter_link_fields():
-                link_list.append(link_field.name)
-                link_list.append(link_field.name + "_back")
-
-            matching_link_confs = [
-                link_conf
-                for link_conf in link_string_list.values()
-                if need_key in link_conf.options and len(datum) != 0
-            ]
+            # only sized when a string link applies, as other values may be e.g. bools
+            matching_link_confs = (
+                field_string_links if field_string_links and len(datum) != 0 else []
+            )
 
-            if need_key in link_list and "." in datum:
+            if is_link_field and "." in datum:
                 link_id = datum.split(".")[0]
                 link_part = datum.split(".")[1]
 
@@ -163,30 +251,26 @@ def row_col_maker(
                                 "external_url must be set for external needs"
                             )
                             ref_col["refuri"] = check_and_calc_base_url_rel_path(
-                                need_info["external_url"], fromdocname
+                                need_info["external_url"], context.fromdocname
                             )
                             ref_col["classes"].append(need_info["external_css"])
                             row_col["classes"].append(need_info["external_css"])
                         elif _docname := need_info["docname"]:
-                            ref_col["refuri"] = builder.get_relative_uri(
-                                fromdocname, _docname
-                            )
+                            ref_col["refuri"] = context.relative_uri(_docname)
                             ref_col["refuri"] += "#" + datum
                     elif ref_lookup:
-                        temp_need = all_needs[link_id]
+                        temp_need = context.all_needs[link_id]
                         if temp_need["is_external"]:
                             assert temp_need["external_url"] is not None, (
                                 "external_url must be set for external needs"
                             )
                             ref_col["refuri"] = check_and_calc_base_url_rel_path(
-                                temp_need["external_url"], fromdocname
+                                temp_need["external_url"], context.fromdocname
                             )
                             ref_col["classes"].append(temp_need["external_css"])
                             row_col["classes"].append(temp_need["external_css"])
                         elif _docname := temp_need["docname"]:
-                            ref_col["refuri"] = builder.get_relative_uri(
-                                fromdocname, _docname
-                            )
+                            ref_col["refuri"] = context.relative_uri(_docname)
                             ref_col["refuri"] += "#" + temp_need["id"]
                             if link_part:
                                 ref_col["refuri"] += "." + link_part
@@ -202,7 +286,7 @@ def row_col_maker(
                     datum,
                     need_key,
                     matching_link_confs,
-                    render_context=needs_config.render_context,
+                    render_context=context.render_context,
                     location=(need_info["docname"], need_info["lineno"]),
                 )
             else:
@@ -658,3 +742,76 @@ def remove_node_from_tree(node: nodes.Element) -> None:
     for att in ("ids", "names", "classes", "dupnames"):
         node[att] = []
     node.replace_self([])
+
+
+_ADDRESS_REPR = re.compile(r" at 0x[0-9A-Fa-f]+>")
+"""Matches the default representation of objects, which contains their memory address."""
+
+
+def stable_repr(value: Any, _seen: frozenset[int] = frozenset()) -> str:
+    """Represent a configuration value, such that it is the same in every build process.
+
+    Functions are represented by their name, their code including its constants,
+    their default arguments and the values of their closure,
+    rather than their memory address.
+    A value that can not be represented stably is represented by a unique string,
+    so that a fingerprint containing it never matches that of another build.
+    """
+    if id(value) in _seen:
+        # a recursive reference, e.g. of a function to itself via its closure
+        return "<recursion>"
+    seen = _seen | {id(value)}
+    if isinstance(value, Mapping):
+        return (
+            "{"
+            + ", ".join(
+                f"{stable_repr(k, seen)}: {stable_repr(v, seen)}"
+                for k, v in value.items()
+            )
+            + "}"
+        )
+    if isinstance(value, list | tuple):
+        return "[" + ", ".join(stable_repr(v, seen) for v in value) + "]"
+    if isinstance(value, set | frozenset):
+        return "{" + ", ".join(sorted(stable_repr(v, seen) for v in value)) + "}"
+    if isinstance(value, types.FunctionType):
+        hasher = hashlib.blake2b(digest_size=8)
+        hasher.update(_code_repr(value.__code__).encode())
+        hasher.update(stable_repr(value.__defaults__, seen).encode())
+        hasher.update(stable_repr(value.__kwdefaults__, seen).encode())
+        for cell in value.__closure__ or ():
+            try:
+                contents = cell.cell_contents
+            except ValueError:  # an empty cell
+                contents = None
+            hasher.update(stable_repr(contents, seen).encode())
+        return f"{value.__module__}.{value.__qualname__}:{hasher.hexdigest()}"
+    if is_dataclass(value) and not isinstance(value, type):
+        return (
+            f"{type(value).__name__}("
+            + ", ".join(
+                f"{item.name}={stable_repr(getattr(value, item.name), seen)}"
+                for item in fields(value)
+            )
+            + ")"
+        )
+    representation = repr(value)
+    if _ADDRESS_REPR.search(representation):
+        return f"<unstable {os.urandom(16).hex()}>"
+    return representation
+
+
+def _code_repr(code: types.CodeType) -> str:
+    """Represent the code of a function, including its constants and nested functions."""
+    consts = ", ".join(
+        _code_repr(const) if isinstance(const, types.CodeType) else stable_repr(const)
+        for const in code.co_consts
+    )
+    return f"{code.co_code.hex()}:{code.co_names!r}:[{consts}]"
+
+
+def value_digest(value: Any) -> bytes:
+    """Create a digest of a picklable value."""
+    return hashlib.blake2b(
+        pickle.dumps(value, pickle.HIGHEST_PROTOCOL), digest_size=16
+    ).digest()
@@ -1,16 +1,21 @@
 from __future__ import annotations
 
-from collections.abc import Iterable, Iterator, Mapping
+from array import array
+from collections.abc import Callable, Iterable, Iterator, Mapping
 from itertools import chain
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Literal
 
 if TYPE_CHECKING:
     from sphinx_needs.need_item import NeedItem, NeedPartItem
+    from sphinx_needs.needs_schema import FieldsSchema
 
 
 _IdSet = list[tuple[str, str | None]]
 """Set of (need, part) ids."""
 
+_FieldKind = Literal["extra_scalar", "extra_array", "link"]
+"""How a field's values are stored, and so how its inverted index is built."""
+
 
 class _Indexes:
     """Indexes of common fields for fast filtering of needs."""
@@ -48,14 +53,222 @@ class _Indexes:
         """Mapping of part ids to the needs that contain them."""
 
 
+class _Column:
+    """The values of a single field, for each need and part, dictionary-encoded."""
+
+    __slots__ = ("codes", "values")
+
+    def __init__(self, codes: list[int], values: list[Any]) -> None:
+        self.codes = codes
+        """For each row, the index of its value in ``values``, or -1 if it does not have the field."""
+        self.values = values
+        """The distinct values of the field."""
+
+
+_ColumnPredicate = Callable[
+    [Callable[[str], _Column], list[int]], tuple[list[int], dict[int, Exception]]
+]
+"""A predicate evaluated on the columns of the needs,
+returning the matching rows (in the given order) and the error raised for each failing row.
+"""
+
+
+class _Columns:
+    """A columnar snapshot of the needs and parts, for evaluating filters on many at once.
+
+    Each need and part is a row, in the order of :attr:`_LazyIndexes.positions`,
+    and the columns are lazily computed for each field when first requested.
+    """
+
+    __slots__ = ("_columns", "_items", "keys")
+
+    def __init__(
+        self, needs: Mapping[str, NeedItem], keys: list[tuple[str, str | None]]
+    ) -> None:
+        self.keys = keys
+        """The (need, part) id of each row."""
+        self._items: list[NeedItem | NeedPartItem] = []
+        for id, part_id in keys:
+            need = needs[id]
+            self._items.append(need if part_id is None else need.get_part_item(part_id))  # type: ignore[arg-type]
+        self._columns: dict[str, _Column] = {}
+
+    def column(self, name: str) -> _Column:
+        """Get the column of a field, computing it if necessary."""
+        if (column := self._columns.get(name)) is None:
+            column = self._columns[name] = self._compute_column(name)
+        return column
+
+    def _compute_column(self, name: str) -> _Column:
+        codes: list[int] = []
+        values: list[Any] = []
+        # map values to their code, with lists encoded as tuples,
+        # and the type included, so that e.g. 1 and True are not merged
+        encoding: dict[Any, int] = {}
+        for item in self._items:
+            if name not in item:
+                codes.append(-1)
+                continue
+            value = item[name]
+            key = (type(value), tuple(value) if isinstance(value, list) else value)
+            try:
+                code = encoding.get(key)
+            except TypeError:  # unhashable value
+                code = None
+            else:
+                if code is None:
+                    code = encoding[key] = len(values)
+                    values.append(value)
+            if code is None:
+                code = len(values)
+                values.append(value)
+            codes.append(code)
+        return _Column(codes, values)
+
+
+class _LinkIndex:
+    """A compact adjacency index of the links between needs, for graph traversals.
+
+    Needs are numbered by their position in the needs,
+    and the adjacency of each link type and direction is computed lazily, in CSR form:
+    the needs adjacent to need ``n`` are ``targets[offsets[n]:offsets[n + 1]]``.
+
+    Only links between whole needs are recorded, links to parts are not followed.
+    """
+
+    __slots__ = ("_adjacency", "_needs", "_reachable", "ids", "numbers")
+
+    def __init__(self, needs: Mapping[str, NeedItem]) -> None:
+        self._needs = needs
+        self.ids = list(needs)
+        """The id of each need number."""
+        self.numbers = {id: n for n, id in enumerate(self.ids)}
+        """The number of each need id."""
+        self._adjacency: dict[tuple[str, bool], tuple[array[int], array[int]]] = {}
+        self._reachable: dict[
+            tuple[int, tuple[str, ...], str, int | None], tuple[int, ...]
+        ] = {}
+
+    def adjacency(
+        self, link_type: str, incoming: bool
+    ) -> tuple[array[int], array[int]]:
+        """Get the ``(offsets, targets)`` arrays of a link type,
+        following back links if ``incoming``, computing them if necessary.
+        """
+        key = (link_type, incoming)
+        if (adjacency := self._adjacency.get(key)) is None:
+            offsets = array("l", [0])
+            targets = array("l")
+            for need in self._needs.values():
+                try:
+                    links = (
+                        need.get_backlinks(link_type, as_str=False)
+                        if incoming
+                        else need.get_links(link_type, as_str=False)
+                    )
+                except KeyError:
+                    links = []
+                for link in links:
+                    if (
+                        link.part is None
+                        and (n := self.numbers.get(link.id)) is not None
+                    ):
+                        targets.append(n)
+                offsets.append(len(targets))
+            adjacency = self._adjacency[key] = (offsets, targets)
+        return adjacency
+
+    def reachable(
+        self,
+        root: int,
+        link_types: tuple[str, ...],
+        direction: Literal["both", "incoming", "outgoing"],
+        depth: int | None,
+        allowed: Callable[[int], bool] | None = None,
+    ) -> tuple[int, ...]:
+        """Get the needs reachable from the root, ordered by their number,
+        within ``depth`` steps along the given link types and direction.
+
+        The walk is breadth first, so ``depth`` limits the shortest distance from the root.
+
+        :param allowed: If given, only needs for which this returns true are visited,
+            and the result is not cached.
+        """
+        key = (root, link_types, direction, depth)
+        if allowed is None and (cached := self._reachable.get(key)) is not None:
+            return cached
+        adjacencies = [
+            self.adjacency(link_type, incoming)
+            for link_type in link_types
+            for incoming in (
+                (True,)
+                if direction == "incoming"
+                else (False,)
+                if direction == "outgoing"
+                else (False, True)
+            )
+        ]
+        visited = {root: None}
+        frontier = [root]
+        level = 0
+        while frontier and (depth is None or level < depth):
+            level += 1
+            next_frontier = []
+            for n in frontier:
+                for offsets, targets in adjacencies:
+                    for target in targets[offsets[n] : offsets[n + 1]]:
+                        if target not in visited and (
+                            allowed is None or allowed(target)
+                        ):
+                            visited[target] = None
+                            next_frontier.append(target)
+            frontier = next_frontier
+        result = tuple(sorted(visited))
+        if allowed is None:
+            self._reachable[key] = result
+        return result
+
+
 class _LazyIndexes:
     """A lazily computed view of indexes for needs."""
 
-    __slots__ = ("_indexes", "_needs")
+    __slots__ = (
+        "_columns",
+        "_field_indexes",
+        "_field_kinds",
+        "_indexes",
+        "_links",
+        "_needs",
+        "_positions",
+    )
 
-    def __init__(self, needs: Mapping[str, NeedItem]) -> None:
+    def __init__(
+        self,
+        needs: Mapping[str, NeedItem],
+        field_kinds: Mapping[str, _FieldKind] | None = None,
+    ) -> None:
         self._needs = needs
         self._indexes: _Indexes | None = None
+        self._field_kinds: Mapping[str, _FieldKind] = field_kinds or {}
+        self._field_indexes: dict[str, dict[Any, _IdSet]] = {}
+        self._positions: dict[tuple[str, str | None], int] | None = None
+        self._columns: _Columns | None = None
+        self._links: _LinkIndex | None = None
+
+    @classmethod
+    def from_schema(
+        cls, needs: Mapping[str, NeedItem], schema: FieldsSchema | None
+    ) -> _LazyIndexes:
+        """Create the indexes, allowing per-field indexes for the extra and link fields of the schema."""
+        field_kinds: dict[str, _FieldKind] = {}
+        if schema is not None:
+            for field in schema.iter_extra_fields():
+                field_kinds[field.name] = (
+                    "extra_array" if field.type == "array" else "extra_scalar"
+                )
+            for name in schema.iter_link_field_names():
+                field_kinds[name] = "link"
+        return cls(needs, field_kinds)
 
     @property
     def needs(self) -> Mapping[str, NeedItem]:
@@ -69,6 +282,84 @@ class _LazyIndexes:
             self._indexes = self._compute()
         return self._indexes
 
+    @property
+    def positions(self) -> dict[tuple[str, str | None], int]:
+        """Get the position of each (need, part) id, in iteration order of the needs,
+        computing it if necessary.
+
+        Each need is directly followed by its parts.
+        """
+        if self._positions is None:
+            self._positions = {}
+            for id, need in self._needs.items():
+                self._positions[(id, None)] = len(self._positions)
+                for part_id in need["parts"]:
+                    self._positions[(id, part_id)] = len(self._positions)
+        return self._positions
+
+    @property
+    def columns(self) -> _Columns:
+        """Get the columnar snapshot of the needs, creating it if necessary."""
+        if self._columns is None:
+            self._columns = _Columns(self._needs, list(self.positions))
+        return self._columns
+
+    @property
+    def links(self) -> _LinkIndex:
+        """Get the adjacency index of the links between needs, creating it if necessary."""
+        if self._links is None:
+            self._links = _LinkIndex(self._needs)
+        return self._links
+
+    def field_type(self, name: str) -> Literal["scalar", "array"] | None:
+        """Get whether a field holds a single value or a list of values per need,
+        or None if it cannot be indexed.
+        """
+        kind = self._field_kinds.get(name)
+        if kind is None:
+            return None
+        return "scalar" if kind == "extra_scalar" else "array"
+
+    def field_index(self, name: str) -> dict[Any, _IdSet]:
+        """Get the inverted index of a field, computing it if necessary.
+
+        For scalar fields, this maps each value to the (need, part) ids with that value,
+        and for array fields, each item to the (need, part) ids whose list contains it.
+
+        :raises KeyError: if the field cannot be indexed
+        """
+        if (index := self._field_indexes.get(name)) is None:
+            index = self._field_indexes[name] = self._compute_field(name)
+        return index
+
+    def _compute_field(self, name: str) -> dict[Any, _IdSet]:
+        """Compute the inverted index for a single extra or link field."""
+        kind = self._field_kinds[name]
+        index: dict[Any, _IdSet] = {}
+        for id, need in self._needs.items():
+            if kind == "link":
+                # parts cannot link to anything, so only the need itself is recorded
+                try:
+                    links = need.get_links(name)
+                except KeyError:
+                    continue
+                for link in dict.fromkeys(links):
+                    index.setdefault(link, []).append((id, None))
+                continue
+
+            try:
+                value = need.get_extra(name)
+            except KeyError:
+                continue
+            # parts take their extra fields from the need that contains them
+            ids = [(id, None), *((id, part_id) for part_id in need["parts"])]
+            if kind == "extra_scalar":
+                index.setdefault(value, []).extend(ids)
+            elif isinstance(value, list | tuple):
+                for item in dict.fromkeys(value):
+                    index.setdefault(item, []).extend(ids)
+        return index
+
     def _compute(self) -> _Indexes:
         """Lazily compute the indexes for the needs, when first requested."""
         _idx_is_external: dict[bool, _IdSet] = {}
@@ -130,9 +421,15 @@ class NeedsView(Mapping[str, "NeedItem"]):
     __slots__ = ("_indexes", "_maybe_len", "_selected_ids")
 
     @classmethod
-    def _from_needs(cls, needs: Mapping[str, NeedItem], /) -> NeedsView:
-        """Create a new view of needs from a mapping of needs."""
-        return cls(_indexes=_LazyIndexes(needs), _selected_ids=None)
+    def _from_needs(
+        cls, needs: Mapping[str, NeedItem], /, schema: FieldsSchema | None = None
+    ) -> NeedsView:
+        """Create a new view of needs from a mapping of needs.
+
+        :param schema: If given, the extra and link fields it declares can be filtered by index,
+            with :meth:`filter_field`.
+        """
+        return cls(_indexes=_LazyIndexes.from_schema(needs, schema), _selected_ids=None)
 
     def __init__(
         self,
@@ -248,6 +545,132 @@ class NeedsView(Mapping[str, "NeedItem"]):
             i for value in values for i in self._indexes.indexes.tags.get(value, [])
         )
 
+    def filter_reachable(
+        self,
+        root_id: str,
+        link_types: Iterable[str],
+        direction: Literal["both", "incoming", "outgoing"],
+        depth: int | None = None,
+    ) -> NeedsView:
+        """Create new view with the needs reachable from a root need,
+        by following the given link types in the given direction,
+        up to ``depth`` links away, and only stepping through needs of this view.
+
+        The needs keep the order of this view.
+        The link index and the results are shared by all views of the same needs.
+        """
+        if root_id not in self:
+            return NeedsView(_indexes=self._indexes, _selected_ids={})
+        links = self._indexes.links
+        selected = self._selected_ids
+        reachable = links.reachable(
+            links.numbers[root_id],
+            tuple(link_types),
+            direction,
+            depth,
+            None if selected is None else lambda n: links.ids[n] in selected,
+        )
+        if selected is None:
+            selected_ids = {links.ids[n]: None for n in reachable}
+        else:
+            reached = {links.ids[n] for n in reachable}
+            selected_ids = {id: None for id in selected if id in reached}
+        return NeedsView(_indexes=self._indexes, _selected_ids=selected_ids)
+
+    def union(self, other: NeedsView) -> NeedsView:
+        """Create new view with the needs that are in either this or the other view.
+
+        The needs are ordered as in the full set of needs.
+        Both views must have been created from the same needs.
+        """
+        if self._selected_ids is None or other._selected_ids is None:
+            return NeedsView(_indexes=self._indexes, _selected_ids=None)
+        positions = self._indexes.positions
+        ids = [
+            (n, None)
+            for n in self._selected_ids.keys() | other._selected_ids.keys()
+            if (n, None) in positions
+        ]
+        ids.sort(key=positions.__getitem__)
+        return NeedsView(
+            _indexes=self._indexes, _selected_ids={n: None for n, _ in ids}
+        )
+
+    def intersection(self, other: NeedsView) -> NeedsView:
+        """Create new view with the needs that are in both this and the other view.
+
+        Both views must have been created from the same needs.
+        """
+        if other._selected_ids is None:
+            return self
+        if self._selected_ids is None:
+            return other
+        return NeedsView(
+            _indexes=self._indexes,
+            _selected_ids={
+                n: None for n in self._selected_ids if n in other._selected_ids
+            },
+        )
+
+    def difference(self, other: NeedsView) -> NeedsView:
+        """Create new view with the needs that are in this view, but not in the other view.
+
+        Both views must have been created from the same needs.
+        """
+        if other._selected_ids is None:
+            return NeedsView(_indexes=self._indexes, _selected_ids={})
+        return NeedsView(
+            _indexes=self._indexes,
+            _selected_ids={
+                n: None
+                for n in (
+                    self._all_needs
+                    if self._selected_ids is None
+                    else self._selected_ids
+                )
+                if n not in other._selected_ids
+            },
+        )
+
+    def indexed_field_type(self, name: str) -> Literal["scalar", "array"] | None:
+        """Get the type of an extra or link field that can be passed to :meth:`filter_field`,
+        or None if the field is not indexed.
+        """
+        return self._indexes.field_type(name)
+
+    def filter_field(self, name: str, values: Iterable[Any]) -> NeedsView:
+        """Create new view with only needs that match one of these values for an extra or link field.
+
+        For a scalar field, the field value must equal one of the values,
+        and for an array field (including link fields), the list must contain one of them.
+
+        :raises KeyError: if the field is not an extra or link field of the schema
+        """
+        index = self._indexes.field_index(name)
+        return self._copy_filtered(i for value in values for i in index.get(value, []))
+
+    def filter_columns(
+        self, predicate: _ColumnPredicate
+    ) -> tuple[NeedsView, dict[str, Exception]]:
+        """Create new view with only needs matching a predicate,
+        evaluated on a columnar snapshot of all needs.
+
+        :return: The new view, and the error raised by the predicate for each failing need id,
+            in the order of the view.
+        """
+        positions = self._indexes.positions
+        rows = [positions[(id, None)] for id in self]
+        columns = self._indexes.columns
+        matched, errors = predicate(columns.column, rows)
+        keys = columns.keys
+        return (
+            NeedsView(
+                _indexes=self._indexes,
+                _selected_ids={keys[row][0]: None for row in matched},
+            ),
+            {keys[row][0]: errors[row] for row in rows if row in errors},
+        )
+
 
 class NeedsAndPartsListView:
     """A read-only view of needs and parts,
@@ -398,3 +821,102 @@ class NeedsAndPartsListView:
         return self._copy_filtered(
             i for value in values for i in self._indexes.indexes.tags.get(value, [])
         )
+
+    def union(self, other: NeedsAndPartsListView) -> NeedsAndPartsListView:
+        """Create new view with the needs/parts that are in either this or the other view.
+
+        The needs/parts are ordered as in the full set of needs, each need followed by its parts.
+        Both views must have been created from the same needs.
+        """
+        if self._selected_ids is None or other._selected_ids is None:
+            return NeedsAndPartsListView(_indexes=self._indexes, _selected_ids=None)
+        positions = self._indexes.positions
+        ids = [
+            i
+            for i in self._selected_ids.keys() | other._selected_ids.keys()
+            if i in positions
+        ]
+        ids.sort(key=positions.__getitem__)
+        return NeedsAndPartsListView(
+            _indexes=self._indexes, _selected_ids=dict.fromkeys(ids)
+        )
+
+    def intersection(self, other: NeedsAndPartsListView) -> NeedsAndPartsListView:
+        """Create new view with the needs/parts that are in both this and the other view.
+
+        Both views must have been created from the same needs.
+        """
+        if other._selected_ids is None:
+            return self
+        if self._selected_ids is None:
+            return other
+        return NeedsAndPartsListView(
+            _indexes=self._indexes,
+            _selected_ids={
+                i: None for i in self._selected_ids if i in other._selected_ids
+            },
+        )
+
+    def difference(self, other: NeedsAndPartsListView) -> NeedsAndPartsListView:
+        """Create new view with the needs/parts that are in this view, but not in the other view.
+
+        Both views must have been created from the same needs.
+        """
+        if other._selected_ids is None:
+            return NeedsAndPartsListView(_indexes=self._indexes, _selected_ids={})
+        return NeedsAndPartsListView(
+            _indexes=self._indexes,
+            _selected_ids={
+                i: None
+                for i in (
+                    self._indexes.positions
+                    if self._selected_ids is None
+                    else self._selected_ids
+                )
+                if i not in other._selected_ids
+            },
+        )
+
+    def indexed_field_type(self, name: str) -> Literal["scalar", "array"] | None:
+        """Get the type of an extra or link field that can be passed to :meth:`filter_field`,
+        or None if the field is not indexed.
+        """
+        return self._indexes.field_type(name)
+
+    def filter_field(self, name: str, values: Iterable[Any]) -> NeedsAndPartsListView:
+        """Create new view with only needs/parts that match one of these values for an extra or link field.
+
+        For a scalar field, the field value must equal one of the values,
+        and for an array field (including link fields), the list must contain one of them.
+        Parts share the extra fields of their need, but never have outgoing links.
+
+        :raises KeyError: if the field is not an extra or link field of the schema
+        """
+        index = self._indexes.field_index(name)
+        return self._copy_filtered(i for value in values for i in index.get(value, []))
+
+    def filter_columns(
+        self, predicate: _ColumnPredicate
+    ) -> tuple[NeedsAndPartsListView, dict[tuple[str, str | None], Exception]]:
+        """Create new view with only needs/parts matching a predicate,
+        evaluated on a columnar snapshot of all needs and parts.
+
+        :return: The new view, and the error raised by the predicate for each failing (need, part) id,
+            in the order of the view.
+        """
+        positions = self._indexes.positions
+        rows = [
+            positions[i]
+            for i in (positions if self._selected_ids is None else self._selected_ids)
+            if i in positions
+        ]
+        columns = self._indexes.columns
+        matched, errors = predicate(columns.column, rows)
+        keys = columns.keys
+        return (
+            NeedsAndPartsListView(
+                _indexes=self._indexes,
+                _selected_ids={keys[row]: None for row in matched},
+            ),
+            {keys[row]: errors[row] for row in rows if row in errors},
+        )
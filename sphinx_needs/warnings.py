@@ -5,13 +5,28 @@ Cares about handling and execution warnings.
 
 from __future__ import annotations
 
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from timeit import default_timer as timer
+from types import CodeType
+from typing import Any
+
 from sphinx.application import Sphinx
 from sphinx.util import logging
 
+from sphinx_needs import debug
 from sphinx_needs.config import NeedsSphinxConfig
 from sphinx_needs.data import SphinxNeedsData
-from sphinx_needs.filter_common import filter_needs_view
+from sphinx_needs.debug import record_measurement
+from sphinx_needs.exceptions import NeedsInvalidFilter
+from sphinx_needs.filter_common import (
+    filter_eval_context,
+    filter_needs_view,
+    plan_filter_needs_view,
+)
 from sphinx_needs.logging import get_logger, log_warning
+from sphinx_needs.need_item import NeedItem
+from sphinx_needs.views import NeedsView
 
 logger = get_logger(__name__)
 
@@ -61,8 +76,18 @@ def process_warnings(app: Sphinx, exception: Exception | None) -> None:
     with logging.pending_logging():
         logger.info("\nChecking sphinx-needs warnings")
         warning_raised = False
+        # the filter strings that need python evaluation per need are evaluated together upfront,
+        # the others are answered by the need indexes, when reported
+        evaluated = _evaluate_warnings(needs_view, needs_config)
         for warning_name, warning_filter in needs_config.warnings.items():
-            if isinstance(warning_filter, str):
+            start = timer()
+            if warning_name in evaluated:
+                evaluation = evaluated[warning_name]
+                if evaluation.error is not None:
+                    log_warning(logger, evaluation.error, "filter", None)
+                result = evaluation.result
+                runtime = evaluation.runtime
+            elif isinstance(warning_filter, str):
                 # filter string used
                 result = filter_needs_view(
                     needs_view,
@@ -70,14 +95,30 @@ def process_warnings(app: Sphinx, exception: Exception | None) -> None:
                     warning_filter,
                     append_warning=f"(from warning filter {warning_name!r})",
                 )
+                runtime = timer() - start
             elif callable(warning_filter):
                 # custom defined filter code used from conf.py
-                result = []
-                for need in needs_view.values():
-                    if warning_filter(need, logger):
-                        result.append(need)
+                result = [
+                    need for need in needs_view.values() if warning_filter(need, logger)
+                ]
+                runtime = timer() - start
             else:
-                log_warning(logger, f"Unknown needs warnings filter {warning_filter}!")
+                log_warning(
+                    logger,
+                    f"Unknown needs warnings filter {warning_filter}!",
+                    "warnings",
+                    None,
+                )
+                continue
+            record_measurement(
+                "warnings",
+                warning_name,
+                runtime,
+                source="user",
+                doc=warning_filter
+                if isinstance(warning_filter, str)
+                else warning_filter.__name__,
+            )
 
             if len(result) == 0:
                 logger.info(f"{warning_name}: passed")
@@ -120,3 +161,114 @@ def process_warnings(app: Sphinx, exception: Exception | None) -> None:
                 "warnings",
                 None,
             )
+
+
+@dataclass(slots=True)
+class _WarningEvaluation:
+    """The evaluation of a ``needs_warnings`` entry, for each need of the view."""
+
+    check: Callable[[NeedItem, dict[str, Any]], bool]
+    """Check a need, given its filter context."""
+    matched: NeedsView | None = None
+    """The needs known to match, without evaluating the check."""
+    found: set[str] = field(default_factory=set)
+    """The ids of the needs for which the check passed."""
+    error: str | None = None
+    """The first error raised by the check."""
+    runtime: float = 0.0
+    result: list[NeedItem] = field(default_factory=list)
+
+
+def _evaluate_warnings(
+    needs: NeedsView, config: NeedsSphinxConfig
+) -> dict[str, _WarningEvaluation]:
+    """Evaluate the filter strings of warnings that cannot be answered by the need indexes.
+
+    All such warnings are evaluated in a single pass over the needs,
+    so that the filter context of each need is created only once.
+    Custom filter functions are not evaluated here,
+    but when their warning is reported, so that what they log stays in the order of the warnings.
+    """
+    evaluations: dict[str, _WarningEvaluation] = {}
+    # the warnings to evaluate for each need id
+    pending: dict[str, list[_WarningEvaluation]] = {}
+    for warning_name, warning_filter in config.warnings.items():
+        start = timer()
+        if isinstance(warning_filter, str) and (
+            plan := plan_filter_needs_view(needs, warning_filter)
+        ):
+            evaluation = _WarningEvaluation(
+                _eval_check(
+                    compile(warning_filter, "<string>", "eval"),
+                    warning_filter,
+                    plan[1],
+                    config,
+                ),
+                matched=plan[0],
+            )
+            remaining = plan[1]
+        else:
+            continue
+        evaluations[warning_name] = evaluation
+        for need_id in remaining:
+            pending.setdefault(need_id, []).append(evaluation)
+        evaluation.runtime += timer() - start
+
+    measure = debug.EXECUTE_TIME_MEASUREMENTS
+    for need_id, need in needs.items():
+        if not (need_evaluations := pending.get(need_id)):
+            continue
+        context = filter_eval_context(need, config)
+        for evaluation in need_evaluations:
+            start = timer() if measure else 0.0
+            try:
+                if evaluation.check(need, context):
+                    evaluation.found.add(need_id)
+            except NeedsInvalidFilter as e:
+                evaluation.error = evaluation.error or str(e)
+            if measure:
+                evaluation.runtime += timer() - start
+
+    for warning_name, evaluation in evaluations.items():
+        if evaluation.error is not None:
+            evaluation.error += f" (from warning filter {warning_name!r})"
+        keys = evaluation.found
+        if evaluation.matched is not None:
+            keys = keys | evaluation.matched.keys()
+        evaluation.result = [need for id, need in needs.items() if id in keys]
+    return evaluations
+
+
+def _eval_check(
+    filter_compiled: CodeType,
+    filter_string: str,
+    remaining: NeedsView,
+    config: NeedsSphinxConfig,
+) -> Callable[[NeedItem, dict[str, Any]], bool]:
+    """Create the check of a filter string, as in :func:`.filter_single_need`.
+
+    The filter context of the need is created once for the checks of all warnings,
+    and each check evaluates on a copy of it, with ``needs`` set to the needs
+    the filter is evaluated on,
+    so that names bound by one filter are not seen by the filters after it.
+    """
+    remaining_needs = remaining.values()
+    set_needs = "needs" not in config.filter_data
+
+    def _check(need: NeedItem, context: dict[str, Any]) -> bool:
+        context = context.copy()
+        if set_needs:
+            context["needs"] = remaining_needs
+        try:
+            result = eval(filter_compiled, context)
+            if not isinstance(result, bool):
+                raise NeedsInvalidFilter(
+                    f"Filter did not evaluate to a boolean, instead {type(result)}: {result}"
+                )
+        except Exception as e:
+            raise NeedsInvalidFilter(
+                f"Filter {filter_string!r} not valid. Error: {e}."
+            ) from e
+        return result
+
+    return _check
@@ -112,6 +112,7 @@ def _make_needs_with_constrained_links(
 
     config = Mock(spec=NeedsSphinxConfig)
     config.filter_data = {}
+    config.variant_data_proxy = None
     config.report_dead_links = False
 
     schema = FieldsSchema()
@@ -371,6 +371,46 @@ def test_app(make_app, sphinx_test_tempdir, plantuml_command, request):
         shutil.rmtree(parent_path, ignore_errors=True)
 
 
+@pytest.fixture(scope="function")
+def rebuild_app(test_app, make_app, plantuml_command, request):
+    """
+    Fixture for building the project of :func:`test_app` again, in a new Sphinx application.
+
+    Unlike calling ``test_app.build()`` again, the new application loads the environment
+    of the previous build from the doctree directory, as a new ``sphinx-build`` run does.
+    The returned function accepts ``freshenv``, and ``confoverrides`` which are added to those of ``test_app``,
+    and returns the built application, with its warnings as ``warning_list``,
+    except those of registering the components of the extensions again.
+    """
+    builder_params = request.node.callspec.params["test_app"]
+    sphinx_conf_overrides = dict(builder_params.get("confoverrides", {}))
+    if not builder_params.get("no_plantuml", False):
+        sphinx_conf_overrides.update(plantuml=plantuml_command)
+
+    def _rebuild(
+        *, freshenv: bool = False, confoverrides: dict[str, Any] | None = None
+    ) -> SphinxTestApp:
+        app: SphinxTestApp = make_app(
+            buildername=builder_params.get("buildername", "html"),
+            srcdir=test_app.srcdir,
+            freshenv=freshenv,
+            confoverrides={**sphinx_conf_overrides, **(confoverrides or {})},
+            parallel=builder_params.get("parallel", 0),
+        )
+        app.build()
+        app.warning_list = [
+            warning
+            for warning in strip_colors(
+                app._warning.getvalue().replace(str(app.srcdir) + os.sep, "srcdir/")
+            ).splitlines()
+            # the extensions are set up again in the same process
+            if "is already registered" not in warning
+        ]
+        return app
+
+    return _rebuild
+
+
 class DoctreeSnapshotExtension(SingleFileSnapshotExtension):
     _write_mode = WriteMode.TEXT
     _file_extension = "doctree.xml"
@@ -0,0 +1,13 @@
+extensions = ["sphinx_needs", "sphinxcontrib.plantuml"]
+
+plantuml_output_format = "none"
+
+needs_flow_engine = "graphviz"
+needs_diagram_cache = True
+
+
+def constant_title(app, need, needs):
+    return "Requirement one"
+
+
+needs_functions = [constant_title]
@@ -0,0 +1,3 @@
+extensions = ["sphinx_needs"]
+
+needs_fields = {"priority": {"nullable": True}}
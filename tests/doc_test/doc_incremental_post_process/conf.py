@@ -0,0 +1,18 @@
+extensions = ["sphinx_needs"]
+
+needs_build_json = True
+
+needs_constraints = {
+    "closed": {"check_0": "status == 'closed'", "severity": "CRITICAL"},
+}
+
+needs_constraint_failed_options = {
+    "CRITICAL": {"on_fail": ["warn"], "style": ["red_bar"], "force_style": False},
+}
+
+
+def constant_title(app, need, needs):
+    return "one"
+
+
+needs_functions = [constant_title]
@@ -0,0 +1,3 @@
+extensions = ["sphinx_needs"]
+
+needs_table_style = "TABLE"
@@ -0,0 +1,19 @@
+extensions = ["sphinx_needs"]
+
+needs_fields = {"asil": {"schema": {"type": "string", "enum": ["A", "B"]}}}
+
+needs_schema_definitions = {
+    "schemas": [
+        {
+            "select": {"properties": {"type": {"const": "impl"}}},
+            "validate": {
+                "network": {
+                    "links": {
+                        "contains": {"local": {"properties": {"asil": {"const": "A"}}}},
+                        "minContains": 1,
+                    }
+                }
+            },
+        }
+    ]
+}
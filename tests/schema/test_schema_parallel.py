@@ -0,0 +1,62 @@
+"""Tests for validating the needs against the schemas in worker processes."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+from unittest.mock import Mock
+
+import pytest
+from sphinx.testing.util import SphinxTestApp
+from sphinx.util.parallel import parallel_available
+
+from sphinx_needs.schema import process
+
+
+def _violations(app: SphinxTestApp) -> dict[str, Any]:
+    violations = json.loads(
+        Path(app.outdir, "schema_violations.json").read_text("utf8")
+    )
+    for key in ("validated_needs_per_second", "validation_summary"):
+        violations.pop(key, None)
+    return violations
+
+
+@pytest.mark.skipif(not parallel_available, reason="needs fork support")
+@pytest.mark.parametrize(
+    "test_app",
+    [
+        {
+            "buildername": "html",
+            "srcdir": "doc_test/doc_schema_parallel",
+            "no_plantuml": True,
+            "confoverrides": {"needs_schema_validation_workers": 1},
+        }
+    ],
+    indirect=True,
+)
+def test_parallel_validation_matches_serial(
+    test_app: SphinxTestApp,
+    rebuild_app: Callable[..., SphinxTestApp],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Validating in worker processes reports the same warnings, in the same order."""
+    validate_parallel = Mock(wraps=process._validate_parallel)
+    monkeypatch.setattr(process, "_validate_parallel", validate_parallel)
+
+    serial_app = rebuild_app(freshenv=True)
+    serial_warnings = serial_app.warning_list
+    assert any("[sn_schema_violation.field_fail]" in w for w in serial_warnings)
+    assert any(
+        "[sn_schema_violation.network_contains_too_few]" in w for w in serial_warnings
+    )
+    validate_parallel.assert_not_called()
+
+    parallel_app = rebuild_app(
+        freshenv=True, confoverrides={"needs_schema_validation_workers": 3}
+    )
+    assert [call.args[1] for call in validate_parallel.call_args_list] == [3]
+    assert parallel_app.warning_list == serial_warnings
+    assert _violations(parallel_app) == _violations(serial_app)
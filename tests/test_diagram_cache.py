@@ -0,0 +1,100 @@
+"""Tests for re-using the generated source of diagrams, across builds."""
+
+from __future__ import annotations
+
+import pickle
+import re
+from collections.abc import Callable
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+from sphinx.testing.util import SphinxTestApp
+from sphinx.util.console import strip_colors
+
+from sphinx_needs.diagram_cache import CACHE_FILENAME
+from sphinx_needs.directives import needuml
+from sphinx_needs.directives.needflow import _graphviz
+
+
+def _edit(app: SphinxTestApp, filename: str, old: str, new: str) -> None:
+    path = Path(app.srcdir, filename)
+    path.write_text(path.read_text("utf8").replace(old, new, 1), "utf8")
+
+
+def _built(app: SphinxTestApp) -> tuple[str, list[str], int]:
+    """Get the index page, which shows the diagram sources,
+    the warnings of sphinx-needs and the number of cached diagrams.
+    """
+    # the ids of need containers are random
+    html = re.sub(
+        r'id="SNCB-\w+"', "", Path(app.outdir, "index.html").read_text("utf8")
+    )
+    warnings = sorted(
+        warning
+        for warning in strip_colors(app._warning.getvalue()).splitlines()
+        if "[needs." in warning
+    )
+    with Path(app.doctreedir, CACHE_FILENAME).open("rb") as f:
+        cached = len(pickle.load(f).diagrams)
+    return html, warnings, cached
+
+
+@pytest.mark.parametrize(
+    "test_app",
+    [
+        {"buildername": "html", "srcdir": "doc_test/doc_diagram_cache"},
+        # diagrams are generated in the main process, also when writing in parallel
+        {"buildername": "html", "srcdir": "doc_test/doc_diagram_cache", "parallel": 2},
+    ],
+    indirect=True,
+)
+def test_diagram_cache(
+    test_app: SphinxTestApp,
+    rebuild_app: Callable[..., SphinxTestApp],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Diagrams are only generated again, if the needs or the directive changed."""
+    build_graph = Mock(wraps=_graphviz.build_graph)
+    jinja2uml = Mock(wraps=needuml.jinja2uml)
+    monkeypatch.setattr(_graphviz, "build_graph", build_graph)
+    monkeypatch.setattr(needuml, "jinja2uml", jinja2uml)
+
+    test_app.build()
+    html, warnings, cached = _built(test_app)
+    assert (build_graph.call_count, jinja2uml.call_count) == (1, 1)
+    assert "digraph needflow" in html
+    assert any("needs.max_items" in warning for warning in warnings)
+    assert cached == 2
+
+    # changing a document without needs re-uses the diagrams,
+    # and emits their warnings again
+    build_graph.reset_mock()
+    jinja2uml.reset_mock()
+    _edit(test_app, "page_1.rst", "First version.", "Second version.")
+    assert _built(rebuild_app()) == (html, warnings, cached)
+    assert (build_graph.call_count, jinja2uml.call_count) == (0, 0)
+
+    # changing a directive generates it again, and drops its previous diagram
+    _edit(test_app, "index.rst", ":max_items: 1", ":max_items: 2")
+    changed_html, _, cached = _built(rebuild_app())
+    assert (build_graph.call_count, jinja2uml.call_count) == (1, 0)
+    assert changed_html != html
+    assert cached == 2
+
+    # changing a need generates all diagrams again
+    build_graph.reset_mock()
+    _edit(test_app, "index.rst", ":status: open", ":status: closed")
+    rebuild_app()
+    assert (build_graph.call_count, jinja2uml.call_count) == (1, 1)
+
+    # changing only a constant of a dynamic function generates all diagrams again,
+    # text is added at the end of the index, for Sphinx to write it again
+    build_graph.reset_mock()
+    jinja2uml.reset_mock()
+    _edit(test_app, "conf.py", '"Requirement one"', '"Requirement two"')
+    index = Path(test_app.srcdir, "index.rst")
+    index.write_text(index.read_text("utf8") + "\nChanged.\n", "utf8")
+    html, _, _ = _built(rebuild_app())
+    assert (build_graph.call_count, jinja2uml.call_count) == (1, 1)
+    assert "Requirement two" in html
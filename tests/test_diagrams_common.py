@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+from sphinx_needs.diagrams_common import DiagramWriter
+
+
+def test_diagram_writer_indents_nested_lines():
+    """Lines are indented by every enclosing level, except empty lines,
+    the same as indenting the source of the nested block as a whole."""
+    writer = DiagramWriter()
+    writer.line("subgraph a {")
+    with writer.indented():
+        writer.line("label=a;")
+        writer.line()
+        writer.line("subgraph b {")
+        with writer.indented():
+            writer.line("label=b;")
+        writer.line("};")
+    writer.write("}")
+    assert writer.getvalue() == (
+        "subgraph a {\n  label=a;\n\n  subgraph b {\n    label=b;\n  };\n}"
+    )
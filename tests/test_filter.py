@@ -1,4 +1,5 @@
 import os
+import re
 from pathlib import Path
 from unittest.mock import Mock
 
@@ -6,13 +7,24 @@ import pytest
 from sphinx.util.console import strip_colors
 from sphinxcontrib.plantuml import plantuml
 
-from sphinx_needs.filter_common import filter_needs_parts, filter_needs_view
+from sphinx_needs.filter_common import (
+    _filter_cache_key,
+    filter_needs_and_parts,
+    filter_needs_parts,
+    filter_needs_view,
+)
 from sphinx_needs.need_item import (
     NeedItem,
     NeedItemSourceExternal,
     NeedPartData,
     NeedsContent,
 )
+from sphinx_needs.needs_schema import (
+    FieldSchema,
+    FieldsSchema,
+    LinkDisplayConfig,
+    LinkSchema,
+)
 from sphinx_needs.views import NeedsView
 
 
@@ -475,6 +487,49 @@ def test_filter_needs_parts(filter_string, expected_ids, strict_eval):
     assert {n["id"] for n in result} == set(expected_ids)
 
 
+plan_test_params = (
+    ("type == 'story' or status == ''", True),
+    ("'d' in tags or 'a' in tags or id == 'story_b_1'", True),
+    ("status != 'done'", True),
+    ("'a' not in tags", True),
+    ("type not in ['story']", True),
+    ("not is_external", True),
+    ("not (type == 'story' or 'd' in tags)", True),
+    ("type == 'story' and not 'a' in tags", True),
+    ("(type == 'story' or 'd' in tags) and status != 'ongoing'", True),
+    ("type == 'requirement' or title == 'title'", False),
+    ("'c' in tags or id.endswith('a_1')", False),
+    ("not (type == 'story' and id.startswith('story_a'))", False),
+    ("'b' in tags and not (status == 'ongoing' or id.endswith('_c_1'))", False),
+)
+
+
+@pytest.mark.parametrize(
+    "filter_string, strict_eval",
+    plan_test_params,
+    ids=[s for s, _ in plan_test_params],
+)
+def test_filter_plan_matches_eval(filter_string, strict_eval):
+    """Index lookups combined by set algebra must select the same needs, in the same order, as python eval."""
+    mock_config = Mock()
+    mock_config.filter_data = {}
+    mock_config.variant_data_proxy = None
+    view = create_needs_view()
+    expected = filter_needs_and_parts(
+        list(view.to_list_with_parts()), mock_config, filter_string
+    )
+    result = filter_needs_parts(
+        view.to_list_with_parts(), mock_config, filter_string, strict_eval=strict_eval
+    )
+    assert [n["id_complete"] for n in result] == [n["id_complete"] for n in expected]
+
+    expected = filter_needs_and_parts(list(view.values()), mock_config, filter_string)
+    result = filter_needs_view(
+        view, mock_config, filter_string, strict_eval=strict_eval
+    )
+    assert [n["id"] for n in result] == [n["id"] for n in expected]
+
+
 def test_filter_needs_then_parts():
     npl = (
         create_needs_view()
@@ -483,3 +538,273 @@ def test_filter_needs_then_parts():
         .filter_has_tag(["a"])
     )
     assert {n["id"] for n in npl} == {"story_a_b_1", "part_a"}
+
+
+def create_needs_view_with_fields():
+    """Create a view of needs with extra and link fields declared in a schema."""
+    schema = FieldsSchema()
+    schema.add_extra_field(
+        FieldSchema(name="component", schema={"type": "string"}, nullable=True)
+    )
+    schema.add_extra_field(FieldSchema(name="priority", schema={"type": "integer"}))
+    schema.add_extra_field(
+        FieldSchema(
+            name="platforms", schema={"type": "array", "items": {"type": "string"}}
+        )
+    )
+    schema.add_link_field(
+        LinkSchema(
+            name="links",
+            schema={"type": "array", "items": {"type": "string"}},
+            display=LinkDisplayConfig(outgoing="links", incoming="linked by"),
+        )
+    )
+
+    core_base = {
+        "type": "requirement",
+        "type_name": "Req",
+        "type_prefix": "R_",
+        "type_color": "#000000",
+        "type_style": "node",
+        "status": None,
+        "tags": [],
+        "constraints": (),
+        "title": "title",
+        "collapse": False,
+        "arch": {},
+        "style": None,
+        "layout": None,
+        "hide": False,
+        "external_css": "external_link",
+        "has_dead_links": False,
+        "has_forbidden_dead_links": False,
+        "sections": (),
+        "signature": None,
+    }
+    needs = [
+        ("brakes_1", "brakes", 1, ["arm", "x86"], ["engine_1"], ("part_b",)),
+        ("brakes_2", "brakes", 2, ["arm"], ["brakes_1.part_b"], ()),
+        ("engine_1", "engine", 1, [], [], ()),
+        ("unset_1", None, 3, ["x86"], ["brakes_1", "engine_1"], ()),
+    ]
+    need_items = [
+        NeedItem(
+            core=core_base | {"id": id},
+            extras={
+                "component": component,
+                "priority": priority,
+                "platforms": platforms,
+            },
+            links={"links": links},
+            source=None,
+            content=NeedsContent(content="content", doctype=".rst"),
+            parts=[NeedPartData(id=p, content=p) for p in parts],
+        )
+        for id, component, priority, platforms, links, parts in needs
+    ]
+    return NeedsView._from_needs({n["id"]: n for n in need_items}, schema=schema)
+
+
+field_test_params = (
+    ("component == 'brakes'", ["brakes_1", "brakes_2", "part_b"]),
+    ("'engine' == component", ["engine_1"]),
+    ("component == None", ["unset_1"]),
+    ("component == 'unknown'", []),
+    (
+        "component in ['engine', 'brakes']",
+        ["brakes_1", "brakes_2", "engine_1", "part_b"],
+    ),
+    ("priority == 1", ["brakes_1", "engine_1", "part_b"]),
+    ("priority in (2, 3)", ["brakes_2", "unset_1"]),
+    ("'x86' in platforms", ["brakes_1", "unset_1", "part_b"]),
+    ("'engine_1' in links", ["brakes_1", "unset_1"]),
+    ("'brakes_1.part_b' in links", ["brakes_2"]),
+    (
+        "type == 'requirement' and 'arm' in platforms",
+        ["brakes_1", "brakes_2", "part_b"],
+    ),
+    ("component == 'brakes' and priority == 2", ["brakes_2"]),
+)
+
+
+@pytest.mark.parametrize(
+    "filter_string, expected_ids",
+    field_test_params,
+    ids=[s for s, _ in field_test_params],
+)
+def test_filter_needs_parts_by_field_index(filter_string, expected_ids):
+    mock_config = Mock()
+    mock_config.filter_data = {}
+    result = filter_needs_parts(
+        create_needs_view_with_fields().to_list_with_parts(),
+        mock_config,
+        filter_string,
+        strict_eval=True,
+    )
+    assert sorted(n["id"] for n in result) == sorted(expected_ids)
+
+
+@pytest.mark.parametrize(
+    "filter_string, expected_ids",
+    field_test_params,
+    ids=[s for s, _ in field_test_params],
+)
+def test_filter_needs_view_by_field_index(filter_string, expected_ids):
+    mock_config = Mock()
+    mock_config.filter_data = {}
+    result = filter_needs_view(
+        create_needs_view_with_fields(),
+        mock_config,
+        filter_string,
+        strict_eval=True,
+    )
+    assert sorted(n["id"] for n in result) == sorted(
+        i for i in expected_ids if not i.startswith("part_")
+    )
+
+
+@pytest.mark.parametrize(
+    "filter_string",
+    ["'bra' in component", "platforms == 'arm'", "platforms in ['arm']"],
+)
+def test_filter_by_field_index_falls_back_to_eval(filter_string):
+    """Patterns that the index cannot answer exactly must not use it."""
+    mock_config = Mock()
+    mock_config.filter_data = {}
+    with pytest.raises(RuntimeError, match="Strict eval mode"):
+        filter_needs_view(
+            create_needs_view_with_fields(),
+            mock_config,
+            filter_string,
+            strict_eval=True,
+        )
+
+
+def test_filter_field_without_schema():
+    view = create_needs_view()
+    assert view.indexed_field_type("component") is None
+    with pytest.raises(KeyError):
+        view.filter_field("component", ["brakes"])
+
+
+def _filter_data(filter_string, docname="index", **kwargs):
+    return {
+        "docname": docname,
+        "status": [],
+        "tags": [],
+        "types": [],
+        "filter": filter_string,
+        **kwargs,
+    }
+
+
+def test_filter_cache_key():
+    key = _filter_cache_key(_filter_data("status == 'open'"), True)
+    # equivalent filters share a key, independent of the document
+    assert key == _filter_cache_key(
+        _filter_data(" (status=='open') ", docname="other"), True
+    )
+    assert key != _filter_cache_key(_filter_data("status == 'closed'"), True)
+    assert key != _filter_cache_key(_filter_data("status == 'open'"), False)
+    # the needs are found in the order of the options, so that is part of the key
+    assert _filter_cache_key(
+        _filter_data(None, types=["req", "spec"]), True
+    ) != _filter_cache_key(_filter_data(None, types=["spec", "req"]), True)
+    # filters using the context need are specific to the document
+    assert _filter_cache_key(_filter_data("c.this_doc()"), True) != _filter_cache_key(
+        _filter_data("c.this_doc()", docname="other"), True
+    )
+
+
+def test_filter_needs_parts_collects_errors():
+    mock_config = Mock()
+    mock_config.filter_data = {}
+    mock_config.variant_data_proxy = None
+    errors = []
+    filter_needs_parts(
+        create_needs_view().to_list_with_parts(),
+        mock_config,
+        "unknown_name == 1",
+        errors=errors,
+    )
+    assert len(errors) == 1
+    errors = []
+    filter_needs_parts(
+        create_needs_view().to_list_with_parts(),
+        mock_config,
+        "type == 'requirement'",
+        errors=errors,
+    )
+    assert errors == []
+
+
+@pytest.mark.parametrize(
+    "filter_string",
+    [
+        "priority > 1",
+        "search('^bra', component)",
+        "'bra' in component",
+        "not component",
+        "priority >= 2 and id_parent == 'brakes_1'",
+    ],
+)
+def test_filter_by_columns_matches_eval(filter_string):
+    """Filters evaluated on the columnar snapshot must select the same needs, in the same order, as per need."""
+    mock_config = Mock()
+    mock_config.filter_data = {}
+    mock_config.variant_data_proxy = None
+    view = create_needs_view_with_fields()
+    expected = filter_needs_and_parts(
+        list(view.to_list_with_parts()), mock_config, filter_string
+    )
+    result = filter_needs_parts(view.to_list_with_parts(), mock_config, filter_string)
+    assert [n["id_complete"] for n in result] == [n["id_complete"] for n in expected]
+
+    expected = filter_needs_and_parts(list(view.values()), mock_config, filter_string)
+    result = filter_needs_view(view, mock_config, filter_string)
+    assert [n["id"] for n in result] == [n["id"] for n in expected]
+
+
+def test_filter_by_columns_reports_first_error():
+    mock_config = Mock()
+    mock_config.filter_data = {}
+    mock_config.variant_data_proxy = None
+    errors = []
+    result = filter_needs_parts(
+        create_needs_view_with_fields().to_list_with_parts(),
+        mock_config,
+        "search('^bra', component) or priority > 2",
+        errors=errors,
+    )
+    # the need without a component value fails, but the others are still filtered
+    assert [n["id"] for n in result] == ["brakes_1", "part_b", "brakes_2"]
+    assert len(errors) == 1
+    assert "expected string" in errors[0]
+
+
+@pytest.mark.parametrize(
+    "test_app",
+    [
+        {
+            "buildername": "html",
+            "srcdir": "doc_test/doc_filter_option_order",
+            "no_plantuml": True,
+        }
+    ],
+    indirect=True,
+)
+def test_filter_option_order(test_app):
+    """Directives listing the same options in another order do not share the cached order."""
+    app = test_app
+    app.build()
+    html = Path(app.outdir, "index.html").read_text()
+    lists = [
+        re.findall(r"(?:REQ|SPEC)_\d+: ", needlist)
+        for needlist in html.split('<div class="line-block" id="needlist-')[1:]
+    ]
+    assert lists == [
+        ["REQ_001: ", "REQ_003: ", "SPEC_001: ", "REQ_002: "],
+        ["REQ_002: ", "REQ_001: ", "REQ_003: ", "SPEC_001: "],
+        ["REQ_001: ", "REQ_002: ", "REQ_003: ", "SPEC_001: "],
+        ["SPEC_001: ", "REQ_001: ", "REQ_002: ", "REQ_003: "],
+    ]
@@ -0,0 +1,72 @@
+"""Tests for evaluating the filters of view directives in worker processes."""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Callable
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+from sphinx.testing.util import SphinxTestApp
+from sphinx.util.parallel import parallel_available
+
+from sphinx_needs import filter_common
+
+
+def _pages(app: SphinxTestApp) -> dict[str, str]:
+    pages = {}
+    for name in ("views_a", "views_b"):
+        html = Path(app.outdir, f"{name}.html").read_text("utf8")
+        # the ids of the need containers are random
+        pages[name] = re.sub(r"SNCB-\w+", "SNCB", html)
+    return pages
+
+
+@pytest.mark.skipif(not parallel_available, reason="needs fork support")
+@pytest.mark.parametrize(
+    "test_app",
+    [
+        {
+            "buildername": "html",
+            "srcdir": "doc_test/doc_filter_workers",
+            "no_plantuml": True,
+            "confoverrides": {"needs_filter_workers": 1},
+        }
+    ],
+    indirect=True,
+)
+def test_prepared_filters_match_serial(
+    test_app: SphinxTestApp,
+    rebuild_app: Callable[..., SphinxTestApp],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Filters evaluated up front give the same pages and warnings,
+    and only the filter reporting an error is evaluated again by its directives."""
+    cache_miss = Mock(wraps=filter_common._filter_cache_miss)
+    prepared = Mock(wraps=filter_common._PreparedFilters)
+    monkeypatch.setattr(filter_common, "_filter_cache_miss", cache_miss)
+    monkeypatch.setattr(filter_common, "_PreparedFilters", prepared)
+
+    serial_app = rebuild_app(freshenv=True)
+    serial_warnings = serial_app.warning_list
+    assert sum("[needs.filter]" in w for w in serial_warnings) == 2, serial_warnings
+    prepared.assert_not_called()
+
+    cache_miss.reset_mock()
+    parallel_app = rebuild_app(freshenv=True, confoverrides={"needs_filter_workers": 3})
+    assert parallel_app.warning_list == serial_warnings
+    assert _pages(parallel_app) == _pages(serial_app)
+    assert [call.args[4] for call in cache_miss.call_args_list] == [
+        "unknown_name == 1",
+        "unknown_name == 1",
+    ]
+
+    # in an incremental build, only the filters of the documents read again are evaluated up front
+    prepared.reset_mock()
+    views_b = Path(test_app.srcdir, "views_b.rst")
+    views_b.write_text(views_b.read_text("utf8") + "\nChanged.\n", "utf8")
+    rebuild_app(confoverrides={"needs_filter_workers": 3})
+    (specs,) = [call.args[2] for call in prepared.call_args_list]
+    assert len(specs) == 4
+    assert {spec["docname"] for spec in specs} == {"views_b"}
@@ -0,0 +1,173 @@
+"""Tests for incremental post-processing of needs, across builds."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pytest
+from sphinx.testing.util import SphinxTestApp
+
+from sphinx_needs.incremental import (
+    CACHE_FILENAME,
+    _DependencyRecorder,
+    _dirty_needs,
+    _LinkGraph,
+    _NeedState,
+)
+from sphinx_needs.logging import get_logger, log_warning, record_warnings
+
+EDITS = {
+    "unchanged": [],
+    "changed_status": [("index.rst", ":status: closed", ":status: open")],
+    "changed_links": [
+        ("page.rst", ":links: REQ_1, REQ_2\n", ":links: REQ_1, REQ_2.p1\n"),
+        ("page.rst", ":links: REQ_2\n", ":links: REQ_1, REQ_3\n"),
+        (
+            "page.rst",
+            ".. needextend::",
+            ".. spec:: Added\n   :id: SPEC_3\n   :links: REQ_2.p2\n\n.. needextend::",
+        ),
+    ],
+    "changed_chained_reader": [("page.rst", "Chained A", "Chained A changed")],
+    "changed_function_constant": [("conf.py", 'return "one"', 'return "two"')],
+}
+
+
+def _built_needs(app: SphinxTestApp) -> dict[str, Any]:
+    return json.loads(Path(app.outdir, "needs.json").read_text("utf8"))["versions"][""][
+        "needs"
+    ]
+
+
+def _without_config_cache(warnings: list[str]) -> list[str]:
+    return [warning for warning in warnings if "[config.cache]" not in warning]
+
+
+@pytest.mark.parametrize("edit", list(EDITS))
+@pytest.mark.parametrize(
+    "test_app",
+    [
+        {
+            "buildername": "html",
+            "srcdir": "doc_test/doc_incremental_post_process",
+            "no_plantuml": True,
+            "confoverrides": {"needs_incremental_post_process": True},
+        }
+    ],
+    indirect=True,
+)
+def test_incremental_build_matches_full_build(
+    test_app: SphinxTestApp, rebuild_app: Callable[..., SphinxTestApp], edit: str
+) -> None:
+    """Changing a need re-processes it, the needs that read it, and the needs it links to."""
+    test_app.build()
+    assert Path(test_app.doctreedir, CACHE_FILENAME).exists()
+
+    for filename, old, new in EDITS[edit]:
+        path = Path(test_app.srcdir, filename)
+        path.write_text(path.read_text("utf8").replace(old, new, 1), "utf8")
+
+    incremental_app = rebuild_app()
+    incremental_needs = _built_needs(incremental_app)
+    full_app = rebuild_app(
+        freshenv=True, confoverrides={"needs_incremental_post_process": False}
+    )
+    full_needs = _built_needs(full_app)
+
+    assert incremental_needs == full_needs
+    # the warning about not caching needs_functions is only logged when the environment is pickled
+    assert sorted(_without_config_cache(incremental_app.warning_list)) == sorted(
+        _without_config_cache(full_app.warning_list)
+    )
+    assert incremental_needs["SPEC_1"]["status"] == incremental_needs["REQ_1"]["status"]
+    assert incremental_needs["SPEC_2"]["tags"] == ["extended"]
+    # the need read by AAA_1 comes after it, so is read before its status is resolved
+    assert incremental_needs["AAA_1"]["status"] == "None"
+    assert incremental_needs["BBB_1"]["status"] == "Chained C"
+    assert incremental_needs["FUNC_1"]["title"] == (
+        "two" if edit == "changed_function_constant" else "one"
+    )
+    if edit == "changed_links":
+        assert incremental_needs["REQ_1"]["links_back"] == ["SPEC_1", "SPEC_2"]
+        assert incremental_needs["REQ_2"]["parts"]["p1"]["links_back"] == ["SPEC_1"]
+        assert incremental_needs["SPEC_2"]["has_forbidden_dead_links"]
+        assert incremental_needs["SPEC_3"]["has_dead_links"]
+    else:
+        assert incremental_needs["REQ_2"]["links_back"] == ["SPEC_1", "SPEC_2"]
+
+
+def test_dirty_needs() -> None:
+    def state(digest: bytes, depends_on: frozenset[str] | None) -> _NeedState:
+        return _NeedState(
+            source_digest=digest,
+            resolved=b"",
+            depends_on=depends_on,
+            function_warnings=(),
+        )
+
+    states = {
+        "A": state(b"a", frozenset()),
+        "B": state(b"b", frozenset({"A"})),
+        "C": state(b"c", frozenset({"B"})),
+        "D": state(b"d", frozenset({"E"})),
+    }
+    digests = {"A": b"a", "B": b"b", "C": b"c", "D": b"d"}
+    assert _dirty_needs(states, digests) == set()
+    assert _dirty_needs(states, {**digests, "A": b"x"}) == {"A", "B", "C"}
+    # a need appearing, that was previously looked up but missing
+    assert _dirty_needs(states, {**digests, "E": b"e"}) == {"D", "E"}
+    # a need being removed
+    assert _dirty_needs(states, {"A": b"a", "C": b"c", "D": b"d"}) == {"B", "C"}
+
+    states["D"] = state(b"d", None)
+    assert _dirty_needs(states, digests) == set()
+    assert _dirty_needs(states, {**digests, "C": b"x"}) == {"C", "D"}
+
+    # a need read by A moving from after it to before it
+    states = {"A": state(b"a", frozenset({"B"})), "B": state(b"b", frozenset())}
+    assert _dirty_needs(states, {"A": b"a", "B": b"b"}, order_changed=True) == set()
+    assert _dirty_needs(states, {"B": b"b", "A": b"a"}, order_changed=True) == {"A"}
+
+
+def test_link_graph_update() -> None:
+    graph = _LinkGraph()
+    assert graph.update("A", (("links", "B", None), ("links", "C", "p1"))) == {
+        "B",
+        "C",
+    }
+    assert graph.update("D", (("links", "C", None),)) == {"C"}
+    assert sorted(graph.sources("C")) == ["A", "D"]
+    assert graph.update("A", (("links", "B", None), ("links", "C", "p1"))) is None
+    assert graph.update("A", (("links", "X", None),)) == {"B", "C", "X"}
+    assert graph.incoming == {"C": {("links", "D", None)}, "X": {("links", "A", None)}}
+    assert graph.update("A", ()) == {"X"}
+    assert graph.outgoing == {"D": (("links", "C", None),)}
+    assert graph.incoming == {"C": {("links", "D", None)}}
+
+
+def test_dependency_recorder() -> None:
+    needs = {"A": 1, "B": 2}
+    recorder = _DependencyRecorder(needs)  # type: ignore[arg-type]
+    assert recorder["A"] == 1
+    assert "X" not in recorder
+    assert recorder.get("Y") is None
+    assert recorder.read == {"A", "X", "Y"}
+    assert not recorder.read_all
+    assert list(recorder.values()) == [1, 2]
+    assert recorder.read_all
+
+
+def test_record_warnings() -> None:
+    logger = get_logger("sphinx_needs.test")
+    with record_warnings() as warnings:
+        log_warning(logger, "first", "link_ref", location=("index", 1))
+    log_warning(logger, "second", "link_ref", location=None)
+    assert [w.message for w in warnings] == ["first"]
+    assert warnings[0].location == ("index", 1)
+
+    with record_warnings() as replayed:
+        warnings[0].replay()
+    assert replayed == warnings
@@ -6,6 +6,7 @@ import pytest
 from minijinja import TemplateError
 
 from sphinx_needs._jinja import (
+    TemplateRegistry,
     compile_template,
     render_template_string,
 )
@@ -71,3 +72,34 @@ def test_compile_template_cache_is_keyed_on_delimiters():
 def test_compile_template_invalid_syntax_raises():
     with pytest.raises(TemplateError):
         compile_template("{{ unclosed ", autoescape=False)
+
+
+def test_template_registry_evicts_least_recently_used():
+    registry = TemplateRegistry(capacity=2)
+    first = registry.get("{{ a }}", autoescape=False)
+    registry.get("{{ b }}", autoescape=False)
+    # using the first template again makes the second the least recently used
+    assert registry.get("{{ a }}", autoescape=False) is first
+    registry.get("{{ c }}", autoescape=False)
+    assert registry.stats() == {
+        "capacity": 2,
+        "size": 2,
+        "hits": 1,
+        "misses": 3,
+        "evictions": 1,
+    }
+    assert registry.get("{{ a }}", autoescape=False) is first
+    assert registry.get("{{ b }}", autoescape=False).render({"b": "B"}) == "B"
+    assert registry.misses == 4
+
+    registry.resize(1)
+    assert len(registry) == 1
+    assert registry.evictions == 3
+
+
+def test_template_registry_does_not_register_invalid_templates():
+    registry = TemplateRegistry()
+    with pytest.raises(TemplateError):
+        registry.get("{{ unclosed ", autoescape=False)
+    assert len(registry) == 0
+    assert registry.misses == 1
@@ -61,3 +61,35 @@ def test_doc_build_html(test_app):
         '<span class="needs_data">subfolder_2/subfolder_smile.png</span>'
         in html_subfolder_2
     )
+
+
+@pytest.mark.parametrize(
+    "test_app",
+    [{"buildername": "html", "srcdir": "doc_test/doc_layout", "no_plantuml": True}],
+    indirect=True,
+)
+def test_layout_lines_parsed_once(test_app, monkeypatch):
+    """Each layout line is parsed for inline rst once per build, not once per need."""
+    from sphinx_needs import layout
+
+    _, inline_parser = layout._generate_inline_parser()
+    parsed: list[str] = []
+    parse = inline_parser.parse
+
+    def counted(text, *args, **kwargs):
+        parsed.append(text)
+        return parse(text, *args, **kwargs)
+
+    monkeypatch.setattr(inline_parser, "parse", counted)
+
+    app = test_app
+    app.build()
+
+    assert len(app.warning_list) == 0
+    assert parsed
+    assert len(parsed) == len(set(parsed))
+    html = (app.outdir / "index.html").read_text()
+    assert (
+        '<span class="needs_label"><strong>author</strong>: </span><span class="needs_data">some author</span>'
+        in html
+    )
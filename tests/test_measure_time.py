@@ -1,9 +1,13 @@
+import json
 import os
+import time
 from pathlib import Path
 
 import pytest
 from sphinx.util.console import strip_colors
 
+from sphinx_needs import debug
+
 
 @pytest.mark.parametrize(
     "test_app",
@@ -22,3 +26,59 @@ def test_measure_time(test_app):
     outdir = Path(str(app.outdir))
     assert outdir.joinpath("debug_measurement.json").exists()
     assert outdir.joinpath("debug_filters.jsonl").exists()
+
+
+@pytest.mark.parametrize(
+    "test_app",
+    [
+        {
+            "buildername": "html",
+            "srcdir": "doc_test/doc_measure_time",
+            "confoverrides": {
+                "needs_debug_measurement_mode": "fast",
+                "needs_debug_sampling_interval": 0.001,
+            },
+        }
+    ],
+    indirect=True,
+)
+def test_measure_time_fast(test_app, monkeypatch):
+    # the measurements, mode and sampler are module state, isolate them from other tests
+    monkeypatch.setattr(debug, "TIME_MEASUREMENTS", {})
+    monkeypatch.setattr(debug, "MEASUREMENT_MODE", debug.MEASUREMENT_MODE)
+    monkeypatch.setattr(debug, "SAMPLER", debug.SAMPLER)
+    app = test_app
+    app.build()
+    assert debug.MEASUREMENT_MODE == "fast"
+    assert isinstance(debug.SAMPLER, debug.StackSampler)
+
+    data = json.loads(Path(str(app.outdir), "debug_measurement.json").read_text("utf8"))
+    assert data["build"]["mode"] == "fast"
+    measurement = data["measurements"]["need_post_process_post_process_needs_data"]
+    assert measurement["amount"] == 1
+    assert measurement["overall"] > 0
+    # arguments are not captured in fast mode
+    assert measurement["max_params"] == {"args": [], "kwargs": {}}
+    assert set(data["samples"]) <= {"post_process", "write"}
+    assert Path(str(app.outdir), "debug_measurement.html").exists()
+
+
+def _busy(seconds: float) -> None:
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+def test_stack_sampler():
+    sampler = debug.StackSampler(0.001)
+    with sampler.phase("outer"):
+        _busy(0.05)
+        with sampler.phase("inner"):
+            _busy(0.05)
+    results = sampler.results()
+    assert set(results) == {"outer", "inner"}
+    for phase in ("outer", "inner"):
+        assert results[phase]["samples"] > 0
+        functions = {f["function"]: f for f in results[phase]["functions"]}
+        assert functions["_busy"]["total"] > 0
+        assert functions["test_stack_sampler"]["self"] == 0
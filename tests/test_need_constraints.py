@@ -121,3 +121,106 @@ def test_need_constraints_config(test_app):
     assert warnings == [
         "<srcdir>/index.rst:4: WARNING: Need could not be created: Constraints {'non_existing'} not in 'needs_constraints'. [needs.create_need]"
     ]
+
+
+def test_process_constraints_in_batch(monkeypatch):
+    """Each check is evaluated once for all needs declaring its constraint."""
+    from unittest.mock import Mock
+
+    from sphinx_needs import need_constraints
+    from sphinx_needs.data import NeedsMutable
+    from tests.test_ubquery import _make_need
+
+    config = Mock()
+    config.filter_data = {}
+    config.variant_data_proxy = None
+    config.constraints = {
+        "open": {
+            "check_0": "status == 'open'",
+            "check_1": "'safety' in tags",
+            "severity": "LOW",
+            "error_message": "{{id}} is {{status}}",
+        },
+        "unused": {"check_0": "False", "severity": "LOW"},
+    }
+    config.constraint_failed_options = {
+        "LOW": {"on_fail": [], "style": ["red"], "force_style": False}
+    }
+    needs = NeedsMutable(
+        {
+            need["id"]: need
+            for need in (
+                _make_need(id="A", constraints=("open",)),
+                _make_need(id="B", constraints=("open",), status="closed"),
+                _make_need(id="C"),
+            )
+        }
+    )
+
+    calls = []
+    filter_single_needs = need_constraints.filter_single_needs
+
+    def _counting(needs, config, filter_string):
+        needs = list(needs)
+        calls.append((filter_string, [need["id"] for need in needs]))
+        return filter_single_needs(needs, config, filter_string)
+
+    monkeypatch.setattr(need_constraints, "filter_single_needs", _counting)
+    need_constraints.process_constraints(needs, config)
+
+    assert calls == [
+        ("status == 'open'", ["A", "B"]),
+        ("'safety' in tags", ["A", "B"]),
+    ]
+    assert dict(needs["A"].constraint_results) == {
+        "open": (("check_0", True, None), ("check_1", True, None))
+    }
+    assert dict(needs["B"].constraint_results) == {
+        "open": (("check_0", False, "B is closed"), ("check_1", True, None))
+    }
+    assert needs["B"]["style"] == "red,"
+    assert dict(needs["C"].constraint_results) == {}
+
+
+def test_process_constraints_style_checks():
+    """Checks referring to the style see the style set by earlier failed checks."""
+    from unittest.mock import Mock
+
+    from sphinx_needs import need_constraints
+    from sphinx_needs.data import NeedsMutable
+    from tests.test_ubquery import _make_need
+
+    config = Mock()
+    config.filter_data = {}
+    config.variant_data_proxy = None
+    config.constraints = {
+        "open": {
+            "check_0": "status == 'open'",
+            "check_1": "'red' not in (style or '')",
+            "severity": "LOW",
+        },
+    }
+    config.constraint_failed_options = {
+        "LOW": {"on_fail": [], "style": ["red"], "force_style": False}
+    }
+    needs = NeedsMutable(
+        {
+            need["id"]: need
+            for need in (
+                _make_need(id="A", constraints=("open",)),
+                _make_need(id="B", constraints=("open",), status="closed"),
+            )
+        }
+    )
+    constraints = need_constraints.compile_constraints(config)
+    assert constraints["open"].style_checks == {"check_1"}
+
+    need_constraints.process_constraints(needs, config)
+
+    assert dict(needs["A"].constraint_results) == {
+        "open": (("check_0", True, None), ("check_1", True, None))
+    }
+    assert dict(needs["B"].constraint_results) == {
+        "open": (("check_0", False, None), ("check_1", False, None))
+    }
+    assert needs["B"]["style"] == "red,, red"
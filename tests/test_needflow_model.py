@@ -182,6 +182,59 @@ def test_walk_stops_at_the_given_depth(depth, expected):
     )
 
 
+def test_walk_reaches_each_need_at_its_shortest_distance():
+    """The walk is breadth first, so a need reachable on a longer path is not pruned by the depth."""
+    a = need("A", links=["C", "B"])
+    b = need("B", links=["C"], incoming=["A"])
+    c = need("C", incoming=["A", "B"])
+    assert list(filter_by_tree(view(a, b, c), "A", ["links"], "outgoing", 1)) == [
+        "A",
+        "B",
+        "C",
+    ]
+
+
+def test_walk_keeps_the_order_of_the_view():
+    """The needs are drawn in the order of the view, not in the order they are reached."""
+    story_1 = need("STORY_1", links=["SPEC_1"])
+    spec = need("SPEC_1", incoming=["STORY_2", "STORY_1"])
+    story_2 = need("STORY_2", links=["SPEC_1"])
+    needs = view(story_1, spec, story_2)
+    assert list(filter_by_tree(needs, "SPEC_1", ["links"], "incoming", None)) == [
+        "STORY_1",
+        "SPEC_1",
+        "STORY_2",
+    ]
+    assert list(
+        filter_by_tree(
+            needs.filter_ids(["SPEC_1", "STORY_2"]),
+            "SPEC_1",
+            ["links"],
+            "incoming",
+            None,
+        )
+    ) == ["SPEC_1", "STORY_2"]
+
+
+def test_walk_is_shared_between_views():
+    """The walk is cached on the needs, and only steps through needs of the view."""
+    chain = [
+        need("A", links=["B"]),
+        need("B", links=["C"], incoming=["A"]),
+        need("C", incoming=["B"]),
+    ]
+    needs = view(*chain)
+    first = filter_by_tree(needs, "A", ["links"], "outgoing", None)
+    assert list(first) == ["A", "B", "C"]
+    assert list(filter_by_tree(needs, "A", ["links"], "outgoing", None)) == list(first)
+    assert needs._indexes.links._reachable == {
+        (0, ("links",), "outgoing", None): (0, 1, 2)
+    }
+    assert list(
+        filter_by_tree(needs.filter_ids(["A", "C"]), "A", ["links"], "outgoing", None)
+    ) == ["A"]
+
+
 def test_walk_terminates_on_a_cycle():
     """A need already reached is not walked again, so a cycle cannot loop forever."""
     a = need("A", links=["B"], incoming=["C"])
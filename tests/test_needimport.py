@@ -539,3 +539,55 @@ def test_needimport_registers_dependency(test_app):
     assert any("needs.json" in str(dep) for dep in deps), (
         f"needs.json not found in dependencies: {deps}"
     )
+
+
+def test_import_source_cache(tmp_path, monkeypatch):
+    """Import files are parsed once per build, and shared between processes via the cache directory."""
+    from sphinx_needs.directives import needimport
+
+    needs_file = tmp_path / "needs.json"
+    cache_dir = tmp_path / "cache"
+    needs = {
+        "A": {"id": "A", "title": "Ä"},
+        "B": {"id": "B", "title": 1},
+        "C": {"id": "C", "title": "C"},
+    }
+    needs_file.write_text(
+        json.dumps({"current_version": "1", "versions": {"1": {"needs": needs}}})
+    )
+    monkeypatch.setattr(needimport, "_import_sources", {})
+
+    source = needimport._load_import_file(str(needs_file), cache_dir)
+    assert needimport._load_import_file(str(needs_file), cache_dir) is source
+    assert source.data == {"current_version": "1", "versions": {"1": {"needs": 3}}}
+    assert dict(source.iter_needs("1")) == needs
+    assert list(source.iter_needs("1", ["C", "X", "A", "C"])) == [
+        ("C", needs["C"]),
+        ("A", needs["A"]),
+    ]
+    assert list(source.iter_needs("2")) == []
+    assert source.errors == [
+        (None, None, '"project" is a required property -> '),
+        ("1", "B", '1 is not of type "string" -> versions.1.needs.B.title'),
+    ]
+
+    # another process reads the parsed file from the cache directory
+    monkeypatch.setattr(needimport, "_import_sources", {})
+    monkeypatch.setattr(needimport, "_DECODED_LIMIT", 0)
+    monkeypatch.setattr(needimport, "_parse_import_file", None)
+    cached = needimport._load_import_file(str(needs_file), cache_dir)
+    assert cached is not source
+    assert cached.errors == source.errors
+    assert list(cached.iter_needs("1", ["B"])) == [("B", needs["B"])]
+    assert dict(cached.iter_needs("1")) == needs
+    assert cached.versions["1"].decoded is None
+    monkeypatch.undo()
+
+    # a modified file is parsed again, and replaces the previous cache files
+    needs_file.write_text(
+        json.dumps({"current_version": "1", "versions": {"1": {"needs": {}}}})
+    )
+    modified = needimport._load_import_file(str(needs_file), cache_dir)
+    assert modified.data["versions"] == {"1": {"needs": 0}}
+    assert list(modified.iter_needs("1")) == []
+    assert len(list(cache_dir.iterdir())) == 2
@@ -125,3 +125,125 @@ def test_needs_warnings_return_status_code(test_app):
     assert "WARNING: type_match: failed" in warnings
     assert "failed needs: 1 (TC_001)" in warnings
     assert "used filter: my_custom_warning_check" in warnings
+
+
+def test_needs_warnings_evaluated_together(make_app, tmp_path, monkeypatch):
+    """Warnings answered by the need indexes, and those needing python evaluation,
+    give the same results, in the order of the warnings, and are measured per warning."""
+    import json
+
+    from sphinx_needs import debug
+
+    monkeypatch.setattr(debug, "EXECUTE_TIME_MEASUREMENTS", False)
+    monkeypatch.setattr(debug, "TIME_MEASUREMENTS", {})
+    tmp_path.joinpath("conf.py").write_text(
+        """\
+extensions = ["sphinx_needs"]
+needs_debug_measurement = True
+needs_warnings_always_warn = True
+
+def is_open(need, log):
+    return need["status"] == "open"
+
+def log_needs(need, log):
+    log.warning(f"checking {need['id']}")
+    return False
+
+needs_warnings = {
+    "indexed": "status == 'open'",
+    "logging": log_needs,
+    "partly_indexed": "type == 'spec' and len(links) == 0",
+    "evaluated": "id.startswith('SPEC')",
+    "invalid": "len(unknown) == 0",
+    "function": is_open,
+}
+"""
+    )
+    tmp_path.joinpath("index.rst").write_text(
+        """\
+Index
+=====
+
+.. req:: Requirement
+   :id: REQ_1
+   :status: open
+
+.. spec:: Linked
+   :id: SPEC_1
+   :links: REQ_1
+
+.. spec:: Unlinked
+   :id: SPEC_2
+   :status: open
+"""
+    )
+    app = make_app(buildername="html", srcdir=tmp_path, freshenv=True)
+    app.build()
+
+    warnings = strip_colors(app._warning.getvalue()).splitlines()
+    assert [w for w in warnings if "WARNING" in w and "config.cache" not in w] == [
+        "WARNING: indexed: failed",
+        "WARNING: checking REQ_1",
+        "WARNING: checking SPEC_1",
+        "WARNING: checking SPEC_2",
+        "WARNING: partly_indexed: failed",
+        "WARNING: evaluated: failed",
+        "WARNING: Filter 'len(unknown) == 0' not valid. Error: name 'unknown' is not defined. (from warning filter 'invalid') [needs.filter]",
+        "WARNING: function: failed",
+    ]
+    assert [w for w in warnings if "failed needs" in w] == [
+        "\t\tfailed needs: 2 (REQ_1, SPEC_2)",
+        "\t\tfailed needs: 1 (SPEC_2)",
+        "\t\tfailed needs: 2 (SPEC_1, SPEC_2)",
+        "\t\tfailed needs: 2 (REQ_1, SPEC_2)",
+    ]
+
+    measurements = json.loads(Path(app.outdir, "debug_measurement.json").read_text())
+    assert {
+        value["name"]: value["doc"]
+        for value in measurements["measurements"].values()
+        if value["category"] == "warnings"
+    } == {
+        "indexed": "status == 'open'",
+        "logging": "log_needs",
+        "partly_indexed": "type == 'spec' and len(links) == 0",
+        "evaluated": "id.startswith('SPEC')",
+        "invalid": "len(unknown) == 0",
+        "function": "is_open",
+    }
+
+
+def test_needs_warnings_do_not_share_names(make_app, tmp_path):
+    """Names bound by the filter of one warning are not seen by the filters after it."""
+    tmp_path.joinpath("conf.py").write_text(
+        """\
+extensions = ["sphinx_needs"]
+needs_warnings_always_warn = True
+
+needs_warnings = {
+    "binding": "(status := 'closed').startswith('open')",
+    "reading": "status.startswith('closed')",
+}
+"""
+    )
+    tmp_path.joinpath("index.rst").write_text(
+        """\
+Index
+=====
+
+.. req:: Open
+   :id: REQ_1
+   :status: open
+
+.. req:: Closed
+   :id: REQ_2
+   :status: closed
+"""
+    )
+    app = make_app(buildername="html", srcdir=tmp_path, freshenv=True)
+    app.build()
+
+    warnings = strip_colors(app._warning.getvalue()).splitlines()
+    assert [w for w in warnings if "failed needs" in w] == [
+        "\t\tfailed needs: 1 (REQ_2)",
+    ]
@@ -1,5 +1,12 @@
+import json
+import tracemalloc
+from pathlib import Path
+
 import pytest
 
+from sphinx_needs.data import SphinxNeedsData
+from sphinx_needs.needsfile import NeedsFileReader, _JsonStream, iter_sorted_json
+
 
 @pytest.mark.parametrize(
     "test_app",
@@ -9,3 +16,116 @@ import pytest
 def test_doc_build_html(test_app):
     app = test_app
     app.build()
+
+    # the streamed output is identical to dumping the whole structure at once
+    text = Path(app.outdir, "needs.json").read_text()
+    assert text == json.dumps(json.loads(text), sort_keys=True)
+
+
+def test_iter_sorted_json():
+    value = {
+        "b": {"needs": {"Z": {"y": 1, "x": [2, {"d": None, "c": "ü"}]}, "A": {}}},
+        "a": [1.5, True, "\n"],
+        "": {},
+    }
+    assert "".join(iter_sorted_json(value, dict)) == json.dumps(value, sort_keys=True)
+
+
+@pytest.mark.parametrize(
+    "test_app",
+    [{"buildername": "html", "srcdir": "doc_test/doc_needsfile", "no_plantuml": True}],
+    indirect=True,
+)
+def test_iter_sorted_json_needs(test_app):
+    app = test_app
+    app.build()
+    needs = SphinxNeedsData(app.env).get_needs_view()
+    value = {"versions": {"1.0": {"needs": dict(needs)}}}
+    expected = {"versions": {"1.0": {"needs": {k: dict(v) for k, v in needs.items()}}}}
+    assert "".join(iter_sorted_json(value, dict)) == json.dumps(
+        expected, sort_keys=True
+    )
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1 << 20])
+def test_needs_file_reader(tmp_path, monkeypatch, chunk_size):
+    monkeypatch.setattr(_JsonStream, "chunk_size", chunk_size)
+    data = {
+        "current_version": "1.0",
+        "project": "test",
+        "versions": {
+            "1.0": {
+                "needs": {
+                    "REQ_1": {"id": "REQ_1", "title": 'ü \\" {', "prio": 12345},
+                    "REQ_2": {"id": "REQ_2", "tags": [], "score": -1.5e3},
+                },
+                "needs_amount": 2,
+                "needs_schema": {"properties": {"status": {"default": None}}},
+            },
+            "0.9": {"needs": {}, "created": "x"},
+        },
+        "created": "today",
+    }
+    path = tmp_path / "needs.json"
+    path.write_text(json.dumps(data, indent=1))
+
+    reader = NeedsFileReader(path)
+    header, versions = reader.read_summary()
+    assert header == {"current_version": "1.0", "project": "test", "created": "today"}
+    assert versions == {
+        "1.0": {
+            "needs": 2,
+            "needs_amount": 2,
+            "needs_schema": data["versions"]["1.0"]["needs_schema"],
+        },
+        "0.9": {"needs": 0, "created": "x"},
+    }
+    assert dict(reader.iter_needs("1.0")) == data["versions"]["1.0"]["needs"]
+    assert list(reader.iter_needs("0.9")) == []
+    assert list(reader.iter_needs("unknown")) == []
+
+
+def test_needs_file_reader_skips_without_decoding(tmp_path, monkeypatch):
+    """Versions and values that are skipped are never held in memory at once."""
+    monkeypatch.setattr(_JsonStream, "chunk_size", 1024)
+    need = {"id": "X", "title": 'a "quoted" \\ {[ title', "tags": ["x"] * 50}
+    data = {
+        "created": "x" * 500_000,
+        "versions": {
+            "old": {"needs": {f"OLD_{i}": dict(need) for i in range(5_000)}},
+            "new": {"needs": {"NEW_1": need}},
+        },
+    }
+    path = tmp_path / "needs.json"
+    path.write_text(json.dumps(data))
+    assert path.stat().st_size > 2_000_000
+
+    tracemalloc.start()
+    try:
+        needs = dict(NeedsFileReader(path).iter_needs("new"))
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert needs == {"NEW_1": need}
+    assert peak < 100_000
+
+
+@pytest.mark.parametrize("content", ['{"a": "\\', '{"a": [{"b": "]"}', '{"a": 1'])
+def test_json_stream_skip_unterminated(tmp_path, monkeypatch, content):
+    monkeypatch.setattr(_JsonStream, "chunk_size", 1)
+    path = tmp_path / "needs.json"
+    path.write_text(content)
+    with path.open() as f, pytest.raises(json.JSONDecodeError):
+        stream = _JsonStream(f)
+        for _ in stream.iter_object():
+            stream.skip()
+
+
+@pytest.mark.parametrize(
+    "content", ["", "[]", '{"versions": {"1.0": {"needs": {"A": {}', '{"a" 1}']
+)
+def test_needs_file_reader_invalid(tmp_path, content):
+    path = tmp_path / "needs.json"
+    path.write_text(content)
+    with pytest.raises(json.JSONDecodeError):
+        NeedsFileReader(path).read_summary()
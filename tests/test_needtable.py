@@ -1,3 +1,5 @@
+import json
+import re
 from pathlib import Path
 
 import pytest
@@ -200,3 +202,67 @@ def test_doc_needtable_titles(test_app):
     assert '<th class="head"><p>To this need123</p></th>' in html
     assert '<th class="head"><p>Special Characters!</p></th>' in html
     assert '<td class="needs_special-chars!"><p>special-chars value</p></td>' in html
+
+
+def _data_tables(app, docname):
+    """The tables of a page, and the rows loaded by each ``:render: data`` table."""
+    html = Path(app.outdir, f"{docname}.html").read_text()
+    tables = re.findall(r'<table class="[^"]*NEEDS_.*?</table>', html, re.DOTALL)
+    rows = []
+    for table in tables:
+        if (match := re.search(r"NEEDS_DATA_(\w+)", table)) is not None:
+            path = Path(app.outdir, "_static", "sphinx-needs", "needtables")
+            rows.append(
+                json.loads((path / f"{match.group(1)}.json").read_text())["rows"]
+            )
+    return tables, rows
+
+
+def _data_files(app):
+    return sorted(
+        path.name
+        for path in Path(app.outdir, "_static", "sphinx-needs", "needtables").iterdir()
+    )
+
+
+@pytest.mark.parametrize(
+    "test_app",
+    [{"buildername": "html", "srcdir": "doc_test/doc_needtable_render"}],
+    indirect=True,
+)
+def test_doc_needtable_render_data(test_app, rebuild_app):
+    app = test_app
+    app.build()
+    tables, rows = _data_tables(app, "index")
+    assert len(tables) == 2
+
+    # the datatables table only contains its header
+    assert "NEEDS_DATA " in tables[0]
+    assert "RENDER_1" not in tables[0]
+    assert [row["classes"] for row in rows[0]] == ["need", "need"]
+    cells = rows[0][1]["cells"]
+    assert len(cells) == 3
+    assert 'href="#RENDER_2"' in cells[0]
+    assert "Also render as data" in cells[1]
+    assert 'href="#RENDER_1"' in cells[2]
+
+    # a plain table has nothing to load the rows, so they are written into the page
+    assert "NEEDS_DATA" not in tables[1]
+    assert "RENDER_2" in tables[1]
+
+    # tables with ids, that only differ in characters not allowed in file names,
+    # are written to different files
+    _, nested_rows = _data_tables(app, "a/b")
+    _, flat_rows = _data_tables(app, "a_b")
+    assert "#RENDER_1" in nested_rows[0][0]["cells"][0]
+    assert "#RENDER_2" in flat_rows[0][0]["cells"][0]
+    assert len(_data_files(app)) == 3
+
+    # the files of removed tables, and of removed documents, are deleted
+    index = Path(app.srcdir, "index.rst")
+    index.write_text(index.read_text().replace(":render: data", ":render: nodes"))
+    Path(app.srcdir, "a_b.rst").unlink()
+    index.write_text(index.read_text().replace("   a_b\n", ""))
+    app = rebuild_app()
+    assert _data_tables(app, "index")[1] == []
+    assert len(_data_files(app)) == 1
@@ -5,6 +5,7 @@ import pytest
 from syrupy.filters import props
 
 from sphinx_needs.data import SphinxNeedsData
+from sphinx_needs.directives import needuml
 
 
 @pytest.mark.parametrize(
@@ -293,3 +294,49 @@ def test_needuml_jinja_func_ref(test_app, snapshot):
         ["sphinx-build", "-M", "html", srcdir, out_dir], capture_output=True
     )
     assert out.returncode == 0
+
+
+def test_needuml_expansions_reused(make_app, tmp_path, monkeypatch):
+    """Calls of ``uml()`` with the same arguments are only expanded once per build,
+    and later calls re-use the expansion, including the needs it processed."""
+    srcdir = tmp_path / "src"
+    srcdir.mkdir()
+    srcdir.joinpath("conf.py").write_text(
+        'extensions = ["sphinx_needs", "sphinxcontrib.plantuml"]\n'
+        'plantuml_output_format = "none"\n'
+    )
+    srcdir.joinpath("index.rst").write_text(
+        "Index\n=====\n\n"
+        ".. req:: Requirement\n   :id: REQ_1\n\n"
+        ".. spec:: Specification\n   :id: SPEC_1\n\n"
+        '   .. needarch::\n\n      {{ flow("REQ_1") }}\n      SPEC_1 --> REQ_1\n\n'
+        '.. needuml::\n\n   {{ uml("SPEC_1") }}\n\n'
+        '.. needuml::\n\n   {{ uml("SPEC_1") }}\n\n'
+        '.. needuml::\n\n   {{ uml("SPEC_1") }}\n   {{ uml("SPEC_1") }}\n'
+    )
+
+    expanded = []
+    jinja2uml = needuml.jinja2uml
+
+    def _counted(**kwargs):
+        expanded.append(kwargs["parent_need_id"])
+        return jinja2uml(**kwargs)
+
+    monkeypatch.setattr(needuml, "jinja2uml", _counted)
+
+    app = make_app(buildername="html", srcdir=srcdir, freshenv=True)
+    try:
+        app.build()
+        umls = SphinxNeedsData(app.env).get_or_create_umls()
+        contents = [uml["content_calculated"] for uml in umls.values()]
+    finally:
+        app.cleanup()
+
+    # the needarch and the three needuml directives, but SPEC_1 only once
+    assert sorted(expanded, key=str) == [None, None, None, "SPEC_1", "SPEC_1"]
+    assert len(contents) == 4
+    assert contents[1] == contents[2]
+    assert contents[1].count(" as REQ_1 ") == 1
+    assert contents[1].count("SPEC_1 --> REQ_1") == 1
+    # the second call in the same diagram is skipped, as SPEC_1 is processed
+    assert contents[3].count("SPEC_1 --> REQ_1") == 1
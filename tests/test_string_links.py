@@ -735,6 +735,76 @@ def test_list_field_agrees_between_meta_and_needtable(
         assert html.count(href) == 2, html
 
 
+TWO_TABLES_INDEX = """\
+String links
+============
+
+.. req:: A need
+   :id: SLINK_1
+   :tickets: AB-1, AB-2
+
+.. req:: Another need
+   :id: SLINK_2
+   :tickets: AB-3
+   :links: SLINK_1
+
+.. needtable::
+   :columns: id;tickets;links;links_back
+   :style: table
+
+.. needtable::
+   :columns: id;tickets
+   :style: table
+"""
+
+
+def test_needtables_share_one_render_context(
+    make_app: Any, sphinx_test_tempdir: Any, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """The string links, link fields and relative uris are collected once per document,
+    not once per cell, and the cells render the same as before."""
+    from sphinx_needs.utils import NeedtableRenderContext
+
+    created: list[str] = []
+    create = NeedtableRenderContext.create
+
+    def counted(app: Any, fromdocname: str, all_needs: Any) -> NeedtableRenderContext:
+        created.append(fromdocname)
+        return create(app, fromdocname, all_needs)
+
+    monkeypatch.setattr(NeedtableRenderContext, "create", counted)
+    app = build(
+        make_app,
+        sphinx_test_tempdir,
+        {"t": {**GOOD_LINK, "options": ["tickets"]}},
+        index=TWO_TABLES_INDEX,
+    )
+    assert warnings_of(app) == "", warnings_of(app)
+    assert created == ["index"]
+    html = need_html(app)
+    for number in ("AB-1", "AB-2", "AB-3"):
+        # once in the need's meta area, once in each needtable
+        assert (
+            html.count(f'href="https://tracker.example.com/{number}">T:{number}</a>')
+            == 3
+        ), html
+    assert 'href="#SLINK_1"' in html, html
+
+    # a single cell, rendered without a shared context, is the same
+    from sphinx_needs.data import SphinxNeedsData
+    from sphinx_needs.utils import render_cell, row_col_maker
+
+    needs = SphinxNeedsData(app.env).get_needs_view()
+    context = create(app, "index", needs)
+    for key in ("tickets", "links"):
+        assert (
+            row_col_maker(
+                app, "index", needs, needs["SLINK_2"], key, ref_lookup=True
+            ).pformat()
+            == render_cell(context, needs["SLINK_2"], key, ref_lookup=True).pformat()
+        )
+
+
 EMPTY_ELEM_INDEX = """\
 String links
 ============
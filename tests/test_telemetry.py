@@ -0,0 +1,97 @@
+"""Tests for the per-phase build telemetry report."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from sphinx_needs import telemetry
+from sphinx_needs.data import SphinxNeedsData
+
+
+@pytest.fixture
+def reset_telemetry():
+    """The telemetry is module state, so disable it again for other tests."""
+    yield
+    telemetry.reset(False)
+
+
+@pytest.mark.parametrize(
+    "test_app",
+    [
+        {
+            "buildername": "html",
+            "srcdir": "doc_test/doc_needtable",
+            "confoverrides": {
+                "needs_telemetry": True,
+                "needs_telemetry_tracemalloc": True,
+                "needs_build_json": True,
+            },
+        }
+    ],
+    indirect=True,
+)
+def test_telemetry_report(test_app, reset_telemetry):
+    app = test_app
+    app.build()
+
+    report = json.loads(
+        Path(str(app.outdir), telemetry.REPORT_FILENAME).read_text("utf8")
+    )
+    assert report["format"] == 1
+    assert report["builder"] == "html"
+    assert report["trace_memory"] is True
+    phases = report["phases"]
+    for name in (
+        "read",
+        "external_needs",
+        "extend",
+        "dynamic_functions",
+        "links",
+        "constraints",
+        "resolve_need",
+        "resolve_needtable",
+        "needs_json",
+    ):
+        assert phases[name]["runs"] >= 1, name
+        assert phases[name]["wall_time"] >= 0
+        assert phases[name]["traced_peak"] >= 0
+    needs_count = len(SphinxNeedsData(app.env).get_needs_view())
+    assert phases["links"]["items"] == needs_count
+    assert phases["resolve_need"]["items"] == needs_count
+    assert phases["read"]["items"] == len(app.env.found_docs)
+
+
+def test_phases_nest():
+    telemetry.reset(True)
+    try:
+        with telemetry.phase("outer", 2):
+            with telemetry.phase("inner"):
+                telemetry.count_items(3)
+            with telemetry.phase("inner"):
+                pass
+            telemetry.count_items(1)
+        phases = telemetry.get_phases()
+        assert phases["outer"].runs == 1
+        assert phases["outer"].items == 3
+        assert phases["inner"].runs == 2
+        assert phases["inner"].items == 3
+        assert phases["outer"].wall_time >= phases["inner"].wall_time
+        assert phases["inner"].traced_peak is None
+    finally:
+        telemetry.reset(False)
+
+
+def test_peak_rss_delta_is_the_highest_of_the_runs(monkeypatch):
+    peaks = iter([100, 150, 150, 170])
+    monkeypatch.setattr(telemetry, "_peak_rss", lambda: next(peaks))
+    telemetry.reset(True)
+    try:
+        for _ in range(2):
+            with telemetry.phase("phase"):
+                pass
+        assert telemetry.get_phases()["phase"].peak_rss_delta == 50
+    finally:
+        telemetry.reset(False)
@@ -10,13 +10,16 @@ import pytest
 from sphinx_needs.exceptions import NeedsInvalidFilter
 from sphinx_needs.filter_common import (
     filter_single_need,
+    filter_single_needs,
 )
 from sphinx_needs.need_item import NeedItem, NeedsContent
 from sphinx_needs.ubquery import (
     _expr_to_predicate,
     _get_field,
+    try_build_batch_predicate,
     try_build_simple_predicate,
 )
+from sphinx_needs.views import _Columns
 
 
 def _make_need(**core_overrides: object) -> NeedItem:
@@ -243,6 +246,30 @@ class TestFilterSingleNeedFastPath:
                 'nonexistent == "value"',
             )
 
+    @pytest.mark.parametrize(
+        "filter_string",
+        [
+            pytest.param('status == "open"', id="simple"),
+            pytest.param('nonexistent == "value"', id="simple-missing-field"),
+            pytest.param("[status][0]", id="eval-not-bool"),
+            pytest.param('[x for x in tags if x == "safety"] != []', id="eval"),
+            pytest.param("status ==", id="syntax-error"),
+        ],
+    )
+    def test_filter_single_needs(self, filter_string: str) -> None:
+        """Filtering several needs at once gives the same results as one at a time."""
+        needs = [self.need, _make_need(id="REQ_002", status="closed")]
+        expected: list[bool | str] = []
+        for need in needs:
+            try:
+                expected.append(filter_single_need(need, self.config, filter_string))
+            except NeedsInvalidFilter as e:
+                expected.append(str(e))
+        results = filter_single_needs(needs, self.config, filter_string)
+        assert [
+            str(r) if isinstance(r, NeedsInvalidFilter) else r for r in results
+        ] == expected
+
 
 # --- context-only name blocklist ---
 
@@ -449,3 +476,99 @@ class TestVariantDataFastPath:
         config.variant_data_proxy = VariantDataProxy(config.variant_data)
         result = filter_single_need(self.need, config, 'var.cpu == "arm"')
         assert result is True
+
+
+# --- batch predicates on columns ---
+
+
+def _batch_needs() -> list[NeedItem]:
+    return [
+        _make_need(),
+        _make_need(id="REQ_002", status="closed", tags=["safety"]),
+        _make_need(id="SPEC_001", type="spec", status="", tags=[]),
+        _make_need(id="SPEC_002", type="spec", status=None, tags=["important"]),
+        _make_need(id="REQ_003", status="open", tags=["important", "safety"]),
+    ]
+
+
+@pytest.mark.parametrize(
+    ("filter_string", "ctx"),
+    [
+        pytest.param('status == "open"', None, id="eq"),
+        pytest.param('"open" != status', None, id="reversed-ne"),
+        pytest.param('id >= "REQ_002"', None, id="ge"),
+        pytest.param('type in ["spec", "impl"]', None, id="field-in-list"),
+        pytest.param('"safety" not in tags', None, id="value-not-in-field"),
+        pytest.param("status", None, id="bare-name"),
+        pytest.param('not status == "closed"', None, id="not-expr"),
+        pytest.param('type == "spec" or "safety" in tags', None, id="or"),
+        pytest.param('type == "requirement" and status == "open"', None, id="and"),
+        pytest.param('search("^SPEC", id)', None, id="search"),
+        pytest.param('search("x", status)', None, id="search-error-on-none"),
+        pytest.param('type == "spec" and search("x", status)', None, id="and-error"),
+        pytest.param('search("x", status) or type == "spec"', None, id="or-error"),
+        pytest.param('not search("x", status)', None, id="not-error"),
+        pytest.param('unknown == "x"', None, id="missing-field"),
+        pytest.param('status == "override"', {"status": "override"}, id="shadowed"),
+        pytest.param('project == "alpha"', {"project": "alpha"}, id="fallback-only"),
+    ],
+)
+def test_batch_predicate_matches_simple_predicate(
+    filter_string: str, ctx: dict[str, object] | None
+) -> None:
+    needs = _batch_needs()
+    pred = try_build_simple_predicate(filter_string)
+    batch_pred = try_build_batch_predicate(filter_string)
+    assert pred is not None
+    assert batch_pred is not None
+
+    expected_matched = []
+    expected_errors = {}
+    for row, need in enumerate(needs):
+        try:
+            if pred(need, ctx):
+                expected_matched.append(row)
+        except Exception as e:
+            expected_errors[row] = str(e)
+
+    columns = _Columns({n["id"]: n for n in needs}, [(n["id"], None) for n in needs])
+    rows = list(reversed(range(len(needs))))
+    matched, errors = batch_pred(columns.column, rows, ctx)
+    assert matched == [r for r in rows if r in expected_matched]
+    assert {r: str(e) for r, e in errors.items()} == expected_errors
+
+
+def test_batch_predicate_evaluates_once_per_value() -> None:
+    calls = []
+    needs = _batch_needs()
+    columns = _Columns({n["id"]: n for n in needs}, [(n["id"], None) for n in needs])
+    batch_pred = try_build_batch_predicate('status == "open"')
+    assert batch_pred is not None
+
+    def _column(name: str):
+        calls.append(name)
+        return columns.column(name)
+
+    matched, errors = batch_pred(_column, list(range(len(needs))), None)
+    assert matched == [0, 4]
+    assert not errors
+    assert calls == ["status"]
+    assert columns.column("status").values == ["open", "closed", "", None]
+
+
+def test_batch_predicate_non_bool_raises() -> None:
+    batch_pred = try_build_batch_predicate("flag")
+    assert batch_pred is not None
+    # bare names are converted to a boolean
+    needs = _batch_needs()
+    columns = _Columns({n["id"]: n for n in needs}, [(n["id"], None) for n in needs])
+    assert batch_pred(columns.column, [0], {"flag": "yes"}) == ([0], {})
+
+    class _NotBool:
+        def __eq__(self, other: object) -> object:
+            return "not a bool"
+
+    batch_pred = try_build_batch_predicate('flag == "x"')
+    assert batch_pred is not None
+    with pytest.raises(NeedsInvalidFilter, match="did not evaluate to a boolean"):
+        batch_pred(columns.column, [0], {"flag": _NotBool()})